@@ -1,4 +1,5 @@
 from typing import Iterable
+from weakref import WeakKeyDictionary
 
 import pandas as pd
 
@@ -6,8 +7,10 @@ from gameObjects.campaign import Campaign
 from gameObjects.faction import Faction
 from gameObjects.gameObjectRepository import GameObjectRepository
 from gameObjects.planet import Planet
+from gameObjects.planetTable import planetColumns
 
-from util import getObject
+# Starting forces columns the planet owners are read from
+OWNER_COLUMNS = ("Planet", "Era", "Owner")
 
 
 class DisplayHelpers:
@@ -16,51 +19,70 @@ class DisplayHelpers:
     def __init__(self, repository: GameObjectRepository, campaigns: list[Campaign]):
         self.repository = repository
         self.campaigns = campaigns
+        # Owner names by lower case planet name, built once per campaign and era and
+        # rebuilt when the campaign gets other starting forces or forgetOwners is called
+        self.__ownerIndexes: WeakKeyDictionary = WeakKeyDictionary()
 
-    def getPlanetOwners(self, index: int, planetList: set[Planet]) -> list[Faction]:
-        """Gets a list of owners of planets in the GC selected by index"""
+    def getPlanetOwners(self, index: int, planetList: Iterable[Planet]) -> list[Faction]:
+        """Gets a list of owners of planets in the GC selected by index, in the order of
+        planetList"""
+        campaign = self.campaigns[index]
+        ownerNames = self.__getOwnerIndex(campaign, campaign.era)
+
+        factions = dict()
         owners = []
         for planet in planetList:
-            owners.append(
-                self.__getPlanetOwner(index, planet.name, self.campaigns[index].era)
-            )
+            name = ownerNames.get(planet.name.lower())
+            if name not in factions:
+                factions[name] = self.__getFaction(name)
+            owners.append(factions[name])
 
         return owners
 
-    def __getPlanetOwner(self, index: int, planet: str, era: int) -> Faction:
-        """Gets the owner of a planet in the GC selected by index and era"""
-
-        sf = self.campaigns[index].startingForces
-        if sf is None:
-            return self.__getNeutralFaction()
-
-        try:
-            planet_info = sf.loc[(sf.Planet.str.lower() == planet.lower()) & (sf.Era == era)]
-        except KeyError:
-            return self.__getNeutralFaction()
-
-        try:
-            planet_info = sf.loc[(sf.Planet.str.lower() == planet.lower())]
-        except KeyError:
-            return self.__getNeutralFaction()
-
-        try:
-            faction_name = planet_info.values[0][2]
-        except IndexError:
-            return self.__getNeutralFaction()
-
-        faction = getObject(faction_name, self.repository.factions)
+    def forgetOwners(self, campaign: Campaign) -> None:
+        """Drops the owners read from a campaign's starting forces, after they were edited.
+        Campaigns sharing the same starting forces frame are dropped as well"""
+        sf = campaign.startingForces
+        for other, cached in list(self.__ownerIndexes.items()):
+            if other is campaign or cached[0] is sf:
+                del self.__ownerIndexes[other]
+
+    def __getOwnerIndex(self, campaign: Campaign, era: int) -> dict:
+        """Returns the owner name of each planet in the campaign's starting forces. The
+        first row of a planet in the given era is used, or its first row of any era"""
+        sf = campaign.startingForces
+        cached = self.__ownerIndexes.get(campaign)
+        if cached is not None and cached[0] is sf and cached[1] == era:
+            return cached[2]
+
+        ownerNames = dict()
+        if sf is not None and set(OWNER_COLUMNS).issubset(sf.columns):
+            forces = pd.DataFrame(
+                {"Planet": sf.Planet.astype(str).str.lower(), "Owner": sf.Owner}
+            )
+            inEra = (sf.Era == era).to_numpy()
+            # Rows of the era go first, so keeping the first row of each planet prefers them
+            forces = pd.concat([forces[inEra], forces[~inEra]])
+            forces = forces.drop_duplicates("Planet")
+            ownerNames = dict(zip(forces.Planet, forces.Owner))
+
+        self.__ownerIndexes[campaign] = (sf, era, ownerNames)
+        return ownerNames
+
+    def __getFaction(self, name) -> Faction:
+        """Gets a faction by owner name, or the Neutral faction if there is none"""
+        if isinstance(name, str):
+            faction = self.repository.findFaction(name)
+            if faction is not None:
+                return faction
 
-        if faction is not None:
-            return faction
-        else:
-            return self.__getNeutralFaction()
+        return self.__getNeutralFaction()
 
     def __getNeutralFaction(self) -> Faction:
         """Gets the Neutral faction entry, if possible"""
-        for faction in self.repository.factions:
-            if faction.name == "Neutral":
-                return faction
+        faction = self.repository.findFaction("Neutral")
+        if faction is not None:
+            return faction
 
         raise RuntimeError("Error! Neutral faction not found!")
 
@@ -68,12 +90,10 @@ class DisplayHelpers:
         self, planets: Iterable[Planet], planet_owners: Iterable[Faction]
     ) -> dict:
         """Calculates per-faction planet totals and income totals."""
-        incomes = []
         factions = []
         owners = list(planet_owners)
 
-        for p in planets:
-            incomes.append(p.income)
+        (incomes,) = planetColumns(planets, "income")
         for f in owners:
             if f:
                 factions.append(f.name)
@@ -0,0 +1,21 @@
+"""Colors of the galaxy map, shared by the editor plot and the headless map renderer"""
+
+from matplotlib.colors import to_rgba
+
+BACKGROUND_PLANET_COLOR = "grey"
+BACKGROUND_PLANET_ALPHA = 0.1
+TRADE_ROUTE_COLOR = (0.0, 0.0, 0.0, 0.4)
+TRADE_ROUTE_HIGHLIGHT_COLOR = (1.0, 0.84, 0.0, 0.9)
+TRADE_ROUTE_TRACE_COLOR = "y"
+UNOWNED_COLOR = to_rgba("grey")
+NO_FACTION_COLOR = (0.0, 0.0, 0.0, 1.0)
+OUTLINE_COLOR = (0.0, 0.0, 0.0, 1.0)
+
+
+def planetColors(owner) -> tuple:
+    """Returns the face and edge color of a campaign planet owned by owner, which may be None"""
+    if owner is None:
+        return UNOWNED_COLOR, UNOWNED_COLOR
+    if owner.color:
+        return to_rgba(tuple(owner.color)), OUTLINE_COLOR
+    return NO_FACTION_COLOR, OUTLINE_COLOR
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import pickle
+from typing import List, Optional
+
+from gameObjects.gameObjectRepository import GameObjectRepository
+
+# Bump whenever the pickled layout of the game objects changes
+CACHE_VERSION = 5
+
+
+def collectInputFiles(dataFolders: list, extraFiles: list = None) -> List[str]:
+    """Returns every XML file below the XML folder of each data folder,
+    followed by any extraFiles (e.g. the starting forces library) that exist"""
+    inputFiles = []
+    for folder in dataFolders:
+        for dirPath, dirNames, fileNames in os.walk(os.path.join(folder, "XML")):
+            dirNames.sort()
+            for fileName in sorted(fileNames):
+                if fileName.lower().endswith(".xml"):
+                    inputFiles.append(os.path.join(dirPath, fileName))
+
+    for extraFile in extraFiles or []:
+        if extraFile and os.path.isfile(extraFile):
+            inputFiles.append(extraFile)
+
+    return inputFiles
+
+
+def fingerprintFiles(filePaths: list, hashContents: bool = False) -> dict:
+    """Returns a dictionary of path -> (size, mtime[, content hash]) for the given files"""
+    fingerprints = {}
+    for filePath in filePaths:
+        try:
+            stat = os.stat(filePath)
+        except OSError:
+            continue
+
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        if hashContents:
+            with open(filePath, "rb") as file:
+                fingerprint += (hashlib.sha1(file.read()).hexdigest(),)
+        fingerprints[filePath] = fingerprint
+
+    return fingerprints
+
+
+class RepositoryCache:
+    """Stores GameObjectRepository snapshots on disk, keyed by the fingerprints
+    of every input file they were built from"""
+
+    def __init__(self, cacheFolder: str, hashContents: bool = False):
+        self.__cacheFolder: str = cacheFolder
+        self.__hashContents: bool = hashContents
+
+    @staticmethod
+    def fromConfig(config) -> Optional["RepositoryCache"]:
+        """Returns the cache described by the config, or None if caching is disabled"""
+        if not config.repositoryCacheFolder:
+            return None
+        return RepositoryCache(
+            config.repositoryCacheFolder, config.repositoryCacheHashContents
+        )
+
+    def fingerprint(self, dataFolders: list, startingForcesLibraryURL: str) -> dict:
+        """Fingerprints all XML files in dataFolders and the starting forces library"""
+        inputFiles = collectInputFiles(dataFolders, [startingForcesLibraryURL])
+        return {
+            "version": CACHE_VERSION,
+            "dataFolders": list(dataFolders),
+            "startingForcesLibraryURL": startingForcesLibraryURL,
+            "files": fingerprintFiles(inputFiles, self.__hashContents),
+        }
+
+    def load(self, fingerprint: dict) -> Optional[GameObjectRepository]:
+        """Returns the cached repository if it was built from identical input files, otherwise None"""
+        cacheFile = self.__cacheFile(fingerprint)
+        if not os.path.isfile(cacheFile):
+            return None
+
+        try:
+            with open(cacheFile, "rb") as file:
+                cachedFingerprint, repository = pickle.load(file)
+        except (
+            OSError,
+            EOFError,
+            ValueError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+        ) as err:
+            print(f"Ignoring unreadable repository cache '{cacheFile}': {err}")
+            return None
+
+        if cachedFingerprint != fingerprint:
+            return None
+
+        return repository
+
+    def save(self, fingerprint: dict, repository: GameObjectRepository) -> None:
+        """Writes a repository snapshot for the given fingerprint"""
+        cacheFile = self.__cacheFile(fingerprint)
+        try:
+            os.makedirs(self.__cacheFolder, exist_ok=True)
+            with open(cacheFile + ".tmp", "wb") as file:
+                pickle.dump((fingerprint, repository), file, pickle.HIGHEST_PROTOCOL)
+            os.replace(cacheFile + ".tmp", cacheFile)
+        except (OSError, pickle.PicklingError) as err:
+            print(f"Failed to write repository cache '{cacheFile}': {err}")
+
+    def __cacheFile(self, fingerprint: dict) -> str:
+        """One cache file per combination of data folders and starting forces library"""
+        key = repr((fingerprint["dataFolders"], fingerprint["startingForcesLibraryURL"]))
+        return os.path.join(
+            self.__cacheFolder, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pickle"
+        )
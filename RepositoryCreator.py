@@ -1,26 +1,134 @@
 import os
+from typing import Dict, List, Optional, Set
+
+import lxml.etree as et
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from gameObjects.gameObjectRepository import GameObjectRepository
+from gameObjects.gameObjectRepository import GameObjectRepository, fileKey, nameKey
 from gameObjects.planet import Planet
+from gameObjects.planetTable import PlanetTable
 from gameObjects.traderoute import TradeRoute
 from gameObjects.campaign import Campaign
 from gameObjects.faction import Faction
 from gameObjects.startingForce import StartingForce
-from xmlTools.xmlreader import XMLReader
+from RepositoryCache import RepositoryCache
+from xmlTools.xmlreader import (
+    XMLReader,
+    extractFactionRecords,
+    extractPlanetRecords,
+    extractTradeRouteRecords,
+)
 from xmlTools.xmlstructure import XMLStructure
 
-from util import getObject
+# Kinds of input files recorded in the repository for incremental reloads
+PLANET_FILE = "planets"
+FACTION_FILE = "factions"
+TRADE_ROUTE_FILE = "tradeRoutes"
+CAMPAIGN_FILE = "campaigns"
+META_FILE = "metafile"
+STARTING_FORCES_FILE = "startingForces"
+
+# Files are reloaded in this order so trade routes can resolve planets added in the same batch
+RELOAD_ORDER = [
+    META_FILE,
+    PLANET_FILE,
+    FACTION_FILE,
+    TRADE_ROUTE_FILE,
+    CAMPAIGN_FILE,
+    STARTING_FORCES_FILE,
+]
+
+METAFILE_NAMES = [
+    "GameObjectFiles.XML",
+    "TradeRouteFiles.XML",
+    "FactionFiles.XML",
+    "CampaignFiles.XML",
+]
+
+PLANET_ATTRIBUTES = [
+    "variantOf",
+    "x",
+    "y",
+    "starbaseLevel",
+    "shipyardLevel",
+    "SupportsStructure",
+    "spaceStructureSlots",
+    "groundStructureSlots",
+    "income",
+]
+
+
+def expandReusedEras(startingForcesLibrary: pd.DataFrame) -> pd.DataFrame:
+    """Appends a copy of the reused era's rows for every era that sets ReuseEra.
+    A row starts a new era when its Era differs from the previous row's Era, and its
+    ReuseEra rows are looked up for the same planet. Rows copied into an era are reused
+    again by later eras that reuse it, so chains of ReuseEra resolve in a single pass"""
+    eras = startingForcesLibrary["Era"]
+    startsEra = eras.ne(eras.shift(fill_value=0)) & startingForcesLibrary["ReuseEra"].notna()
+    triggers = startingForcesLibrary[startsEra]
+
+    # (Planet, Era) -> row positions, and the blocks of rows copied into each (Planet, Era)
+    rowsByKey = startingForcesLibrary.groupby(["Planet", "Era"], sort=False).indices
+    copiedByKey: Dict[tuple, list] = dict()
+    noRows = np.empty(0, dtype=np.intp)
+
+    blocks = []
+    blockEras = []
+    for planet, era, reuseEra in zip(
+        triggers["Planet"], triggers["Era"], triggers["ReuseEra"]
+    ):
+        if pd.isna(planet):
+            continue
+
+        sources = [rowsByKey.get((planet, reuseEra), noRows)]
+        sources.extend(copiedByKey.get((planet, reuseEra), []))
+        block = np.concatenate(sources)
+        if len(block) == 0:
+            continue
+
+        blocks.append(block)
+        blockEras.append(era)
+        copiedByKey.setdefault((planet, era), []).append(block)
+
+    if not blocks:
+        return startingForcesLibrary
+
+    copies = startingForcesLibrary.iloc[np.concatenate(blocks)].copy()
+    copies["Era"] = np.repeat(
+        np.array(blockEras, dtype=eras.dtype), [len(block) for block in blocks]
+    )
+    return pd.concat([startingForcesLibrary, copies])
+
+
+class RepositoryChanges:
+    """Summary of the changes RepositoryCreator.reloadFiles made to the repository"""
+
+    def __init__(self):
+        self.kinds: Set[str] = set()
+        self.added: set = set()
+        self.updated: set = set()
+        self.removed: set = set()
+        self.fullReloadRequired: bool = False
+
+    def isEmpty(self) -> bool:
+        return not (self.kinds or self.fullReloadRequired)
 
 
 class RepositoryCreator:
     """Creates a Repository of GameObjects from input XMLs"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        parserWorkers: int = 0,
+        parserUseProcesses: bool = False,
+        cache: Optional[RepositoryCache] = None,
+    ):
         self.repository: GameObjectRepository = GameObjectRepository()
         self.__folder: str = ""
-        self.__xml: XMLReader = XMLReader()
+        self.__xml: XMLReader = XMLReader(parserWorkers, parserUseProcesses)
+        self.__cache: Optional[RepositoryCache] = cache
 
     def getNamesRootsFromXML(self, rootsList, tag: str) -> list:
         """Takes a list of XML roots and a tag to search for
@@ -37,6 +145,26 @@ class RepositoryCreator:
     def addPlanetsFromXML(self, planetRoots) -> None:
         """Takes a list of Planet GameObject XML roots and adds
         them to the repository with x and y positions"""
+        for planetRoot in planetRoots:
+            self.addPlanetsFromRecords(self.__xml.getPlanetInfo(planetRoot))
+
+    def addPlanetsFromRecords(self, planetRecords) -> List[Planet]:
+        """Takes a list of planet records as returned by XMLReader.getPlanetInfo
+        and adds them to the repository with x and y positions. Returns the added planets"""
+        planets = []
+        for record in tqdm(planetRecords):
+            newplanet = self.planetFromRecord(record, self.repository.planetTable)
+            if newplanet is not None:
+                self.repository.addPlanet(newplanet)
+                planets.append(newplanet)
+
+        return planets
+
+    def planetFromRecord(
+        self, record: dict, table: Optional[PlanetTable] = None
+    ) -> Optional[Planet]:
+        """Creates a planet from a planet record, or returns None if it has no coordinates.
+        The planet's attributes are stored in table if one is given"""
         shipyard_list = {
             "TEXT_PLANET_LIGHT": "Light Frigate",
             "TEXT_PLANET_HEAVY": "Heavy Frigate",
@@ -44,75 +172,106 @@ class RepositoryCreator:
             "TEXT_PLANET_DREAD": "Dreadnaught",
         }
 
-        for planetRoot in planetRoots:
-            for record in tqdm(self.__xml.getPlanetInfo(planetRoot)):
-                name = record["name"]
-                coordinates = record["coordinates"]
+        name = record["name"]
+        coordinates = record["coordinates"]
 
-                if coordinates is None:
-                    print(
-                        "Planet "
-                        + name
-                        + " not added to repository, missing coordinates"
-                    )
-                    continue
+        if coordinates is None:
+            print("Planet " + name + " not added to repository, missing coordinates")
+            return None
 
-                newplanet = Planet(name)
-                newplanet.variantOf = record["variant_of"]
-                newplanet.x, newplanet.y = coordinates
+        newplanet = Planet(name, table)
+        newplanet.variantOf = record["variant_of"]
+        newplanet.x, newplanet.y = coordinates
 
-                # TODO better way than this hack to convert to int
-                newplanet.starbaseLevel = int(float(record["starbase_level"]))
-                newplanet.shipyardLevel = shipyard_list.get(
-                    record["shipyard"], "No Shipyard Defined"
-                )
+        # TODO better way than this hack to convert to int
+        newplanet.starbaseLevel = int(float(record["starbase_level"]))
+        newplanet.shipyardLevel = shipyard_list.get(
+            record["shipyard"], "No Shipyard Defined"
+        )
 
-                structure = record["structure"]
-                if structure and structure.startswith("TEXT_RESOURCE_SUPPORTS_"):
-                    newplanet.SupportsStructure = structure.replace(
-                        "TEXT_RESOURCE_SUPPORTS_", ""
-                    )
-                else:
-                    newplanet.SupportsStructure = "None"
+        structure = record["structure"]
+        if structure and structure.startswith("TEXT_RESOURCE_SUPPORTS_"):
+            newplanet.SupportsStructure = structure.replace("TEXT_RESOURCE_SUPPORTS_", "")
+        else:
+            newplanet.SupportsStructure = "None"
 
-                newplanet.spaceStructureSlots = int(float(record["space_slots"]))
-                newplanet.groundStructureSlots = int(float(record["ground_slots"]))
+        newplanet.spaceStructureSlots = int(float(record["space_slots"]))
+        newplanet.groundStructureSlots = int(float(record["ground_slots"]))
 
-                income_value = record["income"]
-                if income_value:
-                    newplanet.income = int(float(income_value))
+        income_value = record["income"]
+        if income_value:
+            newplanet.income = int(float(income_value))
 
-                self.repository.addPlanet(newplanet)
+        return newplanet
 
     def addTradeRoutesFromXML(self, tradeRouteRoots) -> None:
         """Takes a list of Trade Route GameObject XML roots and adds
         them to the repository with start and end planets"""
         for tradeRouteRoot in tradeRouteRoots:
-            tradeRouteNames = self.__xml.getNamesFromXML(tradeRouteRoot)
+            self.addTradeRoutesFromRecords(self.__xml.getTradeRouteInfo(tradeRouteRoot))
+
+    def addTradeRoutesFromRecords(self, tradeRouteRecords) -> List[TradeRoute]:
+        """Takes a list of trade route records as returned by XMLReader.getTradeRouteInfo
+        and adds them to the repository, resolving endpoints by planet name.
+        Returns the added trade routes"""
+        tradeRoutes = []
+        for record in tqdm(tradeRouteRecords):
+            name = record["name"]
+            try:
+                start, end = self.__resolveTradeRouteEndpoints(record)
+            except ValueError as err:
+                print(f"Skipping malformed trade route '{name}': {err}")
+                continue
 
-            for name in tqdm(tradeRouteNames):
-                newroute = TradeRoute(name)
-                try:
-                    newroute.start, newroute.end = self.__xml.getStartEnd(
-                        name, self.repository.planets, tradeRouteRoot
-                    )
-                except ValueError as err:
-                    print(f"Skipping malformed trade route '{name}': {err}")
-                    continue
-                self.repository.addTradeRoute(newroute)
+            newroute = TradeRoute(name)
+            newroute.start = start
+            newroute.end = end
+            self.repository.addTradeRoute(newroute)
+            tradeRoutes.append(newroute)
+
+        return tradeRoutes
+
+    def __resolveTradeRouteEndpoints(self, record: dict) -> tuple:
+        """Validates a trade route record and returns its start and end planets"""
+        name = record["name"]
+        if record["point_a"] is None:
+            raise ValueError(f"TradeRoute {name} is missing Point_A")
+        if record["point_b"] is None:
+            raise ValueError(f"TradeRoute {name} is missing Point_B")
+
+        start = self.repository.findPlanet(record["point_a"])
+        if start is None:
+            raise ValueError(
+                f"TradeRoute {name} references unknown start planet '{record['point_a']}'"
+            )
+
+        end = self.repository.findPlanet(record["point_b"])
+        if end is None:
+            raise ValueError(
+                f"TradeRoute {name} references unknown end planet '{record['point_b']}'"
+            )
+
+        return start, end
 
     def addFactionsFromXML(self, factionRoots) -> None:
         """Takes a list of Faction GameObject XML roots and adds
         them to the repository"""
         for factionRoot in factionRoots:
-            factionInfo = self.__xml.getFactionInfo(factionRoot)
-
-            for name, basic_ai, color, playable in factionInfo:
-                newFaction = Faction(name)
-                newFaction.color = color
-                newFaction.aiplayer = basic_ai
-                newFaction.playable = playable
-                self.repository.addFaction(newFaction)
+            self.addFactionsFromRecords(self.__xml.getFactionInfo(factionRoot))
+
+    def addFactionsFromRecords(self, factionRecords) -> List[Faction]:
+        """Takes a list of faction records as returned by XMLReader.getFactionInfo
+        and adds them to the repository. Returns the added factions"""
+        factions = []
+        for name, basic_ai, color, playable in factionRecords:
+            newFaction = Faction(name)
+            newFaction.color = color
+            newFaction.aiplayer = basic_ai
+            newFaction.playable = playable
+            self.repository.addFaction(newFaction)
+            factions.append(newFaction)
+
+        return factions
 
     def addCampaignsFromXML(self, campaignEntries) -> None:
         """Takes a list of (filePath, campaignName, campaignRoot) tuples and adds
@@ -201,11 +360,15 @@ class RepositoryCreator:
             )
 
             for p in campaignPlanetNames:
-                newPlanet = getObject(p, self.repository.planets)
+                newPlanet = self.repository.findPlanet(p)
+                if newPlanet is None:
+                    print("Object " + p + " not found!")
                 newCampaignPlanets.add(newPlanet)
 
             for t in campaignTradeRouteNames:
-                newRoute = getObject(t, self.repository.tradeRoutes)
+                newRoute = self.repository.findTradeRoute(t)
+                if newRoute is None:
+                    print("Object " + t + " not found!")
                 newCampaignTradeRoutes.add(newRoute)
 
             for s in campaignStartingForces:
@@ -310,28 +473,8 @@ class RepositoryCreator:
             )
             return None
 
-        current_planet = None
-        current_era = 0
-
         try:
-            for index, row in tqdm(startingForcesLibrary.iterrows()):
-                if row["Planet"] != current_planet:
-                    current_planet = row["Planet"]
-
-                if row["Era"] != current_era:
-                    current_era = row["Era"]
-                    if not pd.isna(row["ReuseEra"]):
-                        era_to_reuse = row["ReuseEra"]
-                        reuse_filter = (startingForcesLibrary.Era == era_to_reuse) & (
-                            startingForcesLibrary.Planet == current_planet
-                        )
-                        data_to_add = startingForcesLibrary[reuse_filter].copy()
-                        data_to_add = data_to_add.assign(Era=current_era)
-                        startingForcesLibrary = pd.concat(
-                            [startingForcesLibrary, data_to_add]
-                        )
-                        continue
-
+            startingForcesLibrary = expandReusedEras(startingForcesLibrary)
             startingForcesLibrary.reset_index(drop=True, inplace=True)
 
             startingForcesLibrary.drop(["ReuseEra"], inplace=True, axis=1)
@@ -350,7 +493,9 @@ class RepositoryCreator:
         """Reads one or more mod Data folders and searches the XML metafiles within.
         dataFolders is an ordered list [base, submod1, submod2, ...] where later entries
         have higher priority and override earlier ones.
-        Creates a repository with planets, trade routes and campaigns"""
+        Creates a repository with planets, trade routes and campaigns.
+        If a cache is set and no input file changed since it was written, the cached
+        repository is returned without reading any XML"""
         if isinstance(dataFolders, str):
             dataFolders = [dataFolders]
 
@@ -364,8 +509,15 @@ class RepositoryCreator:
             os.path.basename(os.path.dirname(f)) for f in dataFolders[1:]
         ]
 
+        if self.__cache is not None:
+            fingerprint = self.__cache.fingerprint(dataFolders, startingForcesLibraryURL)
+            cachedRepository = self.__cache.load(fingerprint)
+            if cachedRepository is not None:
+                print("\nLoaded repository from cache")
+                self.repository = cachedRepository
+                return self.repository
+
         gameObjectFile = dataFolders[0] + "/XML/GameObjectFiles.XML"
-        campaignFile = dataFolders[0] + "/XML/CampaignFiles.XML"
         tradeRouteFile = dataFolders[0] + "/XML/TradeRouteFiles.XML"
         factionFile = dataFolders[0] + "/XML/FactionFiles.XML"
 
@@ -374,34 +526,34 @@ class RepositoryCreator:
                 os.path.exists(os.path.join(f, "XML", name)) for f in dataFolders
             )
 
+        for folder in dataFolders:
+            for name in METAFILE_NAMES:
+                metaFile = os.path.join(folder, "XML", name)
+                if os.path.exists(metaFile):
+                    self.repository.setFileObjects(metaFile, META_FILE, [])
+
         if metaFileExists("GameObjectFiles.XML"):
             print("\nLoading Planets")
-            planetRoots = self.__xml.findPlanetsFiles(gameObjectFile, dataFolders)
-            self.addPlanetsFromXML(planetRoots)
+            self.__loadFiles(
+                self.__xml.findMetaFilePaths(gameObjectFile, dataFolders), PLANET_FILE
+            )
 
         if metaFileExists("TradeRouteFiles.XML"):
             print("\nLoading Trade Routes")
-            tradeRouteRoots = self.__xml.findMetaFileRefs(tradeRouteFile, dataFolders)
-            self.addTradeRoutesFromXML(tradeRouteRoots)
+            self.__loadFiles(
+                self.__xml.findMetaFilePaths(tradeRouteFile, dataFolders),
+                TRADE_ROUTE_FILE,
+            )
 
         if metaFileExists("FactionFiles.XML"):
             print("\nLoading Factions")
-            factionRoots = self.__xml.findMetaFileRefs(factionFile, dataFolders)
-            self.addFactionsFromXML(factionRoots)
+            self.__loadFiles(
+                self.__xml.findMetaFilePaths(factionFile, dataFolders), FACTION_FILE
+            )
 
         if metaFileExists("CampaignFiles.XML"):
             print("\nLoading Campigns")
-            campaignPathRootList = self.__xml.findMetaFileRefsWithPaths(
-                campaignFile, dataFolders
-            )
-            campaignEntries = [
-                (filePath, name, root)
-                for filePath, fileRoot in campaignPathRootList
-                for name, root in zip(
-                    self.__xml.getNamesFromXML(fileRoot), fileRoot.iter("Campaign")
-                )
-            ]
-            self.addCampaignsFromXML(campaignEntries)
+            self.__loadCampaigns(dataFolders)
 
         print("\nChecking for planet variants")
         self.runPlanetVariantOfCheck()
@@ -409,5 +561,281 @@ class RepositoryCreator:
         self.repository.startingForcesLibrary = self.getStartingForcesLibrary(
             self.__startingForcesLibraryURL
         )
+        if self.__startingForcesLibraryURL:
+            self.repository.setFileObjects(
+                self.__startingForcesLibraryURL, STARTING_FORCES_FILE, []
+            )
+
+        if self.__cache is not None:
+            self.__cache.save(fingerprint, self.repository)
 
         return self.repository
+
+    def reloadFiles(self, filePaths: list) -> RepositoryChanges:
+        """Re-reads changed input files and patches the repository in place.
+        Planets, trade routes and factions keep their identity while they still exist,
+        so campaigns and selections referring to them stay valid. Campaign files are
+        reloaded together as campaign sets can span files, and a changed metafile only
+        sets fullReloadRequired. Files the repository was not loaded from are ignored"""
+        changes = RepositoryChanges()
+        sources = []
+        for filePath in filePaths:
+            source = self.repository.getFileObjects(filePath)
+            if source is not None:
+                sources.append((filePath, source[0], source[1]))
+        sources.sort(key=lambda source: RELOAD_ORDER.index(source[1]))
+
+        for filePath, kind, oldObjects in sources:
+            changes.kinds.add(kind)
+            if kind == META_FILE:
+                changes.fullReloadRequired = True
+                return changes
+            elif kind == STARTING_FORCES_FILE:
+                self.repository.startingForcesLibrary = self.getStartingForcesLibrary(
+                    filePath
+                )
+            elif kind != CAMPAIGN_FILE:
+                print("Reloading " + filePath)
+                self.__reloadFile(filePath, kind, oldObjects, changes)
+
+        self.__resolveTradeRoutesOfAddedPlanets(
+            [source[0] for source in sources], changes
+        )
+
+        if CAMPAIGN_FILE in changes.kinds:
+            print("Reloading campaigns")
+            self.__reloadCampaigns(changes)
+
+        return changes
+
+    def __recordHandlers(self, kind: str) -> tuple:
+        """Returns the record extractor and the add*FromRecords method for a kind of file"""
+        return {
+            PLANET_FILE: (extractPlanetRecords, self.addPlanetsFromRecords),
+            TRADE_ROUTE_FILE: (extractTradeRouteRecords, self.addTradeRoutesFromRecords),
+            FACTION_FILE: (extractFactionRecords, self.addFactionsFromRecords),
+        }[kind]
+
+    def __loadFiles(self, filePaths: list, kind: str) -> None:
+        """Adds the objects of every file to the repository and records where they came from"""
+        extractor, addRecords = self.__recordHandlers(kind)
+        fileRecords = dict(self.__xml.findFileRecords(filePaths, extractor))
+        for filePath in filePaths:
+            gameObjects = []
+            if filePath in fileRecords:
+                gameObjects = addRecords(fileRecords[filePath])
+            self.repository.setFileObjects(filePath, kind, gameObjects)
+
+    def __loadCampaigns(self, dataFolders: list) -> None:
+        """Adds the campaigns of every campaign file to the repository"""
+        campaignFile = dataFolders[0] + "/XML/CampaignFiles.XML"
+        campaignPathRootList = self.__xml.findMetaFileRefsWithPaths(
+            campaignFile, dataFolders
+        )
+        campaignEntries = [
+            (filePath, name, root)
+            for filePath, fileRoot in campaignPathRootList
+            for name, root in zip(
+                self.__xml.getNamesFromXML(fileRoot), fileRoot.iter("Campaign")
+            )
+        ]
+        self.addCampaignsFromXML(campaignEntries)
+
+        for filePath, _ in campaignPathRootList:
+            self.repository.setFileObjects(
+                filePath,
+                CAMPAIGN_FILE,
+                [c for c in self.repository.campaigns if c.fileName == filePath],
+            )
+
+    def __reloadFile(
+        self, filePath: str, kind: str, oldObjects: list, changes: RepositoryChanges
+    ) -> None:
+        """Patches the planets, trade routes or factions loaded from a single file"""
+        records = self.__readRecords(filePath, kind)
+        if records is not None:
+            self.__patchFile(filePath, kind, records, oldObjects, changes)
+
+    def __readRecords(self, filePath: str, kind: str) -> Optional[list]:
+        """Returns the records of a file, or None if it cannot be read"""
+        extractor, _ = self.__recordHandlers(kind)
+        try:
+            return (extractor(filePath) if os.path.isfile(filePath) else []) or []
+        except (OSError, et.XMLSyntaxError) as err:
+            print(f"Could not reload '{filePath}', keeping previous objects: {err}")
+            return None
+
+    def __patchFile(
+        self,
+        filePath: str,
+        kind: str,
+        records: list,
+        oldObjects: list,
+        changes: RepositoryChanges,
+    ) -> None:
+        """Patches the objects loaded from a file to match its records"""
+        oldByName: Dict[str, object] = {o.name: o for o in oldObjects}
+        if kind == PLANET_FILE:
+            gameObjects = self.__patchPlanets(records, oldByName, changes)
+        elif kind == TRADE_ROUTE_FILE:
+            gameObjects = self.__patchTradeRoutes(records, oldByName, changes)
+        else:
+            gameObjects = self.__patchFactions(records, oldByName, changes)
+
+        # Whatever is left in oldByName was deleted from the file
+        for gameObject in oldByName.values():
+            self.__removeObject(gameObject, changes)
+
+        self.repository.setFileObjects(filePath, kind, gameObjects)
+
+    def __resolveTradeRoutesOfAddedPlanets(
+        self, reloadedFiles: list, changes: RepositoryChanges
+    ) -> None:
+        """Patches the trade route files that were not reloaded but name an added planet,
+        so routes skipped or removed while the planet was missing come back"""
+        addedNames = {nameKey(o.name) for o in changes.added if isinstance(o, Planet)}
+        if not addedNames:
+            return
+
+        reloadedKeys = {fileKey(filePath) for filePath in reloadedFiles}
+        for filePath in self.repository.getFilePaths(TRADE_ROUTE_FILE):
+            if filePath in reloadedKeys:
+                continue
+            records = self.__readRecords(filePath, TRADE_ROUTE_FILE)
+            if records is None or not any(
+                nameKey(record[point]) in addedNames
+                for record in records
+                for point in ("point_a", "point_b")
+                if record[point] is not None
+            ):
+                continue
+            print("Resolving trade routes of " + filePath)
+            changes.kinds.add(TRADE_ROUTE_FILE)
+            _, oldObjects = self.repository.getFileObjects(filePath)
+            self.__patchFile(filePath, TRADE_ROUTE_FILE, records, oldObjects, changes)
+
+    def __patchPlanets(
+        self, planetRecords: list, oldPlanets: dict, changes: RepositoryChanges
+    ) -> List[Planet]:
+        planets = []
+        for record in planetRecords:
+            newPlanet = self.planetFromRecord(record)
+            if newPlanet is None:
+                continue
+
+            planet = oldPlanets.pop(newPlanet.name, None)
+            if planet is None:
+                self.repository.addPlanet(newPlanet)
+                changes.added.add(newPlanet)
+                planets.append(newPlanet)
+                continue
+
+            for attribute in PLANET_ATTRIBUTES:
+                value = getattr(newPlanet, attribute)
+                if getattr(planet, attribute) != value:
+                    setattr(planet, attribute, value)
+                    changes.updated.add(planet)
+            planets.append(planet)
+
+        return planets
+
+    def __patchTradeRoutes(
+        self, tradeRouteRecords: list, oldTradeRoutes: dict, changes: RepositoryChanges
+    ) -> List[TradeRoute]:
+        tradeRoutes = []
+        for record in tradeRouteRecords:
+            name = record["name"]
+            try:
+                start, end = self.__resolveTradeRouteEndpoints(record)
+            except ValueError as err:
+                print(f"Skipping malformed trade route '{name}': {err}")
+                continue
+
+            tradeRoute = oldTradeRoutes.pop(name, None)
+            if tradeRoute is None:
+                tradeRoute = TradeRoute(name)
+                tradeRoute.start = start
+                tradeRoute.end = end
+                self.repository.addTradeRoute(tradeRoute)
+                changes.added.add(tradeRoute)
+            elif tradeRoute.start is not start or tradeRoute.end is not end:
+                # Re-add so the endpoint index follows the new planets
+                self.repository.removeTradeRoute(tradeRoute)
+                tradeRoute.start = start
+                tradeRoute.end = end
+                self.repository.addTradeRoute(tradeRoute)
+                changes.updated.add(tradeRoute)
+            tradeRoutes.append(tradeRoute)
+
+        return tradeRoutes
+
+    def __patchFactions(
+        self, factionRecords: list, oldFactions: dict, changes: RepositoryChanges
+    ) -> List[Faction]:
+        factions = []
+        for name, basic_ai, color, playable in factionRecords:
+            faction = oldFactions.pop(name, None)
+            if faction is None:
+                faction = self.addFactionsFromRecords([(name, basic_ai, color, playable)])[0]
+                changes.added.add(faction)
+            elif (faction.aiplayer, faction.color, faction.playable) != (
+                basic_ai,
+                color,
+                playable,
+            ):
+                faction.aiplayer = basic_ai
+                faction.color = color
+                faction.playable = playable
+                changes.updated.add(faction)
+            factions.append(faction)
+
+        return factions
+
+    def __removeObject(self, gameObject, changes: RepositoryChanges) -> None:
+        """Removes a planet, trade route or faction from the repository and all campaigns"""
+        if isinstance(gameObject, Planet):
+            # Routes cannot outlive either of their endpoints
+            tradeRoutes = [
+                t
+                for t in self.repository.tradeRoutes
+                if t.start is gameObject or t.end is gameObject
+            ]
+            for tradeRoute in tradeRoutes:
+                self.__removeObject(tradeRoute, changes)
+            if tradeRoutes:
+                # Their files no longer hold them, a later reload adds them back
+                self.repository.discardFileObjects(tradeRoutes)
+            if gameObject in self.repository.planets:
+                self.repository.removePlanet(gameObject)
+            for campaign in self.repository.campaigns:
+                campaign.planets.discard(gameObject)
+        elif isinstance(gameObject, TradeRoute):
+            if gameObject in self.repository.tradeRoutes:
+                self.repository.removeTradeRoute(gameObject)
+            for campaign in self.repository.campaigns:
+                campaign.tradeRoutes.discard(gameObject)
+        else:
+            if gameObject in self.repository.factions:
+                self.repository.removeFaction(gameObject)
+            for campaign in self.repository.campaigns:
+                campaign.playableFactions.discard(gameObject)
+        changes.removed.add(gameObject)
+
+    def __reloadCampaigns(self, changes: RepositoryChanges) -> None:
+        """Replaces all campaigns with freshly loaded ones, keeping the old ones on failure"""
+        oldCampaigns = list(self.repository.campaigns)
+        for campaign in oldCampaigns:
+            self.repository.removeCampaign(campaign)
+
+        try:
+            self.__loadCampaigns(XMLStructure.dataFolders)
+        except (OSError, et.XMLSyntaxError, RuntimeError) as err:
+            print(f"Could not reload campaigns, keeping previous campaigns: {err}")
+            for campaign in list(self.repository.campaigns):
+                self.repository.removeCampaign(campaign)
+            for campaign in oldCampaigns:
+                self.repository.addCampaign(campaign)
+            return
+
+        changes.removed.update(oldCampaigns)
+        changes.added.update(self.repository.campaigns)
@@ -0,0 +1,29 @@
+from typing import List
+
+from RepositoryCache import collectInputFiles, fingerprintFiles
+
+
+class RepositoryWatcher:
+    """Polls the XML files of the data folders, plus any extra files, and reports
+    which of them were added, modified or deleted since the previous poll"""
+
+    def __init__(self, dataFolders: list, extraFiles: list = None):
+        self.__dataFolders: list = list(dataFolders)
+        self.__extraFiles: list = [f for f in extraFiles or [] if f]
+        self.__fingerprints: dict = self.__snapshot()
+
+    def poll(self) -> List[str]:
+        """Returns the files that changed since the last poll, sorted by path"""
+        fingerprints = self.__snapshot()
+        changedFiles = [
+            filePath
+            for filePath in fingerprints.keys() | self.__fingerprints.keys()
+            if fingerprints.get(filePath) != self.__fingerprints.get(filePath)
+        ]
+        self.__fingerprints = fingerprints
+        return sorted(changedFiles)
+
+    def __snapshot(self) -> dict:
+        # Extra files are listed even while missing, so creating one shows up as a change
+        inputFiles = collectInputFiles(self.__dataFolders) + self.__extraFiles
+        return fingerprintFiles(inputFiles)
@@ -0,0 +1,75 @@
+import re
+from typing import List
+
+import numpy as np
+
+GRAM_LENGTH = 3
+
+
+def searchKey(text: str) -> str:
+    """Case folds text and writes whitespace as underscores, as object names use them"""
+    return re.sub(r"\s", "_", text).casefold()
+
+
+class SearchIndex:
+    """Substring search over a fixed list of names. Names are indexed by the trigrams
+    they contain, so a search only checks names sharing every trigram of the query, and
+    a query that extends the previous one only checks the previous matches"""
+
+    def __init__(self, names: List[str]):
+        self.__keys: List[str] = [searchKey(name) for name in names]
+
+        postings = dict()
+        for row, key in enumerate(self.__keys):
+            for gram in {key[i : i + GRAM_LENGTH] for i in range(len(key) - GRAM_LENGTH + 1)}:
+                postings.setdefault(gram, []).append(row)
+        self.__postings: dict = {
+            gram: np.array(rows, dtype=np.intp) for gram, rows in postings.items()
+        }
+
+        self.__lastQuery: str = ""
+        self.__lastMatches: np.ndarray = np.arange(len(self.__keys))
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def search(self, text: str) -> np.ndarray:
+        """Returns the sorted rows of the names containing text, ignoring case"""
+        query = searchKey(text)
+        if not query:
+            matches = np.arange(len(self.__keys))
+        else:
+            candidates = self.__candidates(query)
+            matches = np.array(
+                [row for row in candidates if query in self.__keys[row]], dtype=np.intp
+            )
+
+        self.__lastQuery = query
+        self.__lastMatches = matches
+        return matches
+
+    def matches(self, text: str) -> np.ndarray:
+        """Returns a mask with True for every name containing text"""
+        mask = np.zeros(len(self.__keys), dtype=bool)
+        mask[self.search(text)] = True
+        return mask
+
+    def __candidates(self, query: str) -> np.ndarray:
+        """Returns the rows that may contain query"""
+        if self.__lastQuery and self.__lastQuery in query:
+            # Anything containing the new query also contained the previous one
+            return self.__lastMatches
+        if len(query) < GRAM_LENGTH:
+            return np.arange(len(self.__keys))
+
+        grams = {query[i : i + GRAM_LENGTH] for i in range(len(query) - GRAM_LENGTH + 1)}
+        postings = sorted(
+            (self.__postings.get(gram, np.empty(0, dtype=np.intp)) for gram in grams),
+            key=len,
+        )
+        candidates = postings[0]
+        for rows in postings[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+        return candidates
@@ -0,0 +1,132 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SpatialGrid:
+    """Buckets 2D points into square cells so that neighbour searches only look at the
+    cells around a position instead of at every point. Points with a NaN coordinate
+    are left out of every search"""
+
+    def __init__(self, x, y, cellSize: float):
+        if cellSize <= 0:
+            raise ValueError("cellSize must be positive")
+
+        self.__x: np.ndarray = np.asarray(x, dtype=np.float64)
+        self.__y: np.ndarray = np.asarray(y, dtype=np.float64)
+        self.__cellSize: float = float(cellSize)
+
+        points = np.flatnonzero(np.isfinite(self.__x) & np.isfinite(self.__y))
+        if len(points):
+            self.__origin = (self.__x[points].min(), self.__y[points].min())
+        else:
+            self.__origin = (0.0, 0.0)
+
+        cellX, cellY = self.__cellsOf(self.__x[points], self.__y[points])
+        self.__stride: int = int(cellY.max()) + 1 if len(points) else 1
+        self.__columns: int = int(cellX.max()) + 1 if len(points) else 0
+        keys = cellX * self.__stride + cellY
+
+        order = np.argsort(keys, kind="stable")
+        self.__points: np.ndarray = points[order]
+        self.__keys, self.__starts, self.__counts = np.unique(
+            keys[order], return_index=True, return_counts=True
+        )
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    def pairsWithin(self, distance: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns two index arrays (first, second) with every pair of points closer than
+        distance, each pair once and with first < second"""
+        if not len(self.__points):
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        reach = int(np.ceil(distance / self.__cellSize))
+        # Half of the neighbourhood is enough as every pair is found from one of its cells
+        offsets = [(0, 0)]
+        offsets += [(0, dy) for dy in range(1, reach + 1)]
+        offsets += [(dx, dy) for dx in range(1, reach + 1) for dy in range(-reach, reach + 1)]
+
+        firsts = []
+        seconds = []
+        for dx, dy in offsets:
+            first, second = self.__cellPairs(dx, dy)
+            if dx == 0 and dy == 0:
+                keep = first < second
+                first, second = first[keep], second[keep]
+
+            first = self.__points[first]
+            second = self.__points[second]
+            keep = self.__distanceSquared(first, second) < distance * distance
+            firsts.append(first[keep])
+            seconds.append(second[keep])
+
+        first = np.concatenate(firsts)
+        second = np.concatenate(seconds)
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def pointsWithin(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Returns the indices of the points within radius of (x, y), nearest first"""
+        if not len(self.__points):
+            return np.empty(0, dtype=np.intp)
+
+        (lowX, highX), (lowY, highY) = self.__cellsOf(
+            np.array([x - radius, x + radius]), np.array([y - radius, y + radius])
+        )
+        lowY = max(int(lowY), 0)
+        highY = min(int(highY), self.__stride - 1)
+        candidates = []
+        for cellX in range(max(int(lowX), 0), min(int(highX), self.__columns - 1) + 1):
+            first = np.searchsorted(self.__keys, cellX * self.__stride + lowY)
+            last = np.searchsorted(self.__keys, cellX * self.__stride + highY, side="right")
+            for start, count in zip(self.__starts[first:last], self.__counts[first:last]):
+                candidates.append(self.__points[start : start + count])
+
+        if not candidates:
+            return np.empty(0, dtype=np.intp)
+
+        candidates = np.concatenate(candidates)
+        distanceSquared = (self.__x[candidates] - x) ** 2 + (self.__y[candidates] - y) ** 2
+        inside = distanceSquared <= radius * radius
+        candidates = candidates[inside]
+        return candidates[np.argsort(distanceSquared[inside], kind="stable")]
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[int]:
+        """Returns the index of the point nearest to (x, y) within radius, or None"""
+        points = self.pointsWithin(x, y, radius)
+        return int(points[0]) if len(points) else None
+
+    def __cellsOf(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cellX = np.floor((x - self.__origin[0]) / self.__cellSize).astype(np.int64)
+        cellY = np.floor((y - self.__origin[1]) / self.__cellSize).astype(np.int64)
+        return cellX, cellY
+
+    def __cellPairs(self, dx: int, dy: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the positions in sorted order of every pair of points where the second
+        point lies in the cell (dx, dy) away from the cell of the first"""
+        targetKeys = self.__keys + dx * self.__stride + dy
+        targets = np.minimum(np.searchsorted(self.__keys, targetKeys), len(self.__keys) - 1)
+        # Rows past the top or bottom of a column would wrap into the next column
+        targetRows = self.__keys % self.__stride + dy
+        found = (self.__keys[targets] == targetKeys) & (targetRows >= 0) & (
+            targetRows < self.__stride
+        )
+
+        startsA = self.__starts[found]
+        countsA = self.__counts[found]
+        startsB = self.__starts[targets[found]]
+        countsB = self.__counts[targets[found]]
+
+        sizes = countsA * countsB
+        cellPair = np.repeat(np.arange(len(sizes)), sizes)
+        offset = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        return (
+            startsA[cellPair] + offset // countsB[cellPair],
+            startsB[cellPair] + offset % countsB[cellPair],
+        )
+
+    def __distanceSquared(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        return (self.__x[first] - self.__x[second]) ** 2 + (
+            self.__y[first] - self.__y[second]
+        ) ** 2
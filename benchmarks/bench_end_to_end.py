@@ -0,0 +1,179 @@
+"""Generates synthetic mods and times the main stages of the editor on them: loading the
+repository, writing a campaign, plotting the galaxy offscreen and exporting the campaign
+Lua tables. Each size runs in a fresh process, so peak memory is reported per size.
+
+    python benchmarks/bench_end_to_end.py --sizes 1000 10000 50000
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:
+    # Windows has no getrusage, peak RSS is left out there and --trace-memory still works
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_mod import write_synthetic_mod
+
+STAGES = ["generate", "constructRepository", "campaignWriter", "plotGalaxy", "export_campaigns"]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+@contextlib.contextmanager
+def stage(name: str, results: dict, args, quiet: bool = True):
+    """Times the enclosed block and records the peak memory reached by it"""
+    trace_memory = args.trace_memory
+    output = io.StringIO()
+    if trace_memory:
+        tracemalloc.start()
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            # The loaders print and show progress bars for every object
+            stack.enter_context(contextlib.redirect_stdout(output))
+            stack.enter_context(contextlib.redirect_stderr(output))
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+
+    traced = None
+    if trace_memory:
+        traced = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    results[name] = (seconds, peak_rss_mb(), traced)
+
+
+def run_size(planets: int, args) -> dict:
+    """Runs every stage on a mod with the given number of planets"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from matplotlib.backends.backend_qtagg import FigureCanvas
+    from PyQt6.QtWidgets import QApplication, QWidget
+
+    from export_campaign_planets_lua import export_campaigns
+    from RepositoryCreator import RepositoryCreator
+    from ui.qtgalacticplot import QtGalacticPlot
+    from xmlTools.xmlwriter import XMLWriter
+
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        with stage("generate", results, args):
+            mod = write_synthetic_mod(
+                folder, planets, args.campaigns, args.submods, args.seed
+            )
+
+        with stage("constructRepository", results, args):
+            repository = RepositoryCreator(
+                args.workers, args.processes
+            ).constructRepository(mod.data_folders, mod.starting_forces_library)
+
+        # The galaxy-wide set is the largest campaign
+        campaign = repository.getCampaignBySetName("Galaxy")
+        if repository.startingForcesLibrary is not None:
+            campaign.startingForces = repository.startingForcesLibrary
+        if "campaignWriter" not in args.skip:
+            with stage("campaignWriter", results, args):
+                XMLWriter().campaignWriter(
+                    campaign, repository.factions, os.path.join(folder, "Campaign.XML")
+                )
+
+        application = QApplication.instance() or QApplication([])
+        parent = QWidget()
+        plot = QtGalacticPlot(parent)
+        planets_in_campaign = list(campaign.planets)
+        factions = sorted(repository.factions, key=lambda faction: faction.name)
+        owners = [factions[i % len(factions)] for i in range(len(planets_in_campaign))]
+        if "plotGalaxy" not in args.skip:
+            with stage("plotGalaxy", results, args):
+                plot.plotGalaxy(
+                    planets_in_campaign,
+                    list(campaign.tradeRoutes),
+                    list(repository.planets),
+                    owners,
+                    autoPlanetConnectionDistance=args.auto_connection_distance,
+                )
+                # plotGalaxy only schedules a draw, so render the canvas here
+                plot.getWidget().findChild(FigureCanvas).draw()
+
+        if "export_campaigns" not in args.skip:
+            with stage("export_campaigns", results, args):
+                export_campaigns(repository, Path(folder) / "lua")
+
+        parent.deleteLater()
+        application.processEvents()
+
+    return results
+
+
+def run_size_in_process(planets: int, args, queue) -> None:
+    queue.put(run_size(planets, args))
+
+
+def report(planets: int, results: dict, trace_memory: bool) -> None:
+    print(f"\n{planets} planets")
+    header = f"{'stage':<22}{'seconds':>10}{'peak RSS MB':>14}"
+    print(header + (f"{'traced MB':>12}" if trace_memory else ""))
+    for name in STAGES:
+        if name not in results:
+            continue
+        seconds, rss, traced = results[name]
+        line = f"{name:<22}{seconds:>10.3f}" + (f"{rss:>14.1f}" if rss is not None else f"{'n/a':>14}")
+        print(line + (f"{traced:>12.1f}" if traced is not None else ""))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--campaigns", type=int, default=5)
+    parser.add_argument("--submods", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0, help="parser workers, 0 for one per CPU")
+    parser.add_argument("--processes", action="store_true", help="parse in worker processes")
+    parser.add_argument(
+        "--auto-connection-distance",
+        type=int,
+        default=0,
+        help="also draw automatic connections closer than this (quadratic before the spatial index)",
+    )
+    parser.add_argument(
+        "--skip",
+        nargs="+",
+        default=[],
+        choices=STAGES[2:],
+        help="leave out stages, e.g. plotGalaxy on the largest sizes",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="also report the Python heap peak of each stage with tracemalloc (slows every stage down)",
+    )
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    for planets in args.sizes:
+        queue = context.Queue()
+        process = context.Process(target=run_size_in_process, args=(planets, args, queue))
+        process.start()
+        results = queue.get()
+        process.join()
+        report(planets, results, args.trace_memory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Times GameObjectRepository getters and property access on small and large
+repositories. Constant time lookups should give a size ratio close to 1.
+
+    python benchmarks/bench_repository_lookups.py --small 500 --large 5000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gameObjects.campaign import Campaign
+from gameObjects.faction import Faction
+from gameObjects.gameObjectRepository import GameObjectRepository
+from gameObjects.planet import Planet
+from gameObjects.traderoute import TradeRoute
+
+
+def build_repository(planet_count: int) -> GameObjectRepository:
+    repository = GameObjectRepository()
+    planets = []
+    for i in range(planet_count):
+        planet = Planet(f"Planet_{i}")
+        planets.append(planet)
+        repository.addPlanet(planet)
+
+    for i in range(planet_count - 1):
+        route = TradeRoute(f"Route_{i}")
+        route.start = planets[i]
+        route.end = planets[i + 1]
+        repository.addTradeRoute(route)
+
+    for i in range(max(planet_count // 100, 1)):
+        repository.addFaction(Faction(f"Faction_{i}"))
+        campaign = Campaign(f"Campaign_{i}")
+        campaign.setName = f"Set_{i}"
+        repository.addCampaign(campaign)
+
+    return repository
+
+
+def lookups(repository: GameObjectRepository, planet_count: int) -> dict:
+    last = planet_count - 1
+    start = repository.getPlanetByName(f"Planet_{last - 1}")
+    end = repository.getPlanetByName(f"Planet_{last}")
+    faction = f"Faction_{max(planet_count // 100, 1) - 1}"
+    campaign_set = f"Set_{max(planet_count // 100, 1) - 1}"
+
+    return {
+        "getPlanetByName": lambda: repository.getPlanetByName(f"Planet_{last}"),
+        "planetExists": lambda: repository.planetExists(f"Planet_{last}"),
+        "getTradeRouteByPlanets": lambda: repository.getTradeRouteByPlanets(end, start),
+        "tradeRouteExists": lambda: repository.tradeRouteExists(
+            f"Planet_{last}", f"Planet_{last - 1}"
+        ),
+        "getFactionByName": lambda: repository.getFactionByName(faction),
+        "getCampaignBySetName": lambda: repository.getCampaignBySetName(campaign_set),
+        "planets property": lambda: repository.planets,
+        "tradeRoutes property": lambda: repository.tradeRoutes,
+    }
+
+
+def time_calls(calls: dict, number: int) -> dict:
+    return {
+        name: min(timeit.repeat(call, number=number, repeat=5)) / number
+        for name, call in calls.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--small", type=int, default=500)
+    parser.add_argument("--large", type=int, default=5000)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    small = time_calls(lookups(build_repository(args.small), args.small), args.number)
+    large = time_calls(lookups(build_repository(args.large), args.large), args.number)
+
+    print(f"{'call':<24}{args.small:>12} planets{args.large:>12} planets{'ratio':>8}")
+    for name in small:
+        ratio = large[name] / small[name]
+        print(
+            f"{name:<24}{small[name] * 1e9:>12.0f} ns    "
+            f"{large[name] * 1e9:>12.0f} ns    {ratio:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Times the ReuseEra expansion of RepositoryCreator.getStartingForcesLibrary on a
+synthetic library, optionally against the previous row by row expansion.
+
+    python benchmarks/bench_starting_forces_library.py --rows 100000 --legacy-rows 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from RepositoryCreator import RepositoryCreator, expandReusedEras
+
+ERAS = 5
+UNITS_PER_ERA = 4
+
+
+def synthetic_library(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Planets with ERAS eras each. Era 1 lists units, later eras either list their own
+    units or reuse the previous era, which produces chains of reuse"""
+    rng = np.random.default_rng(seed)
+    records = []
+    planet = 0
+    while len(records) < rows:
+        name = f"Planet_{planet}"
+        for era in range(1, ERAS + 1):
+            if era > 1 and rng.random() < 0.6:
+                records.append([name, era, "Empire", None, None, era - 1])
+                continue
+            for unit in range(UNITS_PER_ERA):
+                records.append([name, era, "Empire", f"Unit_{unit}", 1, None])
+        planet += 1
+
+    return pd.DataFrame(
+        records[:rows],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount", "ReuseEra"],
+    )
+
+
+def legacy_expand_reused_eras(library: pd.DataFrame) -> pd.DataFrame:
+    current_era = 0
+    for _, row in library.iterrows():
+        if row["Era"] != current_era:
+            current_era = row["Era"]
+            if not pd.isna(row["ReuseEra"]):
+                reuse_filter = (library.Era == row["ReuseEra"]) & (
+                    library.Planet == row["Planet"]
+                )
+                library = pd.concat(
+                    [library, library[reuse_filter].copy().assign(Era=current_era)]
+                )
+    return library
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def report(name: str, rows: int, outputRows: int, seconds: float) -> None:
+    print(f"{name:<26}{rows:>8} rows -> {outputRows:>8} rows {seconds:8.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument(
+        "--legacy-rows",
+        type=int,
+        default=0,
+        help="also time the row by row expansion on this many rows (quadratic, keep small)",
+    )
+    args = parser.parse_args()
+
+    library = synthetic_library(args.rows)
+    expanded, seconds = timed(expandReusedEras, library)
+    report("expandReusedEras", args.rows, len(expanded), seconds)
+
+    with tempfile.TemporaryDirectory() as folder:
+        library_csv = os.path.join(folder, "library.csv")
+        library.to_csv(library_csv, index=False)
+        loaded, seconds = timed(RepositoryCreator().getStartingForcesLibrary, library_csv)
+    report("getStartingForcesLibrary", args.rows, len(loaded), seconds)
+
+    if args.legacy_rows:
+        small = synthetic_library(args.legacy_rows)
+        expanded, seconds = timed(expandReusedEras, small)
+        legacy, legacy_seconds = timed(legacy_expand_reused_eras, small)
+        pd.testing.assert_frame_equal(expanded, legacy)
+        report("row by row expansion", args.legacy_rows, len(legacy), legacy_seconds)
+        print(f"{legacy_seconds / seconds:.0f}x slower than expandReusedEras, identical result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""Writes a synthetic mod for benchmarking: a base Data/XML tree with metafiles, planet,
+trade route, faction and campaign files, optional submod layers and a starting forces
+library CSV, at any number of planets.
+
+    python benchmarks/synthetic_mod.py OUTPUT_DIR --planets 10000 --submods 1
+"""
+import argparse
+import math
+import os
+from dataclasses import dataclass, field
+
+import lxml.etree as et
+import numpy as np
+import pandas as pd
+
+PLANETS_PER_FILE = 500
+ROUTES_PER_FILE = 2000
+ERAS = 5
+UNITS_PER_ERA = 3
+FACTIONS = [
+    # name, color, playable
+    ("Neutral", (150, 150, 150), False),
+    ("Empire", (90, 120, 255), True),
+    ("Rebel", (230, 60, 40), True),
+    ("Underworld", (240, 200, 30), True),
+    ("Hutt_Cartels", (140, 90, 40), False),
+    ("Hostile", (120, 0, 120), False),
+]
+
+
+@dataclass
+class SyntheticMod:
+    """Where a synthetic mod was written and what it contains"""
+
+    data_folders: list
+    starting_forces_library: str
+    planet_names: list
+    route_names: list
+    campaign_sets: list = field(default_factory=list)
+
+
+def planet_name(index: int) -> str:
+    return f"Planet_{index:06d}"
+
+
+def galaxy_positions(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Jittered grid positions, row by row, so grid neighbours are also map neighbours"""
+    columns = math.ceil(math.sqrt(count))
+    index = np.arange(count)
+    spacing = 20.0
+    x = (index % columns - columns / 2) * spacing + rng.uniform(-6, 6, count)
+    y = (index // columns - columns / 2) * spacing + rng.uniform(-6, 6, count)
+    return np.column_stack([x, y]).round(2)
+
+
+def grid_routes(count: int, rng: np.random.Generator) -> list:
+    """Connects each planet to its right and lower grid neighbours with some probability,
+    giving about 1.3 routes per planet"""
+    columns = math.ceil(math.sqrt(count))
+    routes = []
+    for index in range(count):
+        right = index + 1
+        if right % columns and right < count and rng.random() < 0.7:
+            routes.append((index, right))
+        below = index + columns
+        if below < count and rng.random() < 0.6:
+            routes.append((index, below))
+    return routes
+
+
+def add_text(parent, tag: str, text) -> None:
+    et.SubElement(parent, tag).text = str(text)
+
+
+def write_xml(root, path: str) -> None:
+    et.ElementTree(root).write(path, xml_declaration=True, pretty_print=True, encoding="utf-8")
+
+
+def write_metafile(xml_dir: str, name: str, files: list) -> None:
+    root = et.Element(os.path.splitext(name)[0])
+    for file in files:
+        add_text(root, "File", file)
+    write_xml(root, os.path.join(xml_dir, name))
+
+
+def planet_element(root, name: str, position, rng: np.random.Generator, variant_of=""):
+    planet = et.SubElement(root, "Planet", Name=name)
+    if variant_of:
+        add_text(planet, "Variant_Of_Existing_Type", variant_of)
+    add_text(planet, "Galactic_Position", f"{position[0]}, {position[1]}, 0.0")
+    add_text(planet, "Max_Space_Base", rng.integers(1, 6))
+    add_text(planet, "Planet_Ability_Name", rng.choice(["TEXT_NONE", "TEXT_SHIPYARD"]))
+    add_text(planet, "Encyclopedia_Weather_Name", rng.choice(["TEXT_NONE", "TEXT_STRUCTURE"]))
+    add_text(planet, "Special_Structures_Space", rng.integers(0, 4))
+    add_text(planet, "Special_Structures_Land", rng.integers(1, 12))
+    add_text(planet, "Planet_Credit_Value", rng.integers(10, 200))
+
+
+def write_planet_files(xml_dir: str, names: list, positions, rng: np.random.Generator) -> list:
+    files = []
+    for start in range(0, len(names), PLANETS_PER_FILE):
+        root = et.Element("Planets")
+        for index in range(start, min(start + PLANETS_PER_FILE, len(names))):
+            # A few planets are variants of the planet before them
+            variant_of = names[index - 1] if index and rng.random() < 0.02 else ""
+            planet_element(root, names[index], positions[index], rng, variant_of)
+        file = f"Planets_{start // PLANETS_PER_FILE:03d}.XML"
+        write_xml(root, os.path.join(xml_dir, file))
+        files.append(file)
+
+    # GameObjectFiles also lists files without planets, which the loader has to skip
+    root = et.Element("SpaceUnits")
+    for unit in range(UNITS_PER_ERA):
+        space_unit = et.SubElement(root, "SpaceUnit", Name=f"Unit_{unit}")
+        add_text(space_unit, "AI_Combat_Power", 100 * (unit + 1))
+    write_xml(root, os.path.join(xml_dir, "Units.XML"))
+    return files + ["Units.XML"]
+
+
+def write_route_files(xml_dir: str, names: list, routes: list) -> tuple:
+    files = []
+    route_names = []
+    for start in range(0, len(routes), ROUTES_PER_FILE):
+        root = et.Element("TradeRoutes")
+        for a, b in routes[start : start + ROUTES_PER_FILE]:
+            route_name = f"{names[a]}_{names[b]}"
+            route = et.SubElement(root, "TradeRoute", Name=route_name)
+            add_text(route, "Point_A", names[a])
+            add_text(route, "Point_B", names[b])
+            route_names.append(route_name)
+        file = f"TradeRoutes_{start // ROUTES_PER_FILE:03d}.XML"
+        write_xml(root, os.path.join(xml_dir, file))
+        files.append(file)
+    return files, route_names
+
+
+def write_faction_file(xml_dir: str) -> list:
+    root = et.Element("Factions")
+    for name, color, playable in FACTIONS:
+        faction = et.SubElement(root, "Faction", Name=name)
+        add_text(faction, "Color", ", ".join(str(c) for c in color) + ", 255")
+        add_text(faction, "Basic_AI", f"{name}_AI")
+        add_text(faction, "Is_Playable", "Yes" if playable else "No")
+    write_xml(root, os.path.join(xml_dir, "Factions.XML"))
+    return ["Factions.XML"]
+
+
+def owner_of(index: int) -> str:
+    return FACTIONS[index % len(FACTIONS)][0]
+
+
+def write_campaign_files(
+    xml_dir: str, names: list, routes: list, route_names: list, campaigns: int
+) -> tuple:
+    """Writes one galaxy-wide campaign set and campaigns - 1 regional sets covering
+    consecutive slices of the galaxy. Every set has one campaign per playable faction"""
+    count = len(names)
+    regions = [(0, count)]
+    region_size = max(count // max(campaigns - 1, 1), 1)
+    for region in range(campaigns - 1):
+        start = region * region_size
+        regions.append((start, min(start + region_size, count)))
+
+    playable = [name for name, _, is_playable in FACTIONS if is_playable]
+    files = []
+    sets = []
+    for number, (start, end) in enumerate(regions):
+        set_name = "Galaxy" if number == 0 else f"Region_{number:03d}"
+        locations = names[start:end]
+        region_routes = [
+            route_names[i] for i, (a, b) in enumerate(routes) if start <= a < end and start <= b < end
+        ]
+        forces = [
+            f"{owner_of(index)}, {names[index]}, Unit_{index % UNITS_PER_ERA}"
+            for index in range(start, end)
+        ]
+
+        root = et.Element("Campaigns")
+        for faction in playable:
+            campaign = et.SubElement(root, "Campaign", Name=f"{set_name}_{faction}")
+            add_text(campaign, "Campaign_Set", set_name)
+            add_text(campaign, "Sort_Order", number)
+            add_text(campaign, "Is_Listed", "True")
+            add_text(campaign, "Text_ID", f"TEXT_{set_name.upper()}")
+            add_text(campaign, "Description_Text", f"TEXT_{set_name.upper()}_DESCRIPTION")
+            add_text(campaign, "Era_Start", 1 + number % ERAS)
+            add_text(campaign, "Use_Default_Forces", "False")
+            add_text(campaign, "Locations", ",\n".join(locations))
+            add_text(campaign, "Trade_Routes", ",\n".join(region_routes))
+            add_text(campaign, "Starting_Active_Player", faction)
+            for entry in forces:
+                add_text(campaign, "Starting_Forces", entry)
+        file = f"Campaigns_{set_name}.XML"
+        write_xml(root, os.path.join(xml_dir, file))
+        files.append(file)
+        sets.append(set_name)
+    return files, sets
+
+
+def write_starting_forces_library(path: str, names: list, rng: np.random.Generator) -> None:
+    """Every planet has ERAS eras; later eras either list units or reuse the previous era"""
+    records = []
+    for index, name in enumerate(names):
+        for era in range(1, ERAS + 1):
+            if era > 1 and rng.random() < 0.6:
+                records.append([name, era, owner_of(index + era), None, None, era - 1])
+                continue
+            for unit in range(UNITS_PER_ERA):
+                records.append([name, era, owner_of(index + era), f"Unit_{unit}", 1, None])
+    pd.DataFrame(
+        records, columns=["Planet", "Era", "Owner", "ObjectType", "Amount", "ReuseEra"]
+    ).to_csv(path, index=False)
+
+
+def write_submod(
+    root_dir: str, number: int, names: list, positions, rng: np.random.Generator
+) -> str:
+    """A submod layer that overrides the first planet file with moved planets and adds
+    a planet file of its own"""
+    data_folder = os.path.join(root_dir, "Submods", f"Submod_{number}", "Data")
+    xml_dir = os.path.join(data_folder, "XML")
+    os.makedirs(xml_dir, exist_ok=True)
+
+    override = et.Element("Planets")
+    for index in range(min(PLANETS_PER_FILE, len(names))):
+        planet_element(override, names[index], positions[index] + 1.0, rng)
+    write_xml(override, os.path.join(xml_dir, "Planets_000.XML"))
+
+    extra = et.Element("Planets")
+    for index in range(max(len(names) // 100, 1)):
+        name = f"Submod_{number}_Planet_{index:04d}"
+        planet_element(extra, name, rng.uniform(-50, 50, 2).round(2), rng)
+    write_xml(extra, os.path.join(xml_dir, f"Submod_{number}_Planets.XML"))
+
+    write_metafile(
+        xml_dir, "GameObjectFiles.XML", ["Planets_000.XML", f"Submod_{number}_Planets.XML"]
+    )
+    return data_folder
+
+
+def write_synthetic_mod(
+    root_dir: str, planets: int, campaigns: int = 5, submods: int = 0, seed: int = 0
+) -> SyntheticMod:
+    """Writes a mod with the given number of planets under root_dir"""
+    rng = np.random.default_rng(seed)
+    data_folder = os.path.join(root_dir, "Base", "Data")
+    xml_dir = os.path.join(data_folder, "XML")
+    os.makedirs(xml_dir, exist_ok=True)
+
+    names = [planet_name(index) for index in range(planets)]
+    positions = galaxy_positions(planets, rng)
+    routes = grid_routes(planets, rng)
+
+    planet_files = write_planet_files(xml_dir, names, positions, rng)
+    route_files, route_names = write_route_files(xml_dir, names, routes)
+    faction_files = write_faction_file(xml_dir)
+    campaign_files, campaign_sets = write_campaign_files(
+        xml_dir, names, routes, route_names, campaigns
+    )
+
+    write_metafile(xml_dir, "GameObjectFiles.XML", planet_files)
+    write_metafile(xml_dir, "TradeRouteFiles.XML", route_files)
+    write_metafile(xml_dir, "FactionFiles.XML", faction_files)
+    write_metafile(xml_dir, "CampaignFiles.XML", campaign_files)
+
+    library = os.path.join(root_dir, "StartingForcesLibrary.csv")
+    write_starting_forces_library(library, names, rng)
+
+    data_folders = [data_folder] + [
+        write_submod(root_dir, number, names, positions, rng) for number in range(1, submods + 1)
+    ]
+    return SyntheticMod(data_folders, library, names, route_names, campaign_sets)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output_dir")
+    parser.add_argument("--planets", type=int, default=10000)
+    parser.add_argument("--campaigns", type=int, default=5)
+    parser.add_argument("--submods", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mod = write_synthetic_mod(
+        args.output_dir, args.planets, args.campaigns, args.submods, args.seed
+    )
+    print("Data folders:", *mod.data_folders, sep="\n    ")
+    print("Starting forces library:", mod.starting_forces_library)
+    print(f"{len(mod.planet_names)} planets, {len(mod.route_names)} trade routes")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,6 +54,34 @@ class Config:
             "StartingForcesLibraryURL"
         ).text
 
+        # Size of the XML parsing pool: 0 uses one worker per CPU, 1 parses serially
+        workers_el = self.__configRoot.find("ParserWorkers")
+        if workers_el is not None and workers_el.text is not None:
+            self.parserWorkers = int(workers_el.text)
+        else:
+            self.parserWorkers = 0
+
+        processes_el = self.__configRoot.find("ParserUseProcesses")
+        self.parserUseProcesses = (
+            processes_el is not None
+            and processes_el.text is not None
+            and processes_el.text.strip().lower() in ("yes", "true")
+        )
+
+        # Folder for repository snapshots; an empty element disables the cache
+        cache_el = self.__configRoot.find("RepositoryCacheFolder")
+        if cache_el is None:
+            self.repositoryCacheFolder = ".pygceditor_cache"
+        else:
+            self.repositoryCacheFolder = (cache_el.text or "").strip()
+
+        hash_el = self.__configRoot.find("RepositoryCacheHashContents")
+        self.repositoryCacheHashContents = (
+            hash_el is not None
+            and hash_el.text is not None
+            and hash_el.text.strip().lower() in ("yes", "true")
+        )
+
         mod_path_el = self.__configRoot.find("ModPath")
 
         if mod_path_el is not None and mod_path_el.text is not None:
@@ -4,6 +4,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from config import Config
+from RepositoryCache import RepositoryCache
 from RepositoryCreator import RepositoryCreator
 
 
@@ -83,7 +84,11 @@ def main() -> int:
 
     config = Config()
     data_folders = [args.data_folder] if args.data_folder else config.dataFolders
-    repository = RepositoryCreator().constructRepository(
+    repository = RepositoryCreator(
+        config.parserWorkers,
+        config.parserUseProcesses,
+        RepositoryCache.fromConfig(config),
+    ).constructRepository(
         data_folders, config.startingForcesLibraryURL
     )
     export_campaigns(repository, Path(args.output))
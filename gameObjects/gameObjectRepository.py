@@ -1,12 +1,131 @@
-from typing import List, Optional, Set
+import os
+from collections.abc import Set as AbstractSet
+from typing import Callable, Dict, Generic, Iterator, List, Optional, Set, Tuple, TypeVar
 import pandas as pd
 
 from gameObjects.planet import Planet
+from gameObjects.planetTable import PlanetTable
 from gameObjects.traderoute import TradeRoute
 from gameObjects.campaign import Campaign
 from gameObjects.faction import Faction
 from gameObjects.aiplayer import AIPlayer
 
+T = TypeVar("T")
+
+# Index key functions live at module level so repositories can be pickled
+
+
+def nameKey(name: str) -> str:
+    """Case-folded lookup key for a game object name"""
+    return name.casefold()
+
+
+def objectNameKey(gameObject) -> str:
+    """Case-folded lookup key for a game object"""
+    return nameKey(gameObject.name)
+
+
+def objectExactName(gameObject) -> str:
+    """Exact name of a game object"""
+    return gameObject.name
+
+
+def campaignSetName(campaign: Campaign) -> str:
+    """Set name of a campaign"""
+    return campaign.setName
+
+
+def tradeRouteEndpoints(tradeRoute: TradeRoute) -> frozenset:
+    """Unordered pair of trade route endpoints"""
+    return frozenset((tradeRoute.start, tradeRoute.end))
+
+
+def fileKey(filePath: str) -> str:
+    """Normalised form of a file path, so paths from metafiles and directory walks compare equal"""
+    return os.path.normcase(os.path.abspath(filePath))
+
+
+class ObjectIndex(Generic[T]):
+    """Maps a key derived from each object to that object for constant time lookups.
+    When several objects share a key the first one added is returned.
+    Objects whose key changes after being added must be removed and added again."""
+
+    def __init__(self, keyFunction: Callable[[T], object]):
+        self.__keyFunction = keyFunction
+        self.__keys: Dict[T, object] = dict()
+        self.__objects: Dict[object, T] = dict()
+        self.__counts: Dict[object, int] = dict()
+
+    def add(self, gameObject: T) -> None:
+        if gameObject in self.__keys:
+            return
+
+        key = self.__keyFunction(gameObject)
+        self.__keys[gameObject] = key
+        self.__objects.setdefault(key, gameObject)
+        self.__counts[key] = self.__counts.get(key, 0) + 1
+
+    def remove(self, gameObject: T) -> None:
+        """Removes an object using the key it was added with"""
+        if gameObject not in self.__keys:
+            return
+
+        key = self.__keys.pop(gameObject)
+        self.__counts[key] -= 1
+        if self.__counts[key] == 0:
+            del self.__counts[key]
+            del self.__objects[key]
+        elif self.__objects[key] is gameObject:
+            # Another object shares the key, fall back to the next oldest one
+            self.__objects[key] = next(o for o, k in self.__keys.items() if k == key)
+
+    def get(self, key) -> Optional[T]:
+        return self.__objects.get(key)
+
+    def clear(self) -> None:
+        self.__keys.clear()
+        self.__objects.clear()
+        self.__counts.clear()
+
+
+class SetView(AbstractSet, Generic[T]):
+    """Read-only live view of a set. Nothing is copied, so the view reflects
+    later changes to the underlying set"""
+
+    __slots__ = ("__items",)
+
+    def __init__(self, items: Set[T]):
+        self.__items = items
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> Set[T]:
+        # Set operators such as & and | return plain sets
+        return set(iterable)
+
+    def __contains__(self, item) -> bool:
+        return item in self.__items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__items)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __repr__(self) -> str:
+        return "SetView(" + repr(self.__items) + ")"
+
+    def copy(self) -> Set[T]:
+        return set(self.__items)
+
+    def intersection(self, *others) -> Set[T]:
+        return self.__items.intersection(*others)
+
+    def union(self, *others) -> Set[T]:
+        return self.__items.union(*others)
+
+    def difference(self, *others) -> Set[T]:
+        return self.__items.difference(*others)
+
 
 class GameObjectRepository:
     """Repository of GameObjects. Has campaigns, planets and traderoutes"""
@@ -18,76 +137,103 @@ class GameObjectRepository:
         self.__factions: Set[Faction] = set()
         self.__aiplayers: Set[AIPlayer] = set()
         self.__startingForcesLibrary: Optional[pd.DataFrame] = None
+        self.__planetTable: PlanetTable = PlanetTable()
+
+        self.__campaignsByName: ObjectIndex[Campaign] = ObjectIndex(objectNameKey)
+        self.__campaignsBySetName: ObjectIndex[Campaign] = ObjectIndex(campaignSetName)
+        self.__planetsByName: ObjectIndex[Planet] = ObjectIndex(objectNameKey)
+        self.__planetsByExactName: ObjectIndex[Planet] = ObjectIndex(objectExactName)
+        self.__tradeRoutesByName: ObjectIndex[TradeRoute] = ObjectIndex(objectNameKey)
+        self.__tradeRoutesByPlanets: ObjectIndex[TradeRoute] = ObjectIndex(
+            tradeRouteEndpoints
+        )
+        self.__factionsByName: ObjectIndex[Faction] = ObjectIndex(objectNameKey)
+        self.__factionsByExactName: ObjectIndex[Faction] = ObjectIndex(objectExactName)
+
+        # Source file -> (kind of file, objects loaded from it), used for incremental reloads
+        self.__fileObjects: Dict[str, Tuple[str, list]] = dict()
 
     def addCampaign(self, campaign: Campaign) -> None:
         """Add a Campaign to the repository"""
         self.__campaigns.add(campaign)
+        self.__campaignsByName.add(campaign)
+        self.__campaignsBySetName.add(campaign)
 
     def removeCampaign(self, campaign: Campaign) -> None:
         """Remove a Campaign from the repository"""
         self.__campaigns.remove(campaign)
+        self.__campaignsByName.remove(campaign)
+        self.__campaignsBySetName.remove(campaign)
 
     def addPlanet(self, planet: Planet) -> None:
-        """Add a Planet to the repository"""
+        """Add a Planet to the repository, moving its attributes into the planet table"""
         self.__planets.add(planet)
+        self.__planetTable.addPlanet(planet)
+        self.__planetsByName.add(planet)
+        self.__planetsByExactName.add(planet)
 
     def removePlanet(self, planet: Planet) -> None:
         """Remove a Planet from the repository"""
         self.__planets.remove(planet)
+        self.__planetTable.removePlanet(planet)
+        self.__planetsByName.remove(planet)
+        self.__planetsByExactName.remove(planet)
+
+    def findCampaign(self, name: str) -> Optional[Campaign]:
+        """Returns a campaign by case-insensitive name, or None if there is none"""
+        return self.__campaignsByName.get(nameKey(name))
+
+    def findPlanet(self, name: str) -> Optional[Planet]:
+        """Returns a planet by case-insensitive name, or None if there is none"""
+        return self.__planetsByName.get(nameKey(name))
+
+    def findTradeRoute(self, name: str) -> Optional[TradeRoute]:
+        """Returns a trade route by case-insensitive name, or None if there is none"""
+        return self.__tradeRoutesByName.get(nameKey(name))
+
+    def findFaction(self, name: str) -> Optional[Faction]:
+        """Returns a faction by case-insensitive name, or None if there is none"""
+        return self.__factionsByName.get(nameKey(name))
 
     def planetExists(self, name: str) -> bool:
         """Returns true if a planet exists by name, false otherwise"""
-        try:
-            self.getPlanetByName(name)
-            return True
-        except RuntimeError:
-            return False
+        return self.__planetsByExactName.get(name) is not None
 
     def tradeRouteExists(self, startName: str, endName: str) -> bool:
-        """Returns true if a planet exists by name, false otherwise"""
-        try:
-            self.getTradeRouteByPlanets(
-                self.getPlanetByName(startName), self.getPlanetByName(endName)
-            )
-            return True
-        except RuntimeError:
+        """Returns true if a trade route exists between two planets given by name, false otherwise"""
+        start = self.__planetsByExactName.get(startName)
+        end = self.__planetsByExactName.get(endName)
+        if start is None or end is None:
             return False
+        return self.__tradeRoutesByPlanets.get(frozenset((start, end))) is not None
 
     def getCampaignBySetName(self, setName: str) -> Campaign:
-        """Returns a planet object given its name"""
-        for campaign in self.campaigns:
-            if campaign.setName == setName:
-                return campaign
-
-        raise RuntimeError("Searching for non existant campaign set " + setName)
+        """Returns a campaign object given its set name"""
+        campaign = self.__campaignsBySetName.get(setName)
+        if campaign is None:
+            raise RuntimeError("Searching for non existant campaign set " + setName)
+        return campaign
 
     def getPlanetByName(self, name: str) -> Planet:
         """Returns a planet object given its name"""
-        for planet in self.planets:
-            if planet.name == name:
-                return planet
-
-        raise RuntimeError("Searching for non existing planet " + name)
+        planet = self.__planetsByExactName.get(name)
+        if planet is None:
+            raise RuntimeError("Searching for non existing planet " + name)
+        return planet
 
     def getFactionByName(self, name: str) -> Faction:
-        """Returns a planet object given its name"""
-        for faction in self.factions:
-            if faction.name == name:
-                return faction
-
-        raise RuntimeError("Searching for non existing faction " + name)
+        """Returns a faction object given its name"""
+        faction = self.__factionsByExactName.get(name)
+        if faction is None:
+            raise RuntimeError("Searching for non existing faction " + name)
+        return faction
 
     def getTradeRouteByPlanets(self, start: Planet, end: Planet) -> TradeRoute:
-        """Returns a traderoute object given its start and end planets"""
-        for tradeRoute in self.tradeRoutes:
-            if (tradeRoute.start == start) and (tradeRoute.end == end):
-                return tradeRoute
-
-        for tradeRoute in self.tradeRoutes:
-            if (tradeRoute.start == end) and (tradeRoute.end == start):
-                return tradeRoute
-
-        raise RuntimeError("Searching for non existing Trade Route")
+        """Returns a traderoute object given its start and end planets, in either direction"""
+        tradeRoute = self.__tradeRoutesByPlanets.get(frozenset((start, end)))
+        if tradeRoute is None:
+            raise RuntimeError("Searching for non existing Trade Route")
+        return tradeRoute
 
     def getPlanetNames(self) -> List[str]:
         """Returns a list containing all Planet names"""
@@ -96,18 +242,26 @@ class GameObjectRepository:
     def addTradeRoute(self, tradeRoute: TradeRoute) -> None:
         """Add a TradeRoute to the repository"""
         self.__tradeRoutes.add(tradeRoute)
+        self.__tradeRoutesByName.add(tradeRoute)
+        self.__tradeRoutesByPlanets.add(tradeRoute)
 
     def removeTradeRoute(self, tradeRoute: TradeRoute) -> None:
         """Remove a TradeRoute from the repository"""
         self.__tradeRoutes.remove(tradeRoute)
+        self.__tradeRoutesByName.remove(tradeRoute)
+        self.__tradeRoutesByPlanets.remove(tradeRoute)
 
     def addFaction(self, faction: Faction) -> None:
         """Add a Faction to the repository"""
         self.__factions.add(faction)
+        self.__factionsByName.add(faction)
+        self.__factionsByExactName.add(faction)
 
     def removeFaction(self, faction: Faction) -> None:
         """Remove a Faction from the repository"""
         self.__factions.remove(faction)
+        self.__factionsByName.remove(faction)
+        self.__factionsByExactName.remove(faction)
 
     def addAIPlayer(self, aiplayer: AIPlayer) -> None:
         """Add an AI Player to the repository"""
@@ -117,6 +271,24 @@ class GameObjectRepository:
         """Remove an AI Player from the repository"""
         self.__aiplayers.remove(aiplayer)
 
+    def setFileObjects(self, filePath: str, kind: str, gameObjects) -> None:
+        """Records the kind of an input file and the game objects that were loaded from it"""
+        self.__fileObjects[fileKey(filePath)] = (kind, list(gameObjects))
+
+    def getFileObjects(self, filePath: str) -> Optional[Tuple[str, list]]:
+        """Returns (kind, objects) for an input file, or None if nothing was loaded from it"""
+        return self.__fileObjects.get(fileKey(filePath))
+
+    def getFilePaths(self, kind: str) -> List[str]:
+        """Returns the normalised paths of the input files of a kind"""
+        return [path for path, (k, _) in self.__fileObjects.items() if k == kind]
+
+    def discardFileObjects(self, gameObjects) -> None:
+        """Forgets game objects in the input files they were loaded from"""
+        gameObjects = set(gameObjects)
+        for _, fileObjects in self.__fileObjects.values():
+            fileObjects[:] = [o for o in fileObjects if o not in gameObjects]
+
     def emptyRepository(self) -> None:
         """Empty the repository"""
         self.__campaigns.clear()
@@ -124,26 +296,42 @@ class GameObjectRepository:
         self.__planets.clear()
         self.__factions.clear()
         self.__aiplayers.clear()
+        self.__campaignsByName.clear()
+        self.__campaignsBySetName.clear()
+        self.__planetsByName.clear()
+        self.__planetsByExactName.clear()
+        self.__tradeRoutesByName.clear()
+        self.__tradeRoutesByPlanets.clear()
+        self.__factionsByName.clear()
+        self.__factionsByExactName.clear()
+        self.__fileObjects.clear()
+        # Removed planets keep their rows in the old table, so they stay usable
+        self.__planetTable = PlanetTable()
+
+    @property
+    def campaigns(self) -> SetView[Campaign]:
+        return SetView(self.__campaigns)
 
     @property
-    def campaigns(self) -> Set[Campaign]:
-        return set(self.__campaigns)
+    def planets(self) -> SetView[Planet]:
+        return SetView(self.__planets)
 
     @property
-    def planets(self) -> Set[Planet]:
-        return set(self.__planets)
+    def planetTable(self) -> PlanetTable:
+        """Columnar attributes of every planet in the repository"""
+        return self.__planetTable
 
     @property
-    def tradeRoutes(self) -> Set[TradeRoute]:
-        return set(self.__tradeRoutes)
+    def tradeRoutes(self) -> SetView[TradeRoute]:
+        return SetView(self.__tradeRoutes)
 
     @property
-    def factions(self) -> Set[Faction]:
-        return set(self.__factions)
+    def factions(self) -> SetView[Faction]:
+        return SetView(self.__factions)
 
     @property
-    def aiplayers(self) -> Set[AIPlayer]:
-        return set(self.__aiplayers)
+    def aiplayers(self) -> SetView[AIPlayer]:
+        return SetView(self.__aiplayers)
 
     @property
     def startingForcesLibrary(self) -> Optional[pd.DataFrame]:
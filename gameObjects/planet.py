@@ -1,26 +1,43 @@
-from math import sqrt
+from math import isnan, sqrt
+from typing import Optional
+
+from gameObjects.planetTable import PlanetTable
 
 """Planet class definition"""
 
 
 class Planet:
-    """Planets have a name and location (x, y), starbase level, shipyard and special structure slots"""
+    """Planets have a name and location (x, y), starbase level, shipyard and special structure slots.
+    The numeric attributes are stored in a row of a PlanetTable. Without a table a new planet gets
+    one of its own until it is added to a repository"""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, table: Optional[PlanetTable] = None):
         self.__name: str = name
         self.__variantOf: str = ""
-        self.__x: float = 0.0
-        self.__y: float = 0.0
-        self.__starbaseLevel: int = 0
-        self.__spaceStructureSlots: int = 0
         self.__shipyardLevel: str = ""
         self.__SupportsStructure: str = ""
-        self.__groundStructureSlots: int = 0
-        self.__income: int = 0
+        self.__table: PlanetTable = None
+        self.__row: int = -1
+        if table is None:
+            table = PlanetTable(capacity=1)
+        table.addPlanet(self)
+
+    def _bind(self, table: PlanetTable, row: int) -> None:
+        """Called by PlanetTable when this planet's row is created or moved"""
+        self.__table = table
+        self.__row = row
 
     def distanceTo(self, target):
         return sqrt((self.x - target.x) ** 2 + (self.y - target.y) ** 2)
 
+    @property
+    def table(self) -> PlanetTable:
+        return self.__table
+
+    @property
+    def row(self) -> int:
+        return self.__row
+
     @property
     def name(self) -> str:
         return self.__name
@@ -28,7 +45,9 @@ class Planet:
     @name.setter
     def name(self, value: str) -> None:
         if value:
+            oldName = self.__name
             self.__name = value
+            self.__table.renamePlanet(self, oldName)
 
     @property
     def variantOf(self) -> str:
@@ -41,35 +60,37 @@ class Planet:
 
     @property
     def x(self) -> float:
-        return self.__x
+        value = self.__table.get("x", self.__row)
+        return None if isnan(value) else value
 
     @x.setter
     def x(self, value: float) -> None:
-        self.__x = value
+        self.__table.set("x", self.__row, float("nan") if value is None else value)
 
     @property
     def y(self) -> float:
-        return self.__y
+        value = self.__table.get("y", self.__row)
+        return None if isnan(value) else value
 
     @y.setter
     def y(self, value: float) -> None:
-        self.__y = value
+        self.__table.set("y", self.__row, float("nan") if value is None else value)
 
     @property
     def starbaseLevel(self) -> int:
-        return self.__starbaseLevel
+        return self.__table.get("starbaseLevel", self.__row)
 
     @starbaseLevel.setter
     def starbaseLevel(self, value: int) -> None:
-        self.__starbaseLevel = value
+        self.__table.set("starbaseLevel", self.__row, value)
 
     @property
     def spaceStructureSlots(self) -> int:
-        return self.__spaceStructureSlots
+        return self.__table.get("spaceStructureSlots", self.__row)
 
     @spaceStructureSlots.setter
     def spaceStructureSlots(self, value: int) -> None:
-        self.__spaceStructureSlots = value
+        self.__table.set("spaceStructureSlots", self.__row, value)
 
     @property
     def shipyardLevel(self) -> str:
@@ -91,16 +112,16 @@ class Planet:
 
     @property
     def groundStructureSlots(self) -> int:
-        return self.__groundStructureSlots
+        return self.__table.get("groundStructureSlots", self.__row)
 
     @groundStructureSlots.setter
     def groundStructureSlots(self, value: int) -> None:
-        self.__groundStructureSlots = value
+        self.__table.set("groundStructureSlots", self.__row, value)
 
     @property
     def income(self) -> int:
-        return self.__income
+        return self.__table.get("income", self.__row)
 
     @income.setter
     def income(self, value: int) -> None:
-        self.__income = value
+        self.__table.set("income", self.__row, value)
@@ -0,0 +1,133 @@
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+"""Columnar planet storage"""
+
+FLOAT_COLUMNS = ("x", "y")
+INT_COLUMNS = ("starbaseLevel", "spaceStructureSlots", "groundStructureSlots", "income")
+
+
+class PlanetTable:
+    """Stores the numeric planet attributes in contiguous NumPy arrays, one row per planet.
+    Planet objects are views onto a row, and a planet belongs to exactly one table:
+    adding it to another table moves its row there. Removing a row moves the last
+    row into its place, so rows stay contiguous"""
+
+    def __init__(self, capacity: int = 16):
+        self.__size: int = 0
+        self.__columns: Dict[str, np.ndarray] = dict()
+        for name in FLOAT_COLUMNS:
+            self.__columns[name] = np.zeros(capacity, dtype=np.float64)
+        for name in INT_COLUMNS:
+            self.__columns[name] = np.zeros(capacity, dtype=np.int64)
+        self.__planets: list = list()
+        self.__planetsByName: dict = dict()
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def addPlanet(self, planet) -> int:
+        """Moves a planet's row into this table and returns its new row"""
+        oldTable = planet.table
+        if oldTable is self:
+            return planet.row
+
+        if self.__size == len(self.__columns["x"]):
+            self.__grow()
+
+        row = self.__size
+        for name, column in self.__columns.items():
+            # New planets start out with every attribute at zero
+            column[row] = 0 if oldTable is None else oldTable.__columns[name][planet.row]
+        self.__size += 1
+        self.__planets.append(planet)
+        self.__planetsByName.setdefault(planet.name, planet)
+
+        if oldTable is not None:
+            oldTable.__release(planet)
+        planet._bind(self, row)
+        return row
+
+    def removePlanet(self, planet) -> None:
+        """Moves a planet out of this table into storage of its own, so it stays usable"""
+        if planet.table is self:
+            PlanetTable(capacity=1).addPlanet(planet)
+
+    def rowOf(self, name: str) -> Optional[int]:
+        """Returns the row of the first planet added with this name, or None"""
+        planet = self.__planetsByName.get(name)
+        return None if planet is None else planet.row
+
+    def rowsOf(self, planets: Iterable) -> np.ndarray:
+        """Returns the rows of planets stored in this table, in the given order"""
+        return np.fromiter((planet.row for planet in planets), dtype=np.intp)
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns a view of one attribute for all rows. Writing to it updates the planets"""
+        return self.__columns[name][: self.__size]
+
+    def get(self, name: str, row: int):
+        return self.__columns[name].item(row)
+
+    def set(self, name: str, row: int, value) -> None:
+        self.__columns[name][row] = value
+
+    def renamePlanet(self, planet, oldName: str) -> None:
+        """Keeps the name index in step when a planet is renamed"""
+        self.__unindex(planet, oldName)
+        self.__planetsByName.setdefault(planet.name, planet)
+
+    @property
+    def planets(self) -> List:
+        """Planets in row order"""
+        return list(self.__planets)
+
+    def __grow(self) -> None:
+        for name, column in self.__columns.items():
+            grown = np.zeros(max(2 * len(column), 16), dtype=column.dtype)
+            grown[: self.__size] = column[: self.__size]
+            self.__columns[name] = grown
+
+    def __release(self, planet) -> None:
+        """Drops a planet's row by moving the last row into it"""
+        row = planet.row
+        last = self.__size - 1
+        if row != last:
+            for column in self.__columns.values():
+                column[row] = column[last]
+            moved = self.__planets[last]
+            self.__planets[row] = moved
+            moved._bind(self, row)
+        self.__planets.pop()
+        self.__size -= 1
+        self.__unindex(planet, planet.name)
+
+    def __unindex(self, planet, name: str) -> None:
+        if self.__planetsByName.get(name) is not planet:
+            return
+
+        del self.__planetsByName[name]
+        for other in self.__planets:
+            if other is not planet and other.name == name:
+                self.__planetsByName[name] = other
+                break
+
+
+def planetColumns(planets: Iterable, *names: str) -> List[np.ndarray]:
+    """Returns one array per attribute name with an entry per planet, in order.
+    Planets that share a table are read with a single fancy index per column"""
+    planets = list(planets)
+    tables = {id(planet.table) for planet in planets}
+    if len(tables) == 1:
+        table = planets[0].table
+        rows = table.rowsOf(planets)
+        return [table.column(name)[rows] for name in names]
+
+    return [
+        np.array(
+            [planet.table.get(name, planet.row) for planet in planets],
+            dtype=np.float64 if name in FLOAT_COLUMNS else np.int64,
+        )
+        for name in names
+    ]
@@ -13,6 +13,7 @@ from ui.DialogFactory import DialogFactory
 from ui.mainwindow_presenter import MainWindowPresenter
 from ui.planetcontextmenu import PlanetContextMenu
 from ui.qtmainwindow import QtMainWindow
+from RepositoryCache import RepositoryCache
 from RepositoryCreator import RepositoryCreator
 
 
@@ -27,7 +28,11 @@ def main(argv=None, start_event_loop: bool = True) -> int:
 
     app = QApplication([])
 
-    repositoryCreator: RepositoryCreator = RepositoryCreator()
+    repositoryCreator: RepositoryCreator = RepositoryCreator(
+        config.parserWorkers,
+        config.parserUseProcesses,
+        RepositoryCache.fromConfig(config),
+    )
     repository = repositoryCreator.constructRepository(
         dataFolders, config.startingForcesLibraryURL
     )
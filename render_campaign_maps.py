@@ -0,0 +1,213 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+import numpy as np
+
+from config import Config
+from DisplayHelpers import DisplayHelpers
+from export_campaign_planets_lua import safe_file_name
+from gameObjects.planetTable import planetColumns
+from GalaxyStyle import (
+    BACKGROUND_PLANET_ALPHA,
+    BACKGROUND_PLANET_COLOR,
+    TRADE_ROUTE_COLOR,
+    planetColors,
+)
+from RepositoryCache import RepositoryCache
+from RepositoryCreator import RepositoryCreator
+
+FORMATS = ("png", "svg")
+
+# Planet coordinates shared with the rendering processes, set by attach_coordinates
+_coordinates = None
+_shared = None
+
+
+@dataclass
+class MapJob:
+    """Everything one worker needs to render a campaign besides the planet coordinates:
+    rows of the campaign planets with their colors and the rows joined by trade routes"""
+
+    output_path: str
+    title: str
+    planets: np.ndarray
+    face_colors: np.ndarray
+    edge_colors: np.ndarray
+    routes: np.ndarray
+    size: float
+    dpi: int
+
+
+def share_coordinates(coordinates: np.ndarray) -> shared_memory.SharedMemory:
+    """Copies the (n, 2) planet coordinates into a new shared memory block"""
+    shared = shared_memory.SharedMemory(create=True, size=max(coordinates.nbytes, 1))
+    np.ndarray(coordinates.shape, dtype=np.float64, buffer=shared.buf)[:] = coordinates
+    return shared
+
+
+def attach_coordinates(name: str, count: int) -> None:
+    """Maps the shared planet coordinates read-only into this process"""
+    global _coordinates, _shared
+    _shared = shared_memory.SharedMemory(name=name)
+    _coordinates = np.ndarray((count, 2), dtype=np.float64, buffer=_shared.buf)
+    _coordinates.flags.writeable = False
+
+
+def detach_coordinates() -> None:
+    """Drops this process's view of the shared planet coordinates"""
+    global _coordinates, _shared
+    _coordinates = None
+    _shared.close()
+    _shared = None
+
+
+def campaign_map_jobs(
+    repository, output_dir: Path, image_format: str, size: float, dpi: int
+) -> tuple:
+    """Returns the planet coordinates of the repository and a MapJob for every campaign"""
+    planets = sorted(repository.planets, key=lambda planet: planet.name)
+    rows = {planet: row for row, planet in enumerate(planets)}
+    x, y = planetColumns(planets, "x", "y")
+
+    campaigns = sorted(repository.campaigns, key=lambda campaign: campaign.name)
+    helper = DisplayHelpers(repository, campaigns)
+    jobs = []
+    for index, campaign in enumerate(campaigns):
+        campaign_planets = [planet for planet in campaign.planets if planet in rows]
+        try:
+            owners = helper.getPlanetOwners(index, campaign_planets)
+        except RuntimeError as error:
+            print(error, "Planets of", campaign.name, "are drawn unowned")
+            owners = [None] * len(campaign_planets)
+        colors = [planetColors(owner) for owner in owners]
+
+        routes = [
+            (rows[route.start], rows[route.end])
+            for route in campaign.tradeRoutes
+            if route is not None and route.start in rows and route.end in rows
+        ]
+        jobs.append(
+            MapJob(
+                str(output_dir / f"{safe_file_name(campaign.name)}.{image_format}"),
+                campaign.name,
+                np.array([rows[planet] for planet in campaign_planets], dtype=np.intp),
+                np.array([face for face, _ in colors]).reshape(-1, 4),
+                np.array([edge for _, edge in colors]).reshape(-1, 4),
+                np.array(routes, dtype=np.intp).reshape(-1, 2),
+                size,
+                dpi,
+            )
+        )
+
+    return np.column_stack([x, y]), jobs
+
+
+def render_map(job: MapJob) -> str:
+    """Draws a campaign over all planets with the Agg or SVG backend and saves it"""
+    figure = Figure(figsize=(job.size, job.size), dpi=job.dpi)
+    axes = figure.add_subplot(111, aspect="equal")
+    axes.set_title(job.title)
+
+    axes.scatter(
+        _coordinates[:, 0],
+        _coordinates[:, 1],
+        c=BACKGROUND_PLANET_COLOR,
+        alpha=BACKGROUND_PLANET_ALPHA,
+        zorder=2,
+    )
+    axes.add_collection(
+        LineCollection(
+            _coordinates[job.routes], colors=[TRADE_ROUTE_COLOR], linewidths=1.0, zorder=1
+        )
+    )
+    campaign = _coordinates[job.planets]
+    axes.scatter(
+        campaign[:, 0],
+        campaign[:, 1],
+        facecolors=job.face_colors,
+        edgecolors=job.edge_colors,
+        zorder=4,
+    )
+
+    # Fit the view to the campaign, or to the galaxy for campaigns without planets
+    shown = campaign if np.isfinite(campaign).all(axis=1).any() else _coordinates
+    shown = shown[np.isfinite(shown).all(axis=1)]
+    if len(shown):
+        low = shown.min(axis=0)
+        high = shown.max(axis=0)
+        margin = max((high - low).max() * 0.05, 1.0)
+        axes.set_xlim(low[0] - margin, high[0] + margin)
+        axes.set_ylim(low[1] - margin, high[1] + margin)
+
+    figure.savefig(job.output_path)
+    return job.output_path
+
+
+def render_campaign_maps(
+    repository,
+    output_dir: Path,
+    image_format: str = "png",
+    workers: int = 0,
+    size: float = 12.0,
+    dpi: int = 150,
+) -> list:
+    """Renders every campaign of the repository to output_dir and returns the image paths.
+    workers sets the size of the process pool: 0 uses one process per CPU, 1 renders here"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    coordinates, jobs = campaign_map_jobs(repository, output_dir, image_format, size, dpi)
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+
+    shared = share_coordinates(coordinates)
+    try:
+        if workers <= 1 or len(jobs) <= 1:
+            attach_coordinates(shared.name, len(coordinates))
+            try:
+                return [Path(render_map(job)) for job in jobs]
+            finally:
+                detach_coordinates()
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)),
+            initializer=attach_coordinates,
+            initargs=(shared.name, len(coordinates)),
+        ) as executor:
+            return [Path(path) for path in executor.map(render_map, jobs)]
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Renders a map image of every campaign")
+    parser.add_argument("data_folder", nargs="?")
+    parser.add_argument("-o", "--output", default="campaign_maps")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="png")
+    parser.add_argument("-w", "--workers", type=int, default=0, help="0 for one per CPU")
+    parser.add_argument("--size", type=float, default=12.0, help="image size in inches")
+    parser.add_argument("--dpi", type=int, default=150)
+    args = parser.parse_args()
+
+    config = Config()
+    data_folders = [args.data_folder] if args.data_folder else config.dataFolders
+    repository = RepositoryCreator(
+        config.parserWorkers,
+        config.parserUseProcesses,
+        RepositoryCache.fromConfig(config),
+    ).constructRepository(
+        data_folders, config.startingForcesLibraryURL
+    )
+    for path in render_campaign_maps(
+        repository, Path(args.output), args.format, args.workers, args.size, args.dpi
+    ):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
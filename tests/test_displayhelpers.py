@@ -1,3 +1,5 @@
+import pandas as pd
+
 from DisplayHelpers import DisplayHelpers
 from gameObjects.campaign import Campaign
 from gameObjects.faction import Faction
@@ -37,3 +39,80 @@ def test_calculate_faction_income_empty_returns_empty_dict() -> None:
     totals = helper.calculateFactionIncome(planets=[], planet_owners=[])
 
     assert totals == {}
+
+
+def make_owner_repository() -> GameObjectRepository:
+    repository = GameObjectRepository()
+    for name in ["Empire", "Rebel", "Neutral"]:
+        repository.addFaction(Faction(name))
+    return repository
+
+
+def test_planet_owners_prefer_the_campaign_era_and_follow_planet_order() -> None:
+    repository = make_owner_repository()
+    campaign = Campaign("GC")
+    campaign.startingForces = pd.DataFrame(
+        [
+            ["Kuat", 2, "Rebel", "Unit", 1],
+            ["kuat", 1, "Empire", "Unit", 1],
+            ["Byss", 2, "Rebel", "Unit", 1],
+            ["Dantooine", 1, "Pirates", "Unit", 1],
+        ],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount"],
+    )
+    helper = DisplayHelpers(repository, [campaign])
+    planets = [Planet("Byss"), Planet("Kuat"), Planet("Dantooine"), Planet("Alderaan")]
+
+    owners = helper.getPlanetOwners(0, planets)
+
+    # Byss has no era 1 row, unknown owners and planets without forces are Neutral
+    assert [owner.name for owner in owners] == ["Rebel", "Empire", "Neutral", "Neutral"]
+
+
+def test_planet_owner_index_is_rebuilt_when_starting_forces_change() -> None:
+    repository = make_owner_repository()
+    campaign = Campaign("GC")
+    columns = ["Planet", "Era", "Owner", "ObjectType", "Amount"]
+    campaign.startingForces = pd.DataFrame([["Kuat", 1, "Empire", "Unit", 1]], columns=columns)
+    helper = DisplayHelpers(repository, [campaign])
+    kuat = Planet("Kuat")
+
+    assert helper.getPlanetOwners(0, [kuat])[0].name == "Empire"
+
+    campaign.startingForces = pd.DataFrame([["Kuat", 1, "Rebel", "Unit", 1]], columns=columns)
+
+    assert helper.getPlanetOwners(0, [kuat])[0].name == "Rebel"
+
+
+def test_planet_owner_index_is_rebuilt_after_an_owner_edit() -> None:
+    repository = make_owner_repository()
+    campaign = Campaign("GC")
+    columns = ["Planet", "Era", "Owner", "ObjectType", "Amount"]
+    campaign.startingForces = pd.DataFrame([["Kuat", 1, "Empire", "Unit", 1]], columns=columns)
+    helper = DisplayHelpers(repository, [campaign])
+    kuat = Planet("Kuat")
+    assert helper.getPlanetOwners(0, [kuat])[0].name == "Empire"
+
+    # The Forces tab edits the same frame in place
+    campaign.startingForces.iat[0, 2] = "Rebel"
+    helper.forgetOwners(campaign)
+
+    assert helper.getPlanetOwners(0, [kuat])[0].name == "Rebel"
+
+
+def test_owner_edit_rebuilds_campaigns_sharing_the_starting_forces() -> None:
+    repository = make_owner_repository()
+    columns = ["Planet", "Era", "Owner", "ObjectType", "Amount"]
+    # importStartingForcesAll gives every campaign the same library frame
+    forces = pd.DataFrame([["Kuat", 1, "Empire", "Unit", 1]], columns=columns)
+    campaigns = [Campaign("GC"), Campaign("Other GC")]
+    for campaign in campaigns:
+        campaign.startingForces = forces
+    helper = DisplayHelpers(repository, campaigns)
+    kuat = Planet("Kuat")
+    assert [helper.getPlanetOwners(i, [kuat])[0].name for i in range(2)] == ["Empire"] * 2
+
+    forces.iat[0, 2] = "Rebel"
+    helper.forgetOwners(campaigns[0])
+
+    assert [helper.getPlanetOwners(i, [kuat])[0].name for i in range(2)] == ["Rebel"] * 2
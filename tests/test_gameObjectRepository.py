@@ -122,14 +122,24 @@ def test_remove_methods_and_empty_repository(repo):
     assert len(repo.aiplayers) == 0
 
 
-def test_property_sets_are_returned_as_copies(repo):
+def test_property_sets_are_read_only_live_views(repo):
     planet = Planet("Alderaan")
     repo.addPlanet(planet)
 
-    external = repo.planets
-    external.clear()
+    view = repo.planets
+    assert not hasattr(view, "clear")
+    assert not hasattr(view, "add")
 
-    # Repository should be unchanged because property returns a copy.
+    # The view reflects later changes without being requested again.
+    other = Planet("Kuat")
+    repo.addPlanet(other)
+    assert view == {planet, other}
+    assert len(view) == 2
+    assert view & {planet} == {planet}
+    assert view.intersection({other}) == {other}
+
+    copy = view.copy()
+    copy.clear()
     assert repo.getPlanetByName("Alderaan") is planet
 
 
@@ -149,3 +159,69 @@ def test_get_planet_names_and_starting_forces_library(repo):
     # None should be accepted by the setter.
     repo.startingForcesLibrary = None
     assert repo.startingForcesLibrary is None
+
+
+def test_find_methods_are_case_insensitive(repo):
+    campaign = Campaign("GC_Progressive")
+    planet = Planet("Alderaan")
+    route = make_route("CorellianRun", planet, Planet("Kuat"))
+    faction = Faction("Empire")
+
+    repo.addCampaign(campaign)
+    repo.addPlanet(planet)
+    repo.addTradeRoute(route)
+    repo.addFaction(faction)
+
+    assert repo.findCampaign("gc_progressive") is campaign
+    assert repo.findPlanet("ALDERAAN") is planet
+    assert repo.findTradeRoute("corellianrun") is route
+    assert repo.findFaction("EMPIRE") is faction
+    assert repo.findPlanet("Bespin") is None
+
+
+def test_name_index_follows_add_and_remove(repo):
+    first = Planet("Byss")
+    second = Planet("BYSS")
+    repo.addPlanet(first)
+    repo.addPlanet(second)
+
+    assert repo.findPlanet("byss") is first
+
+    repo.removePlanet(first)
+    assert repo.findPlanet("byss") is second
+
+    repo.removePlanet(second)
+    assert repo.findPlanet("byss") is None
+
+
+def test_name_index_handles_renamed_objects(repo):
+    campaign = Campaign("Old")
+    repo.addCampaign(campaign)
+
+    campaign.name = "New"
+    repo.removeCampaign(campaign)
+    repo.addCampaign(campaign)
+
+    assert repo.findCampaign("old") is None
+    assert repo.findCampaign("new") is campaign
+
+
+def test_trade_route_pair_index_follows_add_and_remove(repo):
+    a, b, c = Planet("A"), Planet("B"), Planet("C")
+    for planet in (a, b, c):
+        repo.addPlanet(planet)
+    first = make_route("AB", a, b)
+    second = make_route("BA", b, a)
+    repo.addTradeRoute(first)
+    repo.addTradeRoute(second)
+
+    assert repo.getTradeRouteByPlanets(b, a) is first
+    assert not repo.tradeRouteExists("A", "C")
+
+    repo.removeTradeRoute(first)
+    assert repo.getTradeRouteByPlanets(a, b) is second
+
+    repo.removeTradeRoute(second)
+    assert not repo.tradeRouteExists("A", "B")
+    with pytest.raises(RuntimeError):
+        repo.getTradeRouteByPlanets(a, b)
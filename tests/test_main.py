@@ -52,7 +52,7 @@ def _build_dummy_repository() -> GameObjectRepository:
 
 
 class DummyRepositoryCreator:
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         self.repository = _build_dummy_repository()
 
     def constructRepository(self, data_folders, starting_forces_library_url):
@@ -0,0 +1,215 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from PyQt6.QtCore import Qt
+
+from gameObjects.campaign import Campaign
+from gameObjects.faction import Faction
+from gameObjects.gameObjectRepository import GameObjectRepository
+from gameObjects.planet import Planet
+from gameObjects.traderoute import TradeRoute
+from ui.mainwindow_presenter import MainWindowPresenter
+from ui.qtPandasModel import PandasModel
+from ui.refreshscheduler import RefreshScheduler
+
+
+def make_repository(count: int = 4) -> GameObjectRepository:
+    repository = GameObjectRepository()
+    empire = Faction("Empire")
+    repository.addFaction(empire)
+    repository.addFaction(Faction("Neutral"))
+    repository.addFaction(Faction("Rebel"))
+
+    planets = []
+    for i in range(count):
+        planet = Planet(f"Planet_{i}")
+        planet.x = float(i)
+        planet.y = float(i)
+        planet.income = 10
+        repository.addPlanet(planet)
+        planets.append(planet)
+
+    for start, end in zip(planets, planets[1:]):
+        route = TradeRoute(f"{start.name}_{end.name}")
+        route.start = start
+        route.end = end
+        repository.addTradeRoute(route)
+
+    campaign = Campaign("TestCampaign")
+    campaign.setName = "TestCampaign"
+    campaign.planets = {planets[0]}
+    campaign.tradeRoutes = set()
+    campaign.playableFactions = {empire}
+    campaign.startingForces = pd.DataFrame(
+        [[planets[0].name, 1, empire.name, "Stormtrooper_Squad", 1]],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount"],
+    )
+    repository.addCampaign(campaign)
+    return repository
+
+
+@pytest.fixture
+def presenter(qapp):
+    window = MagicMock()
+    window.getSelectedPlanetName.return_value = ""
+    config = SimpleNamespace(
+        parserWorkers=1,
+        parserUseProcesses=False,
+        repositoryCacheFolder="",
+        autoPlanetConnectionDistance=0,
+    )
+    presenter = MainWindowPresenter(window, make_repository(), config)
+    window.reset_mock()
+    return presenter, window
+
+
+def available_route_names(presenter) -> list:
+    return [route.name for route in presenter._MainWindowPresenter__availableTradeRoutes]
+
+
+def plot_calls(window) -> int:
+    return window.makeGalacticPlot.return_value.plotGalaxy.call_count
+
+
+def test_scheduler_runs_each_marked_refresh_once_in_registration_order(qapp):
+    calls = []
+    scheduler = RefreshScheduler()
+    scheduler.register("first", lambda: calls.append("first"))
+    scheduler.register("second", lambda: calls.append("second"))
+
+    scheduler.markDirty("second")
+    scheduler.markDirty("first", "second")
+    assert calls == []
+
+    qapp.processEvents()
+
+    assert calls == ["first", "second"]
+    assert not scheduler.isPending()
+
+
+def test_scheduler_runs_refreshes_marked_while_flushing(qapp):
+    calls = []
+    scheduler = RefreshScheduler()
+    scheduler.register("first", lambda: scheduler.markDirty("second"))
+    scheduler.register("second", lambda: calls.append("second"))
+
+    scheduler.markDirty("first")
+    scheduler.flush()
+
+    assert calls == ["second"]
+
+
+def test_scheduler_batch_flushes_when_outermost_block_exits(qapp):
+    calls = []
+    scheduler = RefreshScheduler()
+    scheduler.register("refresh", lambda: calls.append("refresh"))
+
+    with scheduler.batch():
+        with scheduler.batch():
+            scheduler.markDirty("refresh")
+        assert calls == []
+        scheduler.markDirty("refresh")
+
+    assert calls == ["refresh"]
+    qapp.processEvents()
+    assert calls == ["refresh"]
+
+
+def test_planet_toggles_are_coalesced_into_one_refresh(qapp, presenter):
+    presenter, window = presenter
+
+    for index in range(4):
+        presenter.onPlanetChecked(index, True)
+    presenter.onPlanetChecked(3, False)
+    assert plot_calls(window) == 0
+
+    qapp.processEvents()
+
+    assert plot_calls(window) == 1
+    assert window.insertTradeRoutes.call_count == 1
+    assert window.updateTotalFactionIncome.call_count == 1
+    planets = {p.name for p in presenter.getSelectedCampaign().planets}
+    assert planets == {"Planet_0", "Planet_1", "Planet_2"}
+    assert available_route_names(presenter) == ["Planet_0_Planet_1", "Planet_1_Planet_2"]
+
+
+def test_planet_toggle_inserts_and_removes_only_its_trade_routes(qapp, presenter):
+    presenter, window = presenter
+    for index in range(4):
+        presenter.onPlanetChecked(index, True)
+    qapp.processEvents()
+    for index in range(3):
+        presenter.onTradeRouteChecked(index, True)
+    qapp.processEvents()
+    window.reset_mock()
+
+    presenter.onPlanetChecked(1, False)
+    qapp.processEvents()
+
+    window.removeTradeRoutes.assert_called_once_with([0, 1])
+    window.insertTradeRoutes.assert_called_once_with([], [])
+    window.updateTradeRoutes.assert_not_called()
+    assert available_route_names(presenter) == ["Planet_2_Planet_3"]
+    routes = presenter.getSelectedCampaign().tradeRoutes
+    assert {route.name for route in routes} == {"Planet_2_Planet_3"}
+
+    presenter.onPlanetChecked(1, True)
+    qapp.processEvents()
+
+    window.insertTradeRoutes.assert_called_with(
+        [0, 1], ["Planet_0_Planet_1", "Planet_1_Planet_2"]
+    )
+    assert available_route_names(presenter) == [
+        "Planet_0_Planet_1",
+        "Planet_1_Planet_2",
+        "Planet_2_Planet_3",
+    ]
+
+
+def test_batch_edit_refreshes_once_on_exit(qapp, presenter):
+    presenter, window = presenter
+
+    with presenter.batchEdit():
+        presenter.allPlanetsChecked(True)
+        presenter.allTradeRoutesChecked(True)
+        assert plot_calls(window) == 0
+
+    assert plot_calls(window) == 1
+    routes = presenter.getSelectedCampaign().tradeRoutes
+    assert len(routes) == 3
+    qapp.processEvents()
+    assert plot_calls(window) == 1
+
+
+def test_save_applies_pending_edits_first(qapp, presenter, monkeypatch):
+    presenter, window = presenter
+    presenter.allPlanetsChecked(True)
+    presenter.allTradeRoutesChecked(True)
+
+    presenter.onPlanetChecked(3, False)
+    written = []
+    monkeypatch.setattr(
+        presenter._MainWindowPresenter__xmlWriter,
+        "campaignWriter",
+        lambda campaign, factions, fileName: written.append(set(campaign.tradeRoutes)),
+    )
+    presenter.saveFile("campaign.xml")
+
+    assert {route.name for route in written[0]} == {"Planet_0_Planet_1", "Planet_1_Planet_2"}
+
+
+def test_owner_edits_in_the_forces_table_change_the_planet_owner(qapp, presenter):
+    presenter, window = presenter
+    forces = presenter.getSelectedCampaign().startingForces
+    presenter.onPlanetChecked(0, True)
+    qapp.processEvents()
+    window.updateTotalFactionIncome.assert_called_with({"Empire": {"income": 10, "planets": 1}})
+
+    model = PandasModel(forces, "Planet_0")
+    model.setData(model.index(0, 2), "Rebel", Qt.ItemDataRole.EditRole)
+    presenter.onStartingForcesEdited("Owner")
+    qapp.processEvents()
+
+    window.updateTotalFactionIncome.assert_called_with({"Rebel": {"income": 10, "planets": 1}})
@@ -0,0 +1,107 @@
+import pickle
+
+import numpy as np
+
+from gameObjects.gameObjectRepository import GameObjectRepository
+from gameObjects.planet import Planet
+from gameObjects.planetTable import PlanetTable, planetColumns
+
+
+def make_planet(name, x, y, income=0):
+    planet = Planet(name)
+    planet.x = x
+    planet.y = y
+    planet.income = income
+    return planet
+
+
+def test_planet_attributes_are_views_onto_table_rows():
+    table = PlanetTable()
+    planet = make_planet("Kuat", 1.5, 2.5, income=30)
+    table.addPlanet(planet)
+
+    assert planet.table is table
+    assert table.rowOf("Kuat") == planet.row
+    assert table.column("income")[planet.row] == 30
+
+    table.column("x")[planet.row] = 4.0
+    assert planet.x == 4.0
+    assert isinstance(planet.income, int)
+
+
+def test_remove_moves_last_row_into_the_gap():
+    table = PlanetTable(capacity=1)
+    planets = [make_planet(name, i, -i, i * 10) for i, name in enumerate("ABCD")]
+    for planet in planets:
+        table.addPlanet(planet)
+
+    table.removePlanet(planets[1])
+
+    assert len(table) == 3
+    assert table.planets == [planets[0], planets[3], planets[2]]
+    assert list(table.column("x")) == [0.0, 3.0, 2.0]
+    assert table.rowOf("D") == 1
+    assert table.rowOf("B") is None
+    # The removed planet keeps its values in storage of its own
+    assert (planets[1].x, planets[1].y, planets[1].income) == (1.0, -1.0, 10)
+    assert planets[1].table is not table
+
+
+def test_missing_coordinates_read_as_none():
+    planet = Planet("Kuat")
+    planet.x = None
+
+    assert planet.x is None
+    assert planet.y == 0.0
+
+
+def test_rename_and_duplicate_names_keep_name_index():
+    table = PlanetTable()
+    first = make_planet("Kuat", 0, 0)
+    second = make_planet("Kuat", 1, 1)
+    table.addPlanet(first)
+    table.addPlanet(second)
+
+    first.name = "Kuat Drive Yards"
+
+    assert table.rowOf("Kuat") == second.row
+    assert table.rowOf("Kuat Drive Yards") == first.row
+
+
+def test_repository_planets_share_one_table():
+    repository = GameObjectRepository()
+    planets = [make_planet(f"P{i}", i, 2 * i, i) for i in range(40)]
+    for planet in planets:
+        repository.addPlanet(planet)
+
+    assert len(repository.planetTable) == 40
+    assert all(planet.table is repository.planetTable for planet in planets)
+
+    x, income = planetColumns(reversed(planets), "x", "income")
+    assert list(x) == [float(i) for i in reversed(range(40))]
+    assert list(income) == list(reversed(range(40)))
+
+    repository.removePlanet(planets[0])
+    assert len(repository.planetTable) == 39
+    assert planets[0].x == 0.0
+
+
+def test_planet_columns_reads_planets_from_different_tables():
+    planets = [make_planet("A", 1, 2), make_planet("B", 3, 4)]
+
+    x, y = planetColumns(planets, "x", "y")
+
+    assert x.dtype == np.float64
+    assert list(x) == [1.0, 3.0]
+    assert list(y) == [2.0, 4.0]
+
+
+def test_repository_with_planet_table_can_be_pickled():
+    repository = GameObjectRepository()
+    repository.addPlanet(make_planet("Kuat", 1, 2, 5))
+
+    restored = pickle.loads(pickle.dumps(repository))
+
+    planet = restored.getPlanetByName("Kuat")
+    assert planet.table is restored.planetTable
+    assert (planet.x, planet.y, planet.income) == (1.0, 2.0, 5)
@@ -0,0 +1,64 @@
+import pytest
+from PyQt6.QtCore import Qt
+
+from ui.qtCheckListModel import CheckListModel
+
+
+@pytest.fixture
+def model(qapp):
+    model = CheckListModel("Planets")
+    model.setNames(["Coruscant", "Hoth", "Kuat"])
+    return model
+
+
+def names_of(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def checked_of(model):
+    return [row for row in range(model.rowCount()) if model.isChecked(row)]
+
+
+def test_rows_show_names_and_check_states(model):
+    model.setChecked(1, True)
+
+    assert names_of(model) == ["Coruscant", "Hoth", "Kuat"]
+    assert model.headerData(0, Qt.Orientation.Horizontal) == "Planets"
+    assert model.index(0, 0).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+    assert model.index(1, 0).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+
+def test_checking_rows_emits_one_change(model):
+    changes = []
+    model.dataChanged.connect(lambda first, last, roles: changes.append((first.row(), last.row())))
+
+    model.setCheckedRows([0, 2])
+    assert checked_of(model) == [0, 2]
+    model.setAllChecked(True)
+    assert checked_of(model) == [0, 1, 2]
+
+    assert changes == [(0, 2), (0, 2)]
+
+
+def test_only_user_checks_emit_row_checked(model):
+    checks = []
+    model.rowChecked.connect(lambda row, checked: checks.append((row, checked)))
+
+    model.setCheckedRows([1])
+    model.setData(model.index(2, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+    model.setData(model.index(1, 0), Qt.CheckState.Unchecked.value, Qt.ItemDataRole.CheckStateRole)
+
+    assert checks == [(2, True), (1, False)]
+    assert checked_of(model) == [2]
+
+
+def test_inserted_and_removed_rows_keep_check_states(model):
+    model.setCheckedRows([0, 2])
+
+    model.insertNames([1, 3], ["Endor", "Jakku"])
+    assert names_of(model) == ["Coruscant", "Endor", "Hoth", "Jakku", "Kuat"]
+    assert checked_of(model) == [0, 4]
+
+    model.removeNames([0, 2])
+    assert names_of(model) == ["Endor", "Jakku", "Kuat"]
+    assert checked_of(model) == [2]
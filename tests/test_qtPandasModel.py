@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+from PyQt6.QtCore import Qt
+
+from ui.qtPandasModel import PandasModel
+
+
+@pytest.fixture
+def forces(qapp):
+    return pd.DataFrame(
+        [
+            ["Kuat", 1, "Empire", "Star_Destroyer", 2],
+            ["Hoth", 1, "Rebel", "Snowspeeder", 4],
+            ["Kuat", 2, "Empire", "AT_AT", 3],
+            ["Hoth", 2, "Rebel", "Ion_Cannon", 1],
+        ],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount"],
+        # Labels that are not positions
+        index=[10, 7, 3, 12],
+    )
+
+
+def rows_of(model):
+    return [
+        [model.index(row, column).data() for column in range(model.columnCount())]
+        for row in range(model.rowCount())
+    ]
+
+
+def test_filter_shows_the_rows_of_one_planet(forces):
+    model = PandasModel(forces, "Hoth")
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == 5
+    assert rows_of(model) == [
+        ["Hoth", "1", "Rebel", "Snowspeeder", "4"],
+        ["Hoth", "2", "Rebel", "Ion_Cannon", "1"],
+    ]
+
+
+def test_no_filter_shows_every_row(forces):
+    model = PandasModel(forces, False)
+
+    assert model.rowCount() == 4
+    assert model.headerData(3, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole) == "ObjectType"
+
+
+def test_edits_go_to_the_shown_row_of_the_frame(forces):
+    model = PandasModel(forces, "Hoth")
+    model.index(1, 3).data()
+
+    assert model.setData(model.index(1, 3), "Shield_Generator", Qt.ItemDataRole.EditRole)
+
+    assert forces.loc[12, "ObjectType"] == "Shield_Generator"
+    assert forces.loc[7, "ObjectType"] == "Snowspeeder"
+    assert model.index(1, 3).data() == "Shield_Generator"
+
+
+def test_sorting_reorders_the_view_only(forces):
+    model = PandasModel(forces, "Kuat")
+
+    model.sort(3, Qt.SortOrder.AscendingOrder)
+    assert [row[3] for row in rows_of(model)] == ["AT_AT", "Star_Destroyer"]
+    model.sort(4, Qt.SortOrder.DescendingOrder)
+    assert [row[3] for row in rows_of(model)] == ["AT_AT", "Star_Destroyer"]
+    model.sort(4, Qt.SortOrder.AscendingOrder)
+    assert [row[3] for row in rows_of(model)] == ["Star_Destroyer", "AT_AT"]
+
+    assert list(forces.index) == [10, 7, 3, 12]
@@ -0,0 +1,339 @@
+import pytest
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.backends.backend_qtagg import FigureCanvas
+from matplotlib.collections import LineCollection, PathCollection
+from PyQt6.QtWidgets import QWidget
+
+from gameObjects.faction import Faction
+from gameObjects.planet import Planet
+from gameObjects.traderoute import TradeRoute
+from ui.qtgalacticplot import QtGalacticPlot
+
+
+@pytest.fixture
+def plot(qapp):
+    parent = QWidget()
+    yield QtGalacticPlot(parent)
+    parent.deleteLater()
+    qapp.processEvents()
+
+
+def axes_of(plot):
+    return plot.getWidget().findChild(FigureCanvas).figure.axes[0]
+
+
+def line_collections(plot):
+    """Returns the trade route, highlight and auto-connection collections"""
+    return [c for c in axes_of(plot).collections if isinstance(c, LineCollection)]
+
+
+def scatters(plot):
+    """Returns the background and selected planet scatters"""
+    return [c for c in axes_of(plot).collections if isinstance(c, PathCollection)]
+
+
+def show_area(plot, left, right, bottom, top):
+    axes_of(plot).set_xlim(left, right)
+    axes_of(plot).set_ylim(bottom, top)
+
+
+def segments_of(collection):
+    return {tuple(map(tuple, segment)) for segment in collection.get_segments()}
+
+
+def make_planets(coordinates):
+    planets = []
+    for i, (x, y) in enumerate(coordinates):
+        planet = Planet(f"Planet_{i}")
+        planet.x = x
+        planet.y = y
+        planets.append(planet)
+    return planets
+
+
+def make_route(name, start, end):
+    route = TradeRoute(name)
+    route.start = start
+    route.end = end
+    return route
+
+
+def make_faction(name, color):
+    faction = Faction(name)
+    faction.color = color
+    return faction
+
+
+def test_auto_connections_are_drawn_as_one_path(plot):
+    planets = make_planets([(0, 0), (3, 0), (0, 4), (20, 20)])
+
+    plot.plotGalaxy(planets, [], planets, [], autoPlanetConnectionDistance=5)
+
+    connections = line_collections(plot)[2]
+    # Connections are one segment separated by NaNs
+    (path,) = connections.get_paths()
+    pairs = {tuple(map(tuple, pair[:2])) for pair in path.vertices.reshape(-1, 3, 2)}
+    # (0, 0)-(3, 0) and (0, 0)-(0, 4) are closer than 5, (3, 0)-(0, 4) is exactly 5 apart
+    assert pairs == {
+        ((0.0, 0.0), (3.0, 0.0)),
+        ((0.0, 0.0), (0.0, 4.0)),
+    }
+
+    plot.plotGalaxy(planets, [], planets, [], autoPlanetConnectionDistance=0)
+
+    assert connections.get_segments() == []
+
+
+def test_trade_routes_are_one_collection_and_highlighting_updates_it(plot):
+    planets = make_planets([(0, 0), (3, 0), (0, 4)])
+    routes = [
+        make_route("A", planets[0], planets[1]),
+        make_route("B", planets[1], planets[2]),
+    ]
+    plot.plotGalaxy(planets, routes, planets, [])
+    routes_collection, highlight, _ = line_collections(plot)
+    assert len(routes_collection.get_segments()) == 2
+
+    plot._QtGalacticPlot__highlight_connected_trade_routes(0)
+
+    assert segments_of(highlight) == {((0.0, 0.0), (3.0, 0.0))}
+    # The base collection is part of the cached background and keeps its colors
+    assert routes_collection.get_colors()[:, 3].tolist() == [0.4]
+
+    plot._QtGalacticPlot__reset_trade_route_highlight()
+
+    assert highlight.get_segments() == []
+
+
+def test_updates_reuse_artists_and_touch_only_changes(plot):
+    planets = make_planets([(0, 0), (3, 0), (0, 4)])
+    empire = make_faction("Empire", [0.0, 0.0, 1.0, 1.0])
+    rebel = make_faction("Rebel", [1.0, 0.0, 0.0, 1.0])
+    route = make_route("A", planets[0], planets[1])
+    plot.plotGalaxy(planets[:2], [route], planets, [empire, rebel])
+    artists = list(axes_of(plot).collections)
+
+    plot.plotGalaxy(planets[1:], [], planets, [empire, empire])
+
+    assert list(axes_of(plot).collections) == artists
+    _, selected = scatters(plot)
+    by_position = {
+        tuple(xy): tuple(color)
+        for xy, color in zip(selected.get_offsets(), selected.get_facecolors())
+    }
+    assert by_position == {(3.0, 0.0): (0.0, 0.0, 1.0, 1.0), (0.0, 4.0): (0.0, 0.0, 1.0, 1.0)}
+    assert line_collections(plot)[0].get_segments() == []
+    assert plot._QtGalacticPlot__planetOwners == ["N/A", "Empire", "Empire"]
+
+
+def test_moved_planet_updates_offsets_and_routes(plot):
+    planets = make_planets([(0, 0), (3, 0)])
+    route = make_route("A", planets[0], planets[1])
+    plot.plotGalaxy(planets, [route], planets, [])
+    show_area(plot, -10, 10, -10, 10)
+
+    planets[1].x = 7.0
+    plot.movePlanet(planets[1])
+
+    background, selected = scatters(plot)
+    assert background.get_offsets()[1].tolist() == [7.0, 0.0]
+    assert sorted(map(tuple, selected.get_offsets().tolist())) == [(0.0, 0.0), (7.0, 0.0)]
+    assert segments_of(line_collections(plot)[0]) == {((0.0, 0.0), (7.0, 0.0))}
+
+    # plotGalaxy also notices positions that changed behind its back
+    planets[0].y = 2.0
+    plot.plotGalaxy(planets, [route], planets, [])
+
+    assert segments_of(line_collections(plot)[0]) == {((0.0, 2.0), (7.0, 0.0))}
+
+
+def test_new_planet_universe_rebuilds_the_axes(plot):
+    planets = make_planets([(0, 0), (3, 0)])
+    plot.plotGalaxy(planets, [], planets, [])
+    background = scatters(plot)[0]
+    show_area(plot, -10, 10, -10, 10)
+
+    more_planets = planets + make_planets([(5, 5)])
+    plot.plotGalaxy([], [], more_planets, [])
+
+    assert scatters(plot)[0] is not background
+    assert len(scatters(plot)[0].get_offsets()) == 3
+
+
+def mouse_event(plot, name, x, y, button=None):
+    canvas = plot.getWidget().findChild(FigureCanvas)
+    displayX, displayY = axes_of(plot).transData.transform((x, y))
+    event = MouseEvent(name, canvas, displayX, displayY, button)
+    canvas.callbacks.process(name, event)
+
+
+def move_mouse_to(plot, x, y):
+    mouse_event(plot, "motion_notify_event", x, y)
+
+
+def test_hover_blits_the_overlay_instead_of_redrawing(plot, monkeypatch):
+    # The first plot fits the axes to the planets, so the hovered ones are kept off the edges
+    planets = make_planets([(0, 0), (2, 2), (5, 2), (6, 6)])
+    routes = [make_route("A", planets[1], planets[2])]
+    plot.plotGalaxy(planets, routes, planets, [])
+    canvas = plot.getWidget().findChild(FigureCanvas)
+    canvas.draw()
+
+    draws = []
+    blits = []
+    monkeypatch.setattr(canvas, "draw_idle", lambda: draws.append(1))
+    monkeypatch.setattr(canvas, "draw", lambda: draws.append(1))
+    monkeypatch.setattr(canvas, "blit", lambda bbox=None: blits.append(bbox))
+    _, highlight, _ = line_collections(plot)
+    annotation = axes_of(plot).texts[0]
+
+    move_mouse_to(plot, 2, 2)
+
+    assert draws == []
+    assert len(blits) == 1
+    assert highlight.get_animated() and annotation.get_animated()
+    assert annotation.get_visible() and "Planet: Planet_1" in annotation.get_text()
+    assert segments_of(highlight) == {((2.0, 2.0), (5.0, 2.0))}
+
+    # Moving within the same planet changes nothing, so nothing is drawn
+    move_mouse_to(plot, 2.01, 2)
+    assert len(blits) == 1
+
+    move_mouse_to(plot, 3.5, 4)
+    assert len(blits) == 2
+    assert not annotation.get_visible()
+    assert highlight.get_segments() == []
+    assert draws == []
+
+
+def test_trade_route_trace_follows_the_mouse(plot):
+    planets = make_planets([(0, 0), (2, 2), (5, 2), (6, 6)])
+    plot.plotGalaxy(planets, [], planets, [])
+    plot.getWidget().findChild(FigureCanvas).draw()
+    trace = plot._QtGalacticPlot__tradeRouteTrace
+
+    plot.TraceTradeRoute(1)
+    move_mouse_to(plot, 3.5, 4)
+
+    assert trace.get_visible()
+    assert trace.get_xydata().ravel().tolist() == pytest.approx([2.0, 2.0, 3.5, 4.0])
+
+    plot.TraceTradeRoute(None)
+    assert not trace.get_visible()
+
+
+def test_clicks_select_the_nearest_planet_within_the_pick_radius(plot):
+    planets = make_planets([(0, 0), (2, 2), (2.2, 2), (6, 6)])
+    plot.plotGalaxy(planets, [], planets, [])
+    plot.getWidget().findChild(FigureCanvas).draw()
+    selected = []
+    shift_selected = []
+    plot.planetSelectedSignal.connect(selected.append)
+    plot.planetShiftSelectedSignal.connect(shift_selected.append)
+
+    mouse_event(plot, "button_press_event", 2.15, 2, button=1)
+    mouse_event(plot, "button_press_event", 2.05, 2, button=3)
+    mouse_event(plot, "button_press_event", 4, 4, button=1)
+
+    assert selected == [2]
+    assert shift_selected == [1]
+
+
+def test_hit_testing_follows_moved_planets(plot):
+    planets = make_planets([(0, 0), (2, 2), (6, 6)])
+    plot.plotGalaxy(planets, [], planets, [])
+    plot.getWidget().findChild(FigureCanvas).draw()
+    selected = []
+    plot.planetSelectedSignal.connect(selected.append)
+
+    planets[1].x = 4
+    planets[1].y = 4
+    plot.movePlanet(planets[1])
+    mouse_event(plot, "button_press_event", 2, 2, button=1)
+    mouse_event(plot, "button_press_event", 4, 4, button=1)
+
+    assert selected == [1]
+
+
+def test_zooming_out_thins_planets_and_routes_and_zooming_in_restores_them(plot):
+    # A 10 x 10 grid of planets 0.1 apart, with a route to the right of each planet
+    planets = make_planets([(i % 10 / 10, i // 10 / 10) for i in range(100)])
+    routes = [
+        make_route(str(i), planets[i], planets[i + 1]) for i in range(99) if (i + 1) % 10
+    ]
+    plot.plotGalaxy([], routes, planets, [])
+    background = scatters(plot)[0]
+    routes_collection = line_collections(plot)[0]
+
+    show_area(plot, -1000, 1000, -1000, 1000)
+
+    # The whole grid is within a pixel, so one planet and no routes are drawn
+    assert len(background.get_offsets()) == 1
+    assert routes_collection.get_segments() == []
+
+    show_area(plot, -0.5, 1.5, -0.5, 1.5)
+
+    assert len(background.get_offsets()) == 100
+    assert len(routes_collection.get_segments()) == 90
+
+
+def test_level_of_detail_is_picked_once_per_view_change(plot, monkeypatch):
+    planets = make_planets([(0, 0), (1, 0), (10, 10)])
+    plot.plotGalaxy([], [], planets, [])
+    background = scatters(plot)[0]
+    picks = []
+    pick = plot._QtGalacticPlot__applyPlanetDetail
+    monkeypatch.setattr(plot, "_QtGalacticPlot__applyPlanetDetail", lambda: picks.append(pick()))
+
+    show_area(plot, -1, 2, -1, 2)
+    assert len(picks) == 1
+    assert len(background.get_offsets()) == 2
+
+    # Without a following y limit change the detail is picked before the next draw
+    axes_of(plot).set_xlim(-1, 11)
+    assert len(picks) == 1
+    axes_of(plot).figure.canvas.draw()
+    assert len(picks) == 2
+
+
+def test_planets_and_routes_outside_the_view_are_skipped(plot):
+    planets = make_planets([(0, 0), (1, 0), (10, 10), (11, 10)])
+    routes = [
+        make_route("near", planets[0], planets[1]),
+        make_route("far", planets[2], planets[3]),
+        make_route("across", planets[1], planets[2]),
+    ]
+    plot.plotGalaxy(planets, routes, planets, [])
+
+    show_area(plot, -1, 2, -1, 2)
+
+    background, selected = scatters(plot)
+    assert len(background.get_offsets()) == 2
+    assert len(selected.get_offsets()) == 2
+    assert segments_of(line_collections(plot)[0]) == {
+        ((0.0, 0.0), (1.0, 0.0)),
+        ((1.0, 0.0), (10.0, 10.0)),
+    }
+
+
+def test_highlighting_follows_added_and_removed_routes(plot):
+    planets = make_planets([(0, 0), (3, 0), (0, 4), (3, 4)])
+    a = make_route("A", planets[0], planets[1])
+    b = make_route("B", planets[0], planets[2])
+    c = make_route("C", planets[1], planets[3])
+    plot.plotGalaxy(planets, [a, b, c], planets, [])
+    highlight = line_collections(plot)[1]
+    show_area(plot, -1, 4, -1, 5)
+
+    move_mouse_to(plot, 0, 0)
+    assert segments_of(highlight) == {((0.0, 0.0), (3.0, 0.0)), ((0.0, 0.0), (0.0, 4.0))}
+
+    # Removing a route moves another one into its row, the highlight still finds the rest
+    plot.setTradeRoutes([b, c])
+    assert segments_of(highlight) == {((0.0, 0.0), (0.0, 4.0))}
+
+    move_mouse_to(plot, 3, 0)
+    assert segments_of(highlight) == {((3.0, 0.0), (3.0, 4.0))}
+
+    plot.setTradeRoutes([])
+    assert highlight.get_segments() == []
@@ -0,0 +1,86 @@
+import pytest
+from PyQt6.QtCore import Qt
+
+from ui.qtCheckListModel import CheckListModel
+from ui.qtlistfilter import QtListFilter
+
+
+@pytest.fixture
+def model(qapp):
+    return CheckListModel("Planets")
+
+
+def visible_names(listFilter):
+    proxy = listFilter.getModel()
+    return [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+
+
+def test_filter_hides_rows_without_the_search_text(model):
+    model.setNames(["Coruscant", "Kuat", "Corellia"])
+    listFilter = QtListFilter(model, "Filter")
+
+    listFilter.getWidget().setText("cor")
+    listFilter.apply()
+    assert visible_names(listFilter) == ["Coruscant", "Corellia"]
+
+    listFilter.getWidget().setText("")
+    listFilter.apply()
+    assert visible_names(listFilter) == ["Coruscant", "Kuat", "Corellia"]
+
+
+def test_typing_is_debounced(qapp, model):
+    model.setNames(["Coruscant", "Kuat"])
+    listFilter = QtListFilter(model, "Filter")
+
+    listFilter.getWidget().setText("kuat")
+
+    # Nothing is filtered until the timer fires
+    assert visible_names(listFilter) == ["Coruscant", "Kuat"]
+    qapp.processEvents()
+    assert visible_names(listFilter) == ["Coruscant", "Kuat"]
+
+    listFilter.apply()
+    assert visible_names(listFilter) == ["Kuat"]
+
+
+def test_invalidate_reindexes_new_rows(model):
+    model.setNames(["Coruscant", "Kuat"])
+    listFilter = QtListFilter(model, "Filter")
+    listFilter.getWidget().setText("hoth")
+    listFilter.apply()
+    assert visible_names(listFilter) == []
+
+    model.setNames(["Hoth", "Kuat", "Hoth_Asteroids"])
+    listFilter.invalidate()
+
+    assert visible_names(listFilter) == ["Hoth", "Hoth_Asteroids"]
+
+
+def test_rows_inserted_while_unfiltered_are_found_by_the_next_search(model):
+    model.setNames(["Coruscant", "Kuat"])
+    listFilter = QtListFilter(model, "Filter")
+    listFilter.apply()
+
+    model.insertNames([1], ["Hoth"])
+    listFilter.invalidate()
+    assert visible_names(listFilter) == ["Coruscant", "Hoth", "Kuat"]
+
+    listFilter.getWidget().setText("hoth")
+    listFilter.apply()
+    assert visible_names(listFilter) == ["Hoth"]
+
+
+def test_filtered_rows_map_to_source_rows(model):
+    model.setNames(["Coruscant", "Kuat", "Corellia"])
+    listFilter = QtListFilter(model, "Filter")
+    checks = []
+    model.rowChecked.connect(lambda row, checked: checks.append((row, checked)))
+    listFilter.getWidget().setText("corel")
+    listFilter.apply()
+
+    proxy = listFilter.getModel()
+    assert listFilter.mapToSource(proxy.index(0, 0)).row() == 2
+    proxy.setData(proxy.index(0, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+
+    assert checks == [(2, True)]
+    assert model.isChecked(2)
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from gameObjects.campaign import Campaign
+from gameObjects.faction import Faction
+from gameObjects.gameObjectRepository import GameObjectRepository
+from gameObjects.planet import Planet
+from gameObjects.traderoute import TradeRoute
+from render_campaign_maps import campaign_map_jobs, render_campaign_maps
+
+
+def make_repository() -> GameObjectRepository:
+    repository = GameObjectRepository()
+    empire = Faction("Empire")
+    empire.color = [0.2, 0.3, 1.0]
+    repository.addFaction(empire)
+    repository.addFaction(Faction("Neutral"))
+
+    planets = []
+    for name, x, y in [("Coruscant", 0, 0), ("Kuat", 10, 0), ("Byss", 0, 10)]:
+        planet = Planet(name)
+        planet.x = x
+        planet.y = y
+        repository.addPlanet(planet)
+        planets.append(planet)
+
+    route = TradeRoute("Coruscant_Kuat")
+    route.start = planets[0]
+    route.end = planets[1]
+    repository.addTradeRoute(route)
+
+    for name, members in [("Core", planets[:2]), ("Deep Core", planets)]:
+        campaign = Campaign(name)
+        campaign.planets = set(members)
+        campaign.tradeRoutes = {route}
+        campaign.startingForces = pd.DataFrame(
+            [["Coruscant", 1, "Empire", "Unit", 1]],
+            columns=["Planet", "Era", "Owner", "ObjectType", "Amount"],
+        )
+        repository.addCampaign(campaign)
+    return repository
+
+
+def test_map_jobs_refer_to_planet_rows_and_color_owners(tmp_path):
+    coordinates, jobs = campaign_map_jobs(make_repository(), tmp_path, "png", 4, 50)
+
+    # Planets are in name order: Byss, Coruscant, Kuat
+    assert coordinates.tolist() == [[0.0, 10.0], [0.0, 0.0], [10.0, 0.0]]
+    core = jobs[0]
+    assert core.title == "Core"
+    assert core.routes.tolist() == [[1, 2]]
+    faces = dict(zip(core.planets.tolist(), core.face_colors.tolist()))
+    assert faces[1] == [0.2, 0.3, 1.0, 1.0]
+
+
+def test_map_jobs_skip_unresolved_trade_routes(tmp_path):
+    repository = make_repository()
+    # addCampaignsFromXML keeps None for route names that do not resolve
+    for campaign in repository.campaigns:
+        campaign.tradeRoutes.add(None)
+
+    _, jobs = campaign_map_jobs(repository, tmp_path, "png", 4, 50)
+
+    assert [job.routes.tolist() for job in jobs] == [[[1, 2]], [[1, 2]]]
+
+
+def test_render_campaign_maps_writes_one_image_per_campaign(tmp_path):
+    paths = render_campaign_maps(make_repository(), tmp_path, "png", workers=1, size=2, dpi=50)
+
+    assert [path.name for path in paths] == ["Core.png", "Deep_Core.png"]
+    for path in paths:
+        assert path.read_bytes().startswith(b"\x89PNG")
+
+
+def test_render_campaign_maps_in_a_process_pool(tmp_path):
+    paths = render_campaign_maps(make_repository(), tmp_path, "svg", workers=2, size=2, dpi=50)
+
+    assert [path.name for path in paths] == ["Core.svg", "Deep_Core.svg"]
+    assert all(b"<svg" in path.read_bytes() for path in paths)
+
+
+def test_rendering_does_not_import_qt():
+    check = (
+        "import sys, render_campaign_maps; "
+        "sys.exit(any(name.startswith('PyQt6') for name in sys.modules))"
+    )
+    repository_root = Path(__file__).resolve().parents[1]
+    assert subprocess.run([sys.executable, "-c", check], cwd=repository_root).returncode == 0
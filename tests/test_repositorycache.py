@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from RepositoryCache import RepositoryCache, collectInputFiles
+from RepositoryCreator import RepositoryCreator
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    xml_dir = tmp_path / "Data" / "XML"
+    xml_dir.mkdir(parents=True)
+    (xml_dir / "GameObjectFiles.XML").write_text(
+        """<?xml version='1.0'?>
+<GameObjectFiles>
+    <File>Planets.XML</File>
+</GameObjectFiles>
+""",
+        encoding="utf-8",
+    )
+    (xml_dir / "Planets.XML").write_text(
+        """<?xml version='1.0'?>
+<GameObjects>
+    <Planet Name='Alderaan'>
+        <Galactic_Position>1.0, 2.0, 0.0</Galactic_Position>
+    </Planet>
+</GameObjects>
+""",
+        encoding="utf-8",
+    )
+    return str(tmp_path / "Data")
+
+
+def test_collect_input_files_includes_existing_library(data_folder, tmp_path):
+    library = tmp_path / "forces.csv"
+    library.write_text("Planet\n", encoding="utf-8")
+
+    files = collectInputFiles([data_folder], [str(library), "missing.csv"])
+
+    assert [os.path.basename(f) for f in files] == [
+        "GameObjectFiles.XML",
+        "Planets.XML",
+        "forces.csv",
+    ]
+
+
+def test_cache_round_trip_and_invalidation(data_folder, tmp_path):
+    cache = RepositoryCache(str(tmp_path / "cache"))
+    repository = RepositoryCreator(parserWorkers=1).constructRepository(
+        [data_folder], ""
+    )
+
+    fingerprint = cache.fingerprint([data_folder], "")
+    assert cache.load(fingerprint) is None
+
+    cache.save(fingerprint, repository)
+    cached = cache.load(cache.fingerprint([data_folder], ""))
+    assert cached.getPlanetByName("Alderaan").x == 1.0
+
+    planets_file = os.path.join(data_folder, "XML", "Planets.XML")
+    with open(planets_file, "a", encoding="utf-8") as file:
+        file.write("<!-- edited -->\n")
+
+    assert cache.load(cache.fingerprint([data_folder], "")) is None
+
+
+def test_construct_repository_skips_xml_on_cache_hit(data_folder, tmp_path, monkeypatch):
+    cache = RepositoryCache(str(tmp_path / "cache"), hashContents=True)
+    RepositoryCreator(parserWorkers=1, cache=cache).constructRepository([data_folder], "")
+
+    creator = RepositoryCreator(parserWorkers=1, cache=cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("XML should not be parsed on a cache hit")
+
+    monkeypatch.setattr(creator._RepositoryCreator__xml, "findFileRecords", fail)
+
+    repository = creator.constructRepository([data_folder], "")
+
+    assert repository.getPlanetNames() == ["Alderaan"]
+
+
+def test_cached_repository_supports_incremental_reload(data_folder, tmp_path):
+    cache = RepositoryCache(str(tmp_path / "cache"))
+    RepositoryCreator(parserWorkers=1, cache=cache).constructRepository([data_folder], "")
+
+    creator = RepositoryCreator(parserWorkers=1, cache=cache)
+    repository = creator.constructRepository([data_folder], "")
+    planet = repository.getPlanetByName("Alderaan")
+
+    planets_file = os.path.join(data_folder, "XML", "Planets.XML")
+    with open(planets_file, "w", encoding="utf-8") as file:
+        file.write(
+            "<GameObjects><Planet Name='Alderaan'>"
+            "<Galactic_Position>5.0, 6.0, 0.0</Galactic_Position>"
+            "</Planet></GameObjects>"
+        )
+    changes = creator.reloadFiles([planets_file])
+
+    assert changes.updated == {planet}
+    assert (planet.x, planet.y) == (5.0, 6.0)
@@ -1,9 +1,12 @@
 import lxml.etree as et
+import numpy as np
 import pandas as pd
+import pytest
 
-from RepositoryCreator import RepositoryCreator
+from RepositoryCreator import RepositoryCreator, expandReusedEras
 from gameObjects.campaign import Campaign
 from gameObjects.planet import Planet
+from xmlTools.xmlstructure import XMLStructure
 
 
 def test_add_trade_routes_skips_malformed_entries() -> None:
@@ -82,3 +85,236 @@ def test_construct_repository_keeps_campaigns_when_starting_forces_library_missi
 
     assert campaign in repository.campaigns
     assert repository.startingForcesLibrary is None
+
+
+PLANETS_XML = """<?xml version='1.0'?>
+<GameObjects>
+{}
+</GameObjects>
+"""
+
+PLANET_XML = """    <Planet Name='{}'>
+        <Galactic_Position>{}, 0.0</Galactic_Position>
+    </Planet>"""
+
+ROUTES_XML = """<?xml version='1.0'?>
+<TradeRoutes>
+    <TradeRoute Name='CorellianRun'>
+        <Point_A>Alderaan</Point_A>
+        <Point_B>{}</Point_B>
+    </TradeRoute>
+</TradeRoutes>
+"""
+
+
+def write_planets(path, planets) -> None:
+    path.write_text(
+        PLANETS_XML.format(
+            "\n".join(PLANET_XML.format(name, position) for name, position in planets)
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def watched_data_folder(tmp_path, monkeypatch):
+    # constructRepository sets these globals, restore them for the tests that follow
+    monkeypatch.setattr(XMLStructure, "dataFolder", XMLStructure.dataFolder)
+    monkeypatch.setattr(XMLStructure, "dataFolders", XMLStructure.dataFolders)
+    monkeypatch.setattr(XMLStructure, "submods", XMLStructure.submods)
+
+    xml_dir = tmp_path / "Data" / "XML"
+    xml_dir.mkdir(parents=True)
+    (xml_dir / "GameObjectFiles.XML").write_text(
+        "<GameObjectFiles><File>Planets.XML</File></GameObjectFiles>", encoding="utf-8"
+    )
+    (xml_dir / "TradeRouteFiles.XML").write_text(
+        "<TradeRouteFiles><File>Routes.XML</File></TradeRouteFiles>", encoding="utf-8"
+    )
+    write_planets(
+        xml_dir / "Planets.XML",
+        [("Alderaan", "1.0, 2.0"), ("Kuat", "3.0, 4.0"), ("Corellia", "5.0, 6.0")],
+    )
+    (xml_dir / "Routes.XML").write_text(ROUTES_XML.format("Kuat"), encoding="utf-8")
+    return xml_dir
+
+
+def test_reload_files_patches_planets_in_place(watched_data_folder) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    repository = creator.constructRepository([str(watched_data_folder.parent)], "")
+    alderaan = repository.getPlanetByName("Alderaan")
+    kuat = repository.getPlanetByName("Kuat")
+    corellia = repository.getPlanetByName("Corellia")
+    campaign = Campaign("TestCampaign")
+    campaign.planets = {alderaan, corellia}
+    repository.addCampaign(campaign)
+
+    planets_file = watched_data_folder / "Planets.XML"
+    write_planets(
+        planets_file,
+        [("Alderaan", "10.0, 20.0"), ("Kuat", "3.0, 4.0"), ("Bespin", "7.0, 8.0")],
+    )
+    changes = creator.reloadFiles([str(planets_file)])
+
+    assert repository.getPlanetByName("Alderaan") is alderaan
+    assert (alderaan.x, alderaan.y) == (10.0, 20.0)
+    assert changes.updated == {alderaan}
+    assert {p.name for p in changes.added} == {"Bespin"}
+    assert changes.removed == {corellia}
+    assert not repository.planetExists("Corellia")
+    assert campaign.planets == {alderaan}
+    assert repository.getTradeRouteByPlanets(alderaan, kuat).name == "CorellianRun"
+
+
+def test_reload_files_removes_trade_routes_of_removed_planets(watched_data_folder) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    repository = creator.constructRepository([str(watched_data_folder.parent)], "")
+    route = next(iter(repository.tradeRoutes))
+    campaign = Campaign("TestCampaign")
+    campaign.planets = set(repository.planets)
+    campaign.tradeRoutes = {route}
+    repository.addCampaign(campaign)
+
+    planets_file = watched_data_folder / "Planets.XML"
+    write_planets(planets_file, [("Alderaan", "1.0, 2.0"), ("Corellia", "5.0, 6.0")])
+    changes = creator.reloadFiles([str(planets_file)])
+
+    assert route in changes.removed
+    assert len(repository.tradeRoutes) == 0
+    assert not repository.tradeRouteExists("Alderaan", "Kuat")
+    assert campaign.tradeRoutes == set()
+    for tradeRoute in repository.tradeRoutes:
+        assert repository.planetExists(tradeRoute.start.name)
+        assert repository.planetExists(tradeRoute.end.name)
+
+
+def test_reload_files_restores_trade_routes_of_re_added_planets(watched_data_folder) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    repository = creator.constructRepository([str(watched_data_folder.parent)], "")
+    planets_file = watched_data_folder / "Planets.XML"
+    routes_file = watched_data_folder / "Routes.XML"
+
+    write_planets(planets_file, [("Alderaan", "1.0, 2.0"), ("Corellia", "5.0, 6.0")])
+    creator.reloadFiles([str(planets_file)])
+    assert not repository.tradeRouteExists("Alderaan", "Kuat")
+
+    write_planets(
+        planets_file,
+        [("Alderaan", "1.0, 2.0"), ("Kuat", "3.0, 4.0"), ("Corellia", "5.0, 6.0")],
+    )
+    changes = creator.reloadFiles([str(planets_file)])
+    route = repository.findTradeRoute("CorellianRun")
+    assert route in changes.added
+    assert route.end is repository.getPlanetByName("Kuat")
+
+    # Reloading both files once the route is back must not remove it twice
+    changes = creator.reloadFiles([str(planets_file), str(routes_file)])
+    assert not changes.added and not changes.removed
+    assert repository.tradeRoutes == {route}
+
+
+def test_reload_files_moves_trade_route_endpoints(watched_data_folder) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    repository = creator.constructRepository([str(watched_data_folder.parent)], "")
+    route = next(iter(repository.tradeRoutes))
+
+    routes_file = watched_data_folder / "Routes.XML"
+    routes_file.write_text(ROUTES_XML.format("Corellia"), encoding="utf-8")
+    changes = creator.reloadFiles([str(routes_file)])
+
+    alderaan = repository.getPlanetByName("Alderaan")
+    corellia = repository.getPlanetByName("Corellia")
+    assert changes.updated == {route}
+    assert repository.getTradeRouteByPlanets(corellia, alderaan) is route
+    assert not repository.tradeRouteExists("Alderaan", "Kuat")
+
+
+def test_reload_files_flags_metafiles_and_ignores_unknown_files(
+    watched_data_folder,
+) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    creator.constructRepository([str(watched_data_folder.parent)], "")
+
+    unknown = watched_data_folder / "Units.XML"
+    unknown.write_text("<GameObjects/>", encoding="utf-8")
+    assert creator.reloadFiles([str(unknown)]).isEmpty()
+
+    changes = creator.reloadFiles([str(watched_data_folder / "GameObjectFiles.XML")])
+    assert changes.fullReloadRequired
+
+
+def test_reload_files_keeps_objects_when_file_is_malformed(watched_data_folder) -> None:
+    creator = RepositoryCreator(parserWorkers=1)
+    repository = creator.constructRepository([str(watched_data_folder.parent)], "")
+
+    planets_file = watched_data_folder / "Planets.XML"
+    planets_file.write_text("<GameObjects><Planet Name='Alderaan'>", encoding="utf-8")
+    changes = creator.reloadFiles([str(planets_file)])
+
+    assert not changes.added and not changes.removed
+    assert sorted(repository.getPlanetNames()) == ["Alderaan", "Corellia", "Kuat"]
+
+
+def legacy_expand_reused_eras(library: pd.DataFrame) -> pd.DataFrame:
+    """Row by row ReuseEra expansion the vectorized version must reproduce"""
+    current_era = 0
+    for _, row in library.iterrows():
+        if row["Era"] != current_era:
+            current_era = row["Era"]
+            if not pd.isna(row["ReuseEra"]):
+                reuse_filter = (library.Era == row["ReuseEra"]) & (
+                    library.Planet == row["Planet"]
+                )
+                library = pd.concat(
+                    [library, library[reuse_filter].copy().assign(Era=current_era)]
+                )
+    return library
+
+
+def test_get_starting_forces_library_resolves_chained_reuse(tmp_path) -> None:
+    library_csv = tmp_path / "library.csv"
+    pd.DataFrame(
+        [
+            ["Kuat", 1, "Empire", "AT_AT", 2, None],
+            ["Kuat", 2, "Empire", None, None, 1],
+            ["Kuat", 3, "Empire", None, None, 2],
+            ["Alderaan", 1, "Rebel", "X_Wing", 1, None],
+            ["Alderaan", 2, "Rebel", "Y_Wing", 1, 1],
+        ],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount", "ReuseEra"],
+    ).to_csv(library_csv, index=False)
+
+    library = RepositoryCreator().getStartingForcesLibrary(str(library_csv))
+
+    rows = set(library[["Planet", "Era", "ObjectType"]].itertuples(index=False, name=None))
+    assert rows == {
+        ("Kuat", 1, "AT_AT"),
+        ("Kuat", 2, "AT_AT"),
+        ("Kuat", 3, "AT_AT"),
+        ("Alderaan", 1, "X_Wing"),
+        ("Alderaan", 2, "X_Wing"),
+        ("Alderaan", 2, "Y_Wing"),
+    }
+    assert "ReuseEra" not in library.columns
+
+
+def test_expand_reused_eras_matches_row_by_row_expansion() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        rows = int(rng.integers(1, 40))
+        library = pd.DataFrame(
+            {
+                "Planet": rng.choice(["Kuat", "Alderaan", "Corellia"], rows),
+                "Era": rng.integers(1, 5, rows),
+                "Owner": "Empire",
+                "ObjectType": rng.choice(["AT_AT", None], rows, p=[0.8, 0.2]),
+                "Amount": rng.integers(1, 3, rows),
+                "ReuseEra": np.where(
+                    rng.random(rows) < 0.4, rng.integers(1, 5, rows), np.nan
+                ),
+            }
+        )
+
+        pd.testing.assert_frame_equal(
+            expandReusedEras(library.copy()), legacy_expand_reused_eras(library.copy())
+        )
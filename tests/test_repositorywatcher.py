@@ -0,0 +1,25 @@
+import os
+
+from RepositoryWatcher import RepositoryWatcher
+
+
+def test_poll_reports_added_modified_and_deleted_files(tmp_path):
+    xml_dir = tmp_path / "Data" / "XML"
+    xml_dir.mkdir(parents=True)
+    planets = xml_dir / "Planets.XML"
+    routes = xml_dir / "Routes.XML"
+    planets.write_text("<GameObjects/>", encoding="utf-8")
+    routes.write_text("<TradeRoutes/>", encoding="utf-8")
+    library = tmp_path / "forces.csv"
+
+    watcher = RepositoryWatcher([str(tmp_path / "Data")], [str(library)])
+    assert watcher.poll() == []
+
+    planets.write_text("<GameObjects><Planet/></GameObjects>", encoding="utf-8")
+    routes.unlink()
+    (xml_dir / "Factions.XML").write_text("<Factions/>", encoding="utf-8")
+    library.write_text("Planet\n", encoding="utf-8")
+
+    changed = {os.path.basename(f) for f in watcher.poll()}
+    assert changed == {"Planets.XML", "Routes.XML", "Factions.XML", "forces.csv"}
+    assert watcher.poll() == []
@@ -0,0 +1,40 @@
+from SearchIndex import SearchIndex
+
+
+NAMES = ["Coruscant", "Corellia", "Kuat", "Mon Calamari", "Hoth", "Nar_Shaddaa"]
+
+
+def names_of(rows):
+    return [NAMES[row] for row in rows]
+
+
+def test_search_finds_substrings_ignoring_case():
+    index = SearchIndex(NAMES)
+
+    assert names_of(index.search("COR")) == ["Coruscant", "Corellia"]
+    assert names_of(index.search("ell")) == ["Corellia"]
+    assert names_of(index.search("h")) == ["Hoth", "Nar_Shaddaa"]
+    assert names_of(index.search("")) == NAMES
+    assert names_of(index.search("xyz")) == []
+
+
+def test_whitespace_in_the_query_matches_underscores():
+    index = SearchIndex(NAMES)
+
+    assert names_of(index.search("nar sh")) == ["Nar_Shaddaa"]
+    assert names_of(index.search("mon cal")) == ["Mon Calamari"]
+
+
+def test_narrowing_and_widening_queries_give_the_same_results_as_fresh_ones():
+    index = SearchIndex(NAMES)
+    queries = ["c", "co", "cor", "coru", "cor", "o", "oth", "a"]
+
+    for query in queries:
+        assert names_of(index.search(query)) == names_of(SearchIndex(NAMES).search(query))
+
+
+def test_regex_characters_are_searched_literally():
+    index = SearchIndex(["A(1)", "A1"])
+
+    assert index.search("(1").tolist() == [0]
+    assert index.matches("a").tolist() == [True, True]
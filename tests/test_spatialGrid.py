@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from SpatialGrid import SpatialGrid
+
+
+def brute_force_pairs(x, y, distance):
+    return {
+        (i, j)
+        for i in range(len(x))
+        for j in range(i + 1, len(x))
+        if (x[i] - x[j]) ** 2 + (y[i] - y[j]) ** 2 < distance**2
+    }
+
+
+@pytest.mark.parametrize("cell_factor", [1.0, 0.3, 2.5])
+def test_pairs_within_matches_brute_force(cell_factor):
+    rng = np.random.default_rng(3)
+    x = rng.uniform(0, 500, 300)
+    y = rng.uniform(0, 500, 300)
+    x[5] = np.nan
+    x[7], y[7] = x[8], y[8]
+
+    first, second = SpatialGrid(x, y, 40 * cell_factor).pairsWithin(40)
+
+    pairs = set(zip(first.tolist(), second.tolist()))
+    assert len(pairs) == len(first)
+    assert pairs == brute_force_pairs(x, y, 40)
+
+
+def test_pairs_within_is_empty_without_points():
+    first, second = SpatialGrid([], [], 10).pairsWithin(10)
+
+    assert len(first) == len(second) == 0
+
+
+def test_points_within_returns_nearest_first():
+    grid = SpatialGrid([0.0, 10.0, 3.0, np.nan, 100.0], [0.0, 0.0, 0.0, 0.0, 0.0], 5)
+
+    assert grid.pointsWithin(2.0, 0.0, 9).tolist() == [2, 0, 1]
+    assert grid.nearest(2.0, 0.0, 9) == 2
+    assert grid.nearest(50.0, 0.0, 9) is None
+    assert len(grid) == 4
@@ -0,0 +1,31 @@
+import contextlib
+import io
+
+from benchmarks.synthetic_mod import write_synthetic_mod
+from RepositoryCreator import RepositoryCreator
+from xmlTools.xmlstructure import XMLStructure
+
+
+def test_synthetic_mod_loads_into_repository(tmp_path, monkeypatch):
+    # constructRepository sets these globals, restore them for the tests that follow
+    monkeypatch.setattr(XMLStructure, "dataFolder", XMLStructure.dataFolder)
+    monkeypatch.setattr(XMLStructure, "dataFolders", XMLStructure.dataFolders)
+    monkeypatch.setattr(XMLStructure, "submods", XMLStructure.submods)
+
+    mod = write_synthetic_mod(str(tmp_path), planets=120, campaigns=3, submods=1)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        repository = RepositoryCreator(parserWorkers=1).constructRepository(
+            mod.data_folders, mod.starting_forces_library
+        )
+
+    # The submod adds one planet of its own and moves the planets it overrides
+    assert len(repository.planets) == 121
+    assert repository.getPlanetByName("Submod_1_Planet_0000") is not None
+    assert len(repository.tradeRoutes) == len(mod.route_names)
+    assert {c.setName for c in repository.campaigns} == set(mod.campaign_sets)
+
+    galaxy = repository.getCampaignBySetName("Galaxy")
+    assert len(galaxy.planets) == 120
+    assert len(galaxy.playableFactions) == 3
+    assert repository.startingForcesLibrary.Planet.nunique() == 120
@@ -1,8 +1,7 @@
 import lxml.etree as et
 import pytest
 
-from gameObjects.planet import Planet
-from xmlTools.xmlreader import XMLReader
+from xmlTools.xmlreader import XMLReader, fileMayContainTag
 from xmlTools.xmlstructure import XMLStructure
 
 
@@ -111,7 +110,7 @@ def test_find_planet_files_and_roots_returns_planet_only(reader, xml_workspace):
     assert set(roots.keys()) == {"Planets.XML"}
 
 
-def test_find_meta_file_refs_and_get_start_end(reader, xml_workspace):
+def test_find_meta_file_refs(reader, xml_workspace):
     trade_meta = xml_workspace(
         "TradeRouteFiles.XML",
         """<?xml version='1.0'?>
@@ -122,7 +121,7 @@ def test_find_meta_file_refs_and_get_start_end(reader, xml_workspace):
 """,
     )
 
-    routes_file = xml_workspace(
+    xml_workspace(
         "Routes.XML",
         """<?xml version='1.0'?>
 <TradeRoutes>
@@ -138,87 +137,169 @@ def test_find_meta_file_refs_and_get_start_end(reader, xml_workspace):
     assert len(refs) == 1
     assert refs[0].tag == "TradeRoutes"
 
-    route_root = et.parse(routes_file).getroot()
-    p1 = Planet("Alderaan")
-    p2 = Planet("Kuat")
-    start, end = reader.getStartEnd("CorellianRun", {p1, p2}, route_root)
-    assert start.name == "Alderaan"
-    assert end.name == "Kuat"
-
 
-def test_get_start_end_raises_when_route_missing(reader, xml_workspace):
-    routes_file = xml_workspace(
-        "Routes.XML",
+def test_get_location_returns_xy(reader, xml_workspace):
+    planet_file = xml_workspace(
+        "Planets.XML",
         """<?xml version='1.0'?>
-<TradeRoutes>
-    <TradeRoute Name='HydianWay'>
-        <Point_A>Alderaan</Point_A>
-        <Point_B>Kuat</Point_B>
-    </TradeRoute>
-</TradeRoutes>
+<GameObjects>
+    <Planet Name='Bespin'>
+        <Galactic_Position>10.5, 20.5, 7.0</Galactic_Position>
+    </Planet>
+</GameObjects>
 """,
     )
 
-    route_root = et.parse(routes_file).getroot()
-    p1 = Planet("Alderaan")
-    p2 = Planet("Kuat")
-
-    with pytest.raises(ValueError, match="not found"):
-        reader.getStartEnd("CorellianRun", {p1, p2}, route_root)
+    root = et.parse(planet_file).getroot()
+    x, y = reader.getLocation("Bespin", root)
+    assert x == 10.5
+    assert y == 20.5
 
 
-def test_get_start_end_raises_when_point_missing(reader, xml_workspace):
-    routes_file = xml_workspace(
-        "Routes.XML",
-        """<?xml version='1.0'?>
-<TradeRoutes>
-    <TradeRoute Name='CorellianRun'>
-        <Point_A>Alderaan</Point_A>
-    </TradeRoute>
-</TradeRoutes>
-""",
+def _write_numbered_planet_files(xml_workspace, count):
+    entries = "".join(f"    <File>Planets{i}.XML</File>\n" for i in range(count))
+    meta = xml_workspace(
+        "GameObjectFiles.XML",
+        f"<?xml version='1.0'?>\n<GameObjectFiles>\n{entries}</GameObjectFiles>\n",
     )
+    for i in range(count):
+        xml_workspace(
+            f"Planets{i}.XML",
+            f"""<?xml version='1.0'?>
+<GameObjects>
+    <Planet Name='Planet{i}'>
+        <Galactic_Position>{i}.0, 0.0, 0.0</Galactic_Position>
+    </Planet>
+</GameObjects>
+""",
+        )
+    return meta
 
-    route_root = et.parse(routes_file).getroot()
-    p1 = Planet("Alderaan")
 
-    with pytest.raises(ValueError, match="missing Point_B"):
-        reader.getStartEnd("CorellianRun", {p1}, route_root)
+def test_parallel_parsing_keeps_metafile_order(xml_workspace):
+    meta = _write_numbered_planet_files(xml_workspace, 12)
 
+    serial = XMLReader(workers=1).findPlanetsFiles(meta)
+    parallel = XMLReader(workers=4).findPlanetsFiles(meta)
 
-def test_get_start_end_raises_when_planet_not_found(reader, xml_workspace):
-    routes_file = xml_workspace(
-        "Routes.XML",
+    expected = [f"Planet{i}" for i in range(12)]
+    assert [root.find("Planet").get("Name") for root in serial] == expected
+    assert [root.find("Planet").get("Name") for root in parallel] == expected
+
+
+def test_find_planet_records_in_worker_processes(xml_workspace):
+    meta = _write_numbered_planet_files(xml_workspace, 3)
+
+    records = XMLReader(workers=2, useProcesses=True).findPlanetRecords(meta)
+
+    assert [path.rsplit("/", 1)[-1] for path, _ in records] == [
+        "Planets0.XML",
+        "Planets1.XML",
+        "Planets2.XML",
+    ]
+    assert [planets[0]["name"] for _, planets in records] == [
+        "Planet0",
+        "Planet1",
+        "Planet2",
+    ]
+    assert records[2][1][0]["coordinates"] == (2.0, 0.0)
+
+
+def test_file_may_contain_tag_prefilter(xml_workspace):
+    planets = xml_workspace(
+        "Planets.XML",
+        "<?xml version='1.0'?>\n<GameObjects><Planet\nName='Kuat'/></GameObjects>\n",
+    )
+    units = xml_workspace(
+        "Units.XML",
+        "<?xml version='1.0'?>\n<GameObjects><Planetary_Shield Name='S'/></GameObjects>\n",
+    )
+
+    assert fileMayContainTag(planets, "Planet") is True
+    assert fileMayContainTag(units, "Planet") is False
+
+
+def test_find_planets_files_skips_non_planet_files_without_parsing(
+    reader, xml_workspace, monkeypatch
+):
+    meta = xml_workspace(
+        "GameObjectFiles.XML",
         """<?xml version='1.0'?>
-<TradeRoutes>
-    <TradeRoute Name='CorellianRun'>
-        <Point_A>Alderaan</Point_A>
-        <Point_B>Kuat</Point_B>
-    </TradeRoute>
-</TradeRoutes>
+<GameObjectFiles>
+    <File>Planets.XML</File>
+    <File>Units.XML</File>
+</GameObjectFiles>
 """,
     )
+    xml_workspace(
+        "Planets.XML",
+        "<?xml version='1.0'?>\n<GameObjects><Planet Name='Kuat'/></GameObjects>\n",
+    )
+    xml_workspace(
+        "Units.XML",
+        "<?xml version='1.0'?>\n<GameObjects><GroundCompany Name='AT_AT'/></GameObjects>\n",
+    )
 
-    route_root = et.parse(routes_file).getroot()
-    p1 = Planet("Alderaan")
+    parsed = []
+    original_parse = et.parse
 
-    with pytest.raises(ValueError, match="unknown end planet"):
-        reader.getStartEnd("CorellianRun", {p1}, route_root)
+    def recording_parse(source, *args, **kwargs):
+        parsed.append(str(source))
+        return original_parse(source, *args, **kwargs)
 
+    monkeypatch.setattr(et, "parse", recording_parse)
 
-def test_get_location_returns_xy(reader, xml_workspace):
-    planet_file = xml_workspace(
+    roots = reader.findPlanetsFiles(meta)
+
+    assert len(roots) == 1
+    assert not any(path.endswith("Units.XML") for path in parsed)
+
+
+def test_get_planet_info_from_file_matches_tree_extraction(reader, xml_workspace):
+    planets = xml_workspace(
         "Planets.XML",
         """<?xml version='1.0'?>
 <GameObjects>
-    <Planet Name='Bespin'>
-        <Galactic_Position>10.5, 20.5, 7.0</Galactic_Position>
+    <!-- comment -->
+    <Planet Name='Alderaan'>
+        <Galactic_Position>1.0, 2.0, 0.0</Galactic_Position>
+        <Planet_Credit_Value>100</Planet_Credit_Value>
+    </Planet>
+    <Planet Name='Kuat'>
+        <Variant_Of_Existing_Type>Alderaan</Variant_Of_Existing_Type>
+        <Max_Space_Base>5</Max_Space_Base>
     </Planet>
 </GameObjects>
 """,
     )
+    units = xml_workspace(
+        "Units.XML",
+        "<?xml version='1.0'?>\n<GameObjects><GroundCompany Name='AT_AT'/></GameObjects>\n",
+    )
 
-    root = et.parse(planet_file).getroot()
-    x, y = reader.getLocation("Bespin", root)
-    assert x == 10.5
-    assert y == 20.5
+    streamed = reader.getPlanetInfoFromFile(planets)
+
+    assert streamed == reader.getPlanetInfo(et.parse(planets).getroot())
+    assert [record["name"] for record in streamed] == ["Alderaan", "Kuat"]
+    assert reader.getPlanetInfoFromFile(units) is None
+
+
+def test_get_trade_route_info_single_pass(reader):
+    root = et.fromstring(
+        """<TradeRoutes>
+    <TradeRoute Name='CorellianRun'>
+        <Point_A> Alderaan </Point_A>
+        <Point_B>Kuat</Point_B>
+    </TradeRoute>
+    <TradeRoute Name='BrokenRoute'>
+        <Point_A>Alderaan</Point_A>
+        <Point_B></Point_B>
+    </TradeRoute>
+</TradeRoutes>
+"""
+    )
+
+    assert reader.getTradeRouteInfo(root) == [
+        {"name": "CorellianRun", "point_a": "Alderaan", "point_b": "Kuat"},
+        {"name": "BrokenRoute", "point_a": "Alderaan", "point_b": None},
+    ]
@@ -128,6 +128,58 @@ def test_campaign_writer_uses_default_story_name_when_empty(writer, tmp_path):
     assert "Rebel, Conquests\\Progressive\\Story_Plots_FullProgressive_Rebel.xml" in story_name.text
 
 
+def legacy_starting_forces_entries(campaign):
+    """Starting_Forces entries of the nested loop campaignWriter used to compare every
+    starting force with every campaign planet, the Counter lookup must reproduce them"""
+    forces = campaign.startingForces
+    entries = []
+    dummy = False
+    for _, row in forces[forces.Era == int(campaign.eraStart)].iterrows():
+        for _ in range(row.Amount):
+            entry = f"{row.Owner}, {row.Planet}, {row.ObjectType}"
+            for planet in campaign.planets:
+                if planet.name.upper() == row.Planet.upper():
+                    entries.append(entry)
+                    if campaign.useDefaultForces and not dummy:
+                        entry = f"{row.Owner}, {row.Planet}, Era_One_Dummy"
+                        dummy = True
+                        entries.append(entry)
+    return entries
+
+
+@pytest.mark.parametrize("use_default_forces", [False, True])
+def test_campaign_writer_starting_forces_match_the_nested_loop(
+    writer, tmp_path, use_default_forces
+):
+    import pandas as pd
+
+    campaign = Campaign("GC")
+    campaign.setName = "GC"
+    campaign.eraStart = "1"
+    campaign.useDefaultForces = use_default_forces
+    campaign.playableFactions = {Faction("Rebel")}
+    # Kuat is in the campaign twice under names differing only in case
+    campaign.planets = {Planet("Kuat"), Planet("KUAT"), Planet("Hoth")}
+    campaign.startingForces = pd.DataFrame(
+        [
+            ["Kuat", 1, "Empire", "Star_Destroyer", 2],
+            ["hoth", 1, "Rebel", "Snowspeeder", 1],
+            ["Kuat", 1, "Empire", "AT_AT", 1],
+            ["Byss", 1, "Empire", "Sovereign", 1],
+            ["Hoth", 2, "Rebel", "Ion_Cannon", 1],
+        ],
+        columns=["Planet", "Era", "Owner", "ObjectType", "Amount"],
+    )
+
+    output_path = tmp_path / "Campaigns.xml"
+    writer.campaignWriter(campaign, [Faction("Rebel")], str(output_path))
+
+    root = et.parse(str(output_path)).getroot()
+    written = [element.text for element in root.iter("Starting_Forces")]
+    assert written == legacy_starting_forces_entries(campaign)
+    assert written.count("Empire, Kuat, AT_AT") == 2
+
+
 def writer_starting_forces_dataframe():
     import pandas as pd
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Set, Dict
+import bisect
 import os
 import pandas as pd
 from xmlTools.xmlreader import XMLReader
@@ -12,9 +13,29 @@ from gameObjects.traderoute import TradeRoute
 from gameObjects.faction import Faction
 from gameObjects.campaign import Campaign
 from ui.qtgalacticplot import QtGalacticPlot
-from RepositoryCreator import RepositoryCreator
+from ui.refreshscheduler import RefreshScheduler
+from RepositoryCache import RepositoryCache
+from RepositoryCreator import (
+    CAMPAIGN_FILE,
+    FACTION_FILE,
+    PLANET_FILE,
+    TRADE_ROUTE_FILE,
+    RepositoryCreator,
+)
+from RepositoryWatcher import RepositoryWatcher
 from xmlTools.xmlstructure import XMLStructure
-from DisplayHelpers import DisplayHelpers
+from DisplayHelpers import OWNER_COLUMNS, DisplayHelpers
+
+# Views the presenter refreshes after edits, see RefreshScheduler
+TRADE_ROUTES = "tradeRoutes"
+PLANET_SELECTION = "planetSelection"
+PLANET_OWNERS = "planetOwners"
+MAX_CONNECTIONS = "maxConnections"
+FORCES = "forces"
+GALACTIC_PLOT = "galacticPlot"
+
+# Above this many routes gained or lost at once the trade route table is refilled
+MAX_INCREMENTAL_TRADE_ROUTE_CHANGES = 64
 
 
 class MainWindow(ABC):
@@ -38,6 +59,14 @@ class MainWindow(ABC):
     def updateTradeRoutes(self, tradeRoutes: List[str]) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def insertTradeRoutes(self, rows: List[int], tradeRoutes: List[str]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def removeTradeRoutes(self, rows: List[int]) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def addCampaigns(self, campaigns: List[str]) -> None:
         raise NotImplementedError()
@@ -124,16 +153,29 @@ class MainWindowPresenter:
         self.__xmlWriter: XMLWriter = XMLWriter()
 
         self.__repository = repository
-        self.__repositoryCreator = RepositoryCreator()
-
         self.__config = config
 
+        self.__repositoryCreator = RepositoryCreator(
+            config.parserWorkers,
+            config.parserUseProcesses,
+            RepositoryCache.fromConfig(config),
+        )
+        self.__watcher: Optional[RepositoryWatcher] = None
+
         self.campaigns: List[Campaign] = list()
         self.__planets: List[Planet] = list()
         self.__planetOwners: List[Faction] = list()
         self.__playableFactions: List[Faction] = list()
         self.__tradeRoutes: List[TradeRoute] = list()
         self.__availableTradeRoutes: List[TradeRoute] = list()
+        # Row of each object in the sorted lists shown by the main window
+        self.__planetRows: Dict[Planet, int] = dict()
+        self.__availableTradeRouteRows: Dict[TradeRoute, int] = dict()
+        self.__factionRows: Dict[Faction, int] = dict()
+        # Trade routes touching each planet, and the planets checked or unchecked since the
+        # available trade routes were last updated
+        self.__routesByPlanet: Dict[Planet, Set[TradeRoute]] = dict()
+        self.__toggledPlanets: Set[Planet] = set()
         self.__newTradeRoutes: List[TradeRoute] = list()
         self.__updatedPlanetCoords: Dict[str, List[float]] = dict()
 
@@ -145,6 +187,16 @@ class MainWindowPresenter:
 
         self.__showAutoConnections = True
 
+        # Views derived from the checked objects, in the order they depend on each other
+        self.__preferredPlanetName: Optional[str] = None
+        self.__refresh = RefreshScheduler()
+        self.__refresh.register(TRADE_ROUTES, self.__refreshAvailableTradeRoutes)
+        self.__refresh.register(PLANET_SELECTION, self.__refreshPlanetSelection)
+        self.__refresh.register(PLANET_OWNERS, self.__refreshPlanetOwners)
+        self.__refresh.register(MAX_CONNECTIONS, self.__refreshMaxConnections)
+        self.__refresh.register(FORCES, self.__refreshForces)
+        self.__refresh.register(GALACTIC_PLOT, self.__updateGalacticPlot)
+
         self.__plot.planetSelectedSignal.connect(self.planetSelectedOnPlot)
         self.__plot.planetShiftSelectedSignal.connect(self.planetShiftSelectedOnPlot)
 
@@ -159,12 +211,17 @@ class MainWindowPresenter:
         self.campaignPropertiesCommand = None
         self.optionsDialogCommand = None
 
+    def batchEdit(self):
+        """Context manager for programmatic bulk edits. The views are refreshed once,
+        when the outermost block exits"""
+        return self.__refresh.batch()
+
     def importStartingForces(self) -> None:
         """Imports all starting forces from spreadsheets"""
         self.getSelectedCampaign().startingForces = (
             self.__repository.startingForcesLibrary
         )
-        self.__refreshForcesDisplay()
+        self.__refresh.markDirty(FORCES)
 
     def importStartingForcesAll(self) -> None:
         """Imports all starting forces from spreadsheets into ALL GCs"""
@@ -182,6 +239,52 @@ class MainWindowPresenter:
         self.__repository = self.__repositoryCreator.constructRepository(
             dataFolders, self.__config.startingForcesLibraryURL
         )
+        self.__restartWatcher()
+        self.__updateWidgets()
+
+    def setWatchEnabled(self, enabled: bool) -> None:
+        """Starts or stops watching the data folders for changed XML files"""
+        self.__watcher = None
+        if enabled:
+            self.__restartWatcher(force=True)
+
+    def onWatchTimer(self) -> None:
+        """Polls the watched files and reloads the ones that changed"""
+        if self.__watcher is None:
+            return
+
+        changedFiles = self.__watcher.poll()
+        if changedFiles:
+            self.onDataFilesChanged(changedFiles)
+
+    def onDataFilesChanged(self, filePaths: List[str]) -> None:
+        """Patches the repository with the changed files and refreshes the views that depend on them.
+        The selected campaign and checked items are kept"""
+        selectedSetName = None
+        if self.campaigns:
+            selectedSetName = self.getSelectedCampaign().setName
+
+        self.__repositoryCreator.repository = self.__repository
+        changes = self.__repositoryCreator.reloadFiles(filePaths)
+        if changes.isEmpty():
+            return
+
+        if changes.fullReloadRequired:
+            self.__repository.emptyRepository()
+            self.__repository = self.__repositoryCreator.constructRepository(
+                XMLStructure.dataFolders, self.__config.startingForcesLibraryURL
+            )
+            self.__restartWatcher()
+        elif not (changes.added or changes.removed or CAMPAIGN_FILE in changes.kinds):
+            self.__refreshUpdatedObjects(changes.kinds)
+            return
+
+        self.campaigns = sorted(self.__repository.campaigns, key=lambda entry: entry.name)
+        setNames = [x.setName for x in self.campaigns]
+        if selectedSetName in setNames:
+            self.__selectedCampaignIndex = setNames.index(selectedSetName)
+        elif self.__selectedCampaignIndex >= len(self.campaigns):
+            self.__selectedCampaignIndex = 0
         self.__updateWidgets()
 
     def onConfigChanged(
@@ -207,10 +310,11 @@ class MainWindowPresenter:
                 self.__config.dataFolders,
                 self.__config.startingForcesLibraryURL,
             )
+            self.__restartWatcher()
             self.__updateWidgets()
             return
 
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(GALACTIC_PLOT)
 
     def onPlanetChecked(self, index: int, checked: bool) -> None:
         """If a planet is checked by the user, add it to the selected campaign and refresh the galaxy plot"""
@@ -218,39 +322,36 @@ class MainWindowPresenter:
             if self.__planets[index] not in self.__checkedPlanets:
                 self.__checkedPlanets.add(self.__planets[index])
                 self.getSelectedCampaign().planets.add(self.__planets[index])
-                self.__updateAvailableTradeRoutes(self.__checkedPlanets)
+                self.__toggledPlanets.add(self.__planets[index])
+                self.__refresh.markDirty(TRADE_ROUTES)
         else:
             if self.__planets[index] in self.__checkedPlanets:
                 self.__checkedPlanets.remove(self.__planets[index])
                 self.getSelectedCampaign().planets.remove(self.__planets[index])
-                self.__updateAvailableTradeRoutes(self.__checkedPlanets)
-        self.__syncPlanetDependentDisplays(update_planet_count=False)
-        self.__refreshForcesDisplay(preferredPlanetName=self.__planets[index].name)
-        self.__updateGalacticPlot()
+                self.__toggledPlanets.add(self.__planets[index])
+                self.__refresh.markDirty(TRADE_ROUTES)
+        self.__preferredPlanetName = self.__planets[index].name
+        self.__refresh.markDirty(PLANET_OWNERS, FORCES, GALACTIC_PLOT)
 
     def planetSelectedOnPlot(self, index: int) -> None:
         """If a planet is checked by the user, add it to the selected campaign and refresh the galaxy plot"""
         if self.__planets[index] not in self.__checkedPlanets:
             self.__checkedPlanets.add(self.__planets[index])
             self.getSelectedCampaign().planets.add(self.__planets[index])
-            self.__updateAvailableTradeRoutes(self.__checkedPlanets)
         elif self.__planets[index] in self.__checkedPlanets:
             self.__checkedPlanets.remove(self.__planets[index])
             self.getSelectedCampaign().planets.remove(self.__planets[index])
-            self.__updateAvailableTradeRoutes(self.__checkedPlanets)
-
-        selectedPlanets = []
-
-        for p in self.__checkedPlanets:
-            selectedPlanets.append(self.__getNames(self.__planets).index(p.name))
-
-        self.__mainWindow.updatePlanetSelection(selectedPlanets)
-        self.__syncPlanetDependentDisplays(update_planet_count=True)
-        self.__mainWindow.updatePlanetMaxConnectionsCountDisplay(
-            self.__checkedTradeRoutes
+        self.__toggledPlanets.add(self.__planets[index])
+
+        self.__preferredPlanetName = self.__planets[index].name
+        self.__refresh.markDirty(
+            TRADE_ROUTES,
+            PLANET_SELECTION,
+            PLANET_OWNERS,
+            MAX_CONNECTIONS,
+            FORCES,
+            GALACTIC_PLOT,
         )
-        self.__refreshForcesDisplay(preferredPlanetName=self.__planets[index].name)
-        self.__updateGalacticPlot()
 
     def planetShiftSelectedOnPlot(self, index: int) -> None:
         """If two planets in a row are right clicked by a user, this find and adds the trade route, or helps create a new one"""
@@ -265,18 +366,18 @@ class MainWindowPresenter:
 
         if self.__onPlotSelectedStartPlanet and self.__onPlotSelectedEndPlanet:
             if not self.__onPlotSelectedStartPlanet == self.__onPlotSelectedEndPlanet:
+                # The route must be looked up in the routes of the planets checked so far
+                self.__refresh.flush(TRADE_ROUTES)
                 try:
                     traderoute = self.__repository.getTradeRouteByPlanets(
                         self.__onPlotSelectedStartPlanet, self.__onPlotSelectedEndPlanet
                     )
-                    try:
-                        index = self.__availableTradeRoutes.index(traderoute)
-                    except ValueError:
+                    index = self.__availableTradeRouteRows.get(traderoute)
+                    if index is None:
                         print(
                             "Error, trade route not available but it should be! Try turning a planet off and on"
                         )
-
-                    if self.__mainWindow.selectSingleTradeRoute(index):
+                    elif self.__mainWindow.selectSingleTradeRoute(index):
                         self.onTradeRouteChecked(index, True)
                     else:
                         self.onTradeRouteChecked(index, False)
@@ -289,7 +390,7 @@ class MainWindowPresenter:
             self.__onPlotSelectedStartPlanet = None
             self.__onPlotSelectedEndPlanet = None
 
-            self.__updateGalacticPlot()
+            self.__refresh.markDirty(GALACTIC_PLOT)
 
     def onTradeRouteChecked(self, index: int, checked: bool) -> None:
         """If a trade route is checked by the user, add it to the selected campaign and refresh the galaxy plot"""
@@ -306,10 +407,7 @@ class MainWindowPresenter:
                     self.__availableTradeRoutes[index]
                 )
 
-        self.__mainWindow.updatePlanetMaxConnectionsCountDisplay(
-            self.__checkedTradeRoutes
-        )
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(MAX_CONNECTIONS, GALACTIC_PLOT)
 
     def onFactionChecked(self, index: int, checked: bool) -> None:
         """If a faction is checked by the user, add it to the selected campaign"""
@@ -336,18 +434,15 @@ class MainWindowPresenter:
 
         selectedCampaign = self.getSelectedCampaign()
 
-        self.__helper = DisplayHelpers(self.__repository, self.campaigns)
+        # The helper keeps its owner indexes, so only the repository and campaigns are updated
+        self.__helper.repository = self.__repository
+        self.__helper.campaigns = self.campaigns
 
         self.__applyCampaignPlanets(selectedCampaign)
         self.__updateAvailableTradeRoutes(selectedCampaign.planets)
         self.__applyCampaignTradeRoutes(selectedCampaign)
         self.__applyCampaignFactions(selectedCampaign)
-        self.__syncPlanetDependentDisplays(update_planet_count=False)
-        self.__mainWindow.updatePlanetMaxConnectionsCountDisplay(
-            self.__checkedTradeRoutes
-        )
-        self.__refreshForcesDisplay()
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(PLANET_OWNERS, MAX_CONNECTIONS, FORCES, GALACTIC_PLOT)
 
     def getSelectedCampaign(self) -> Campaign:
         if self.__selectedCampaignIndex > -1:
@@ -380,7 +475,7 @@ class MainWindowPresenter:
     ):
         self.__config.autoPlanetConnectionDistance = newAutoConnectionDistance
         self.__showAutoConnections = showAutoConnections
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(GALACTIC_PLOT)
 
     def onNewTradeRoute(self, tradeRoute: TradeRoute):
         """Handles new trade routes"""
@@ -415,9 +510,15 @@ class MainWindowPresenter:
 
         self.__mainWindow.updatePlanetInfoDisplay(planet, campaignForces, filter=entry)
 
+    def onStartingForcesEdited(self, column: str) -> None:
+        """Refreshes the planet owners after a starting forces cell they depend on is edited"""
+        if column in OWNER_COLUMNS:
+            self.__helper.forgetOwners(self.getSelectedCampaign())
+            self.__refresh.markDirty(PLANET_OWNERS, GALACTIC_PLOT)
+
     def onForcesTabActivated(self) -> None:
         """Refresh Forces tab displays when users switch back to it."""
-        self.__refreshForcesDisplay()
+        self.__refresh.markDirty(FORCES)
 
     def onPlanetPositionChanged(self, name, new_x, new_y) -> None:
         """Updates position of a planet in the repository"""
@@ -425,24 +526,24 @@ class MainWindowPresenter:
         planet.x = new_x
         planet.y = new_y
         self.__updatedPlanetCoords[name] = [new_x, new_y]
-        self.__updateGalacticPlot()
+        self.__plot.movePlanet(planet)
 
     def allPlanetsChecked(self, checked: bool) -> None:
         """Select all planets handler: plots all planets"""
         if checked:
+            self.__toggledPlanets.update(set(self.__planets) - self.__checkedPlanets)
             self.__checkedPlanets.update(self.__planets)
             self.getSelectedCampaign().planets.update(self.__planets)
         else:
+            self.__toggledPlanets.update(self.__checkedPlanets)
             self.__checkedPlanets.clear()
             self.getSelectedCampaign().planets.clear()
 
-        self.__mainWindow.updatePlanetComboBox(self.__getNames(self.__checkedPlanets))
-        self.__updateAvailableTradeRoutes(self.__checkedPlanets)
-        self.__refreshForcesDisplay()
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(TRADE_ROUTES, PLANET_OWNERS, FORCES, GALACTIC_PLOT)
 
     def allTradeRoutesChecked(self, checked: bool) -> None:
         """Select all trade routes handler: plots all trade routes"""
+        self.__refresh.flush(TRADE_ROUTES)
         if checked:
             self.__checkedTradeRoutes.update(self.__availableTradeRoutes)
             self.getSelectedCampaign().tradeRoutes.update(self.__availableTradeRoutes)
@@ -450,10 +551,11 @@ class MainWindowPresenter:
             self.__checkedTradeRoutes.clear()
             self.getSelectedCampaign().tradeRoutes.clear()
 
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(MAX_CONNECTIONS, GALACTIC_PLOT)
 
     def saveFile(self, fileName: str) -> None:
         """Saves XML files"""
+        self.__refresh.flush(TRADE_ROUTES)
         campaign = self.getSelectedCampaign()
         factions = self.__repository.factions
         self.__xmlWriter.campaignWriter(campaign, factions, fileName)
@@ -480,6 +582,7 @@ class MainWindowPresenter:
             If True, only save campaigns that specify that they use
             default starting forces, by default False
         """
+        self.__refresh.flush(TRADE_ROUTES)
         factions = self.__repository.factions
         for campaign in self.campaigns:
             if default_forces_only and campaign.useDefaultForces:
@@ -497,14 +600,24 @@ class MainWindowPresenter:
         """Returns the name attribute from a list of GameObjects"""
         return [x.name for x in inputList]
 
+    def __rowsOf(self, inputList: list) -> dict:
+        """Returns the row of each GameObject in a list shown by the main window"""
+        return {x: row for row, x in enumerate(inputList)}
+
     def __updateWidgets(self) -> None:
         """Update the main window widgets"""
+        with self.batchEdit():
+            self.__rebuildWidgets()
+
+    def __rebuildWidgets(self) -> None:
+        """Refills the main window widgets from the repository"""
         self.campaigns: List[Campaign] = sorted(
             self.__repository.campaigns, key=lambda entry: entry.name
         )
         self.__planets: List[Planet] = sorted(
             self.__repository.planets, key=lambda entry: entry.name
         )
+        self.__planetRows = self.__rowsOf(self.__planets)
         self.__tradeRoutes: List[TradeRoute] = sorted(
             self.__repository.tradeRoutes, key=lambda entry: entry.name
         )
@@ -514,6 +627,7 @@ class MainWindowPresenter:
         self.__factions: List[Faction] = sorted(
             self.__repository.factions, key=lambda entry: entry.name
         )
+        self.__factionRows = self.__rowsOf(self.__factions)
 
         selectedCampaign = self.getSelectedCampaign()
         if selectedCampaign:
@@ -534,29 +648,25 @@ class MainWindowPresenter:
         self.__updateSelectedTradeRoutes(self.__selectedCampaignIndex)
         self.__updateSelectedFactions(self.__selectedCampaignIndex)
 
-        self.__updateGalacticPlot()
+        self.__refresh.markDirty(GALACTIC_PLOT)
 
     def __updateSelectedPlanets(self, index: int) -> None:
         """Update the selected planets for the currently selected campaign"""
-        selectedPlanets = []
-
         self.__checkedPlanets.update(self.campaigns[index].planets)
 
-        for p in self.__checkedPlanets:
-            selectedPlanets.append(self.__planets.index(p))
+        selectedPlanets = [self.__planetRows[p] for p in self.__checkedPlanets]
 
         self.__mainWindow.updatePlanetSelection(selectedPlanets)
 
     def __updateSelectedTradeRoutes(self, index: int) -> None:
         """Update the selected planets for the currently selected campaign"""
-        selectedTradeRoutes = []
-
         self.__checkedTradeRoutes = self.campaigns[index].tradeRoutes.intersection(
-            self.__availableTradeRoutes
+            self.__availableTradeRouteRows
         )
 
-        for t in self.__checkedTradeRoutes:
-            selectedTradeRoutes.append(self.__availableTradeRoutes.index(t))
+        selectedTradeRoutes = [
+            self.__availableTradeRouteRows[t] for t in self.__checkedTradeRoutes
+        ]
 
         self.__mainWindow.updateTradeRouteSelection(selectedTradeRoutes)
 
@@ -572,7 +682,7 @@ class MainWindowPresenter:
             return
 
         self.__checkedPlanets.update(campaign.planets)
-        selectedPlanets = [self.__planets.index(p) for p in self.__checkedPlanets]
+        selectedPlanets = [self.__planetRows[p] for p in self.__checkedPlanets]
         self.__mainWindow.updatePlanetSelection(selectedPlanets)
         self.__mainWindow.updatePlanetCountDisplay(selectedPlanets)
 
@@ -587,9 +697,9 @@ class MainWindowPresenter:
 
         for t in self.__checkedTradeRoutes:
             if t is not None:
-                try:
-                    selectedTradeRoutes.append(self.__availableTradeRoutes.index(t))
-                except ValueError:
+                if t in self.__availableTradeRouteRows:
+                    selectedTradeRoutes.append(self.__availableTradeRouteRows[t])
+                else:
                     print("The trade route " + t.name + " is missing!")
             else:
                 missingRoutes.add(t)
@@ -604,25 +714,76 @@ class MainWindowPresenter:
             return
 
         self.__checkedPlayableFactions.update(campaign.playableFactions)
-        selectedFactions = [self.__factions.index(f) for f in self.__checkedPlayableFactions]
+        selectedFactions = [self.__factionRows[f] for f in self.__checkedPlayableFactions]
         self.__mainWindow.updateFactionSelection(selectedFactions)
 
-    def __syncPlanetDependentDisplays(self, update_planet_count: bool) -> None:
+    def __refreshAvailableTradeRoutes(self) -> None:
+        """Adds and removes the trade routes of the planets toggled since the last update"""
+        candidates = set()
+        for planet in self.__toggledPlanets:
+            candidates.update(self.__routesByPlanet.get(planet, ()))
+        self.__toggledPlanets = set()
+
+        added = []
+        removed = []
+        for route in candidates:
+            available = route in self.__newTradeRoutes or (
+                route.start in self.__checkedPlanets and route.end in self.__checkedPlanets
+            )
+            if available and route not in self.__availableTradeRouteRows:
+                added.append(route)
+            elif not available and route in self.__availableTradeRouteRows:
+                removed.append(route)
+
+        if not added and not removed:
+            return
+        if len(added) + len(removed) > MAX_INCREMENTAL_TRADE_ROUTE_CHANGES:
+            self.__updateAvailableTradeRoutes(self.__checkedPlanets)
+            self.__refresh.markDirty(MAX_CONNECTIONS)
+            return
+
+        self.getSelectedCampaign().tradeRoutes.difference_update(removed)
+        self.__checkedTradeRoutes.difference_update(removed)
+
+        removedRows = sorted(self.__availableTradeRouteRows[t] for t in removed)
+        for row in reversed(removedRows):
+            del self.__availableTradeRoutes[row]
+        for route in added:
+            bisect.insort(self.__availableTradeRoutes, route, key=lambda t: t.name)
+        self.__availableTradeRouteRows = self.__rowsOf(self.__availableTradeRoutes)
+
+        addedRows = sorted(self.__availableTradeRouteRows[t] for t in added)
+        self.__mainWindow.removeTradeRoutes(removedRows)
+        self.__mainWindow.insertTradeRoutes(
+            addedRows, [self.__availableTradeRoutes[row].name for row in addedRows]
+        )
+        self.__refresh.markDirty(MAX_CONNECTIONS)
+
+    def __refreshPlanetSelection(self) -> None:
+        selectedPlanets = [self.__planetRows[p] for p in self.__checkedPlanets]
+        self.__mainWindow.updatePlanetSelection(selectedPlanets)
+        self.__mainWindow.updatePlanetCountDisplay(selectedPlanets)
+
+    def __refreshPlanetOwners(self) -> None:
         self.__mainWindow.updatePlanetComboBox(self.__getNames(self.__checkedPlanets))
         self.__planetOwners = self.__helper.getPlanetOwners(
             self.__selectedCampaignIndex, self.__checkedPlanets
         )
         self.__mainWindow.updateTotalFactionIncome(
             self.__helper.calculateFactionIncome(
-                self.getSelectedCampaign().planets, self.__planetOwners
+                self.__checkedPlanets, self.__planetOwners
             )
         )
 
-        if update_planet_count:
-            selected_planets = []
-            for p in self.__checkedPlanets:
-                selected_planets.append(self.__getNames(self.__planets).index(p.name))
-            self.__mainWindow.updatePlanetCountDisplay(selected_planets)
+    def __refreshMaxConnections(self) -> None:
+        self.__mainWindow.updatePlanetMaxConnectionsCountDisplay(
+            self.__checkedTradeRoutes
+        )
+
+    def __refreshForces(self) -> None:
+        preferredPlanetName = self.__preferredPlanetName
+        self.__preferredPlanetName = None
+        self.__refreshForcesDisplay(preferredPlanetName)
 
     def __refreshForcesDisplay(self, preferredPlanetName: Optional[str] = None) -> None:
         planetNames = sorted(self.__getNames(self.__checkedPlanets))
@@ -642,6 +803,12 @@ class MainWindowPresenter:
 
     def __updateAvailableTradeRoutes(self, planetList: list):
         """Updates the list of available trade routes based on the planets in the GC"""
+        self.__routesByPlanet = dict()
+        for tr in self.__tradeRoutes:
+            self.__routesByPlanet.setdefault(tr.start, set()).add(tr)
+            self.__routesByPlanet.setdefault(tr.end, set()).add(tr)
+        self.__toggledPlanets = set()
+
         privateAvailableTradeRoutes = set(
             filter(
                 lambda tr: tr.start in planetList and tr.end in planetList,
@@ -660,6 +827,7 @@ class MainWindowPresenter:
         self.__availableTradeRoutes = sorted(
             privateAvailableTradeRoutes, key=lambda entry: entry.name
         )
+        self.__availableTradeRouteRows = self.__rowsOf(self.__availableTradeRoutes)
         self.__mainWindow.updateTradeRoutes(
             self.__getNames(self.__availableTradeRoutes)
         )
@@ -667,15 +835,31 @@ class MainWindowPresenter:
 
     def __updateSelectedFactions(self, index: int) -> None:
         """Update the selected factions for the currently selected campaign"""
-        selectedFactions = []
-
         self.__checkedPlayableFactions.update(self.campaigns[index].playableFactions)
 
-        for f in self.__checkedPlayableFactions:
-            selectedFactions.append(self.__factions.index(f))
+        selectedFactions = [self.__factionRows[f] for f in self.__checkedPlayableFactions]
 
         self.__mainWindow.updateFactionSelection(selectedFactions)
 
+    def __refreshUpdatedObjects(self, kinds: Set[str]) -> None:
+        """Refreshes the views showing planets, trade routes or factions that changed in place"""
+        if TRADE_ROUTE_FILE in kinds:
+            # Routes may connect other planets now, so they are all filtered again
+            self.__updateAvailableTradeRoutes(self.__checkedPlanets)
+            self.__refresh.markDirty(MAX_CONNECTIONS)
+        if PLANET_FILE in kinds or FACTION_FILE in kinds:
+            self.__refresh.markDirty(PLANET_OWNERS)
+        if PLANET_FILE in kinds:
+            self.__refresh.markDirty(FORCES)
+        self.__refresh.markDirty(GALACTIC_PLOT)
+
+    def __restartWatcher(self, force: bool = False) -> None:
+        """Takes a fresh snapshot of the data folders if watching is enabled"""
+        if self.__watcher is not None or force:
+            self.__watcher = RepositoryWatcher(
+                XMLStructure.dataFolders, [self.__config.startingForcesLibraryURL]
+            )
+
     def __updateGalacticPlot(self):
         autoConnectionDistance = self.config.autoPlanetConnectionDistance
         if not self.__showAutoConnections:
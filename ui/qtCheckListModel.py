@@ -0,0 +1,111 @@
+from typing import List
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+
+class CheckListModel(QAbstractTableModel):
+    """Single column list of checkable names. Rows are the rows of the presenter's sorted
+    lists and the check states are one array, so a whole list is filled or checked with a
+    single reset or change signal"""
+
+    rowChecked = pyqtSignal(int, bool)
+
+    def __init__(self, header: str):
+        super().__init__()
+        self._header = header
+        self._names: List[str] = []
+        self._checked = np.zeros(0, dtype=bool)
+
+    def setNames(self, names: List[str]) -> None:
+        """Replaces all rows with unchecked names"""
+        self.beginResetModel()
+        self._names = list(names)
+        self._checked = np.zeros(len(self._names), dtype=bool)
+        self.endResetModel()
+
+    def insertNames(self, rows: List[int], names: List[str]) -> None:
+        """Inserts unchecked names. Rows are ascending and refer to the list after the insertion"""
+        for row, name in zip(rows, names):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._names.insert(row, name)
+            self._checked = np.insert(self._checked, row, False)
+            self.endInsertRows()
+
+    def removeNames(self, rows: List[int]) -> None:
+        """Removes the rows"""
+        for row in sorted(rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._names[row]
+            self._checked = np.delete(self._checked, row)
+            self.endRemoveRows()
+
+    def names(self) -> List[str]:
+        return self._names
+
+    def isChecked(self, row: int) -> bool:
+        return bool(self._checked[row])
+
+    def setChecked(self, row: int, checked: bool) -> None:
+        self._checked[row] = checked
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+    def setCheckedRows(self, rows: List[int]) -> None:
+        """Checks exactly the rows given"""
+        self._checked[:] = False
+        self._checked[np.asarray(list(rows), dtype=np.intp)] = True
+        self.__checkStatesChanged()
+
+    def setAllChecked(self, checked: bool) -> None:
+        self._checked[:] = checked
+        self.__checkStatesChanged()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if self._checked[index.row()]:
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Toggles a row checked by the user and emits rowChecked"""
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.setChecked(index.row(), checked)
+        self.rowChecked.emit(index.row(), checked)
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self._header
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+
+    def __checkStatesChanged(self) -> None:
+        if self._names:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._names) - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
@@ -1,43 +1,44 @@
-from PyQt6.QtCore import QAbstractTableModel, Qt
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 
 class PandasModel(QAbstractTableModel):
+    """Table model over a DataFrame, optionally showing only the rows of one planet.
+    The shown rows are kept as positions in the frame and display strings are cached"""
+
     def __init__(self, data, filter):
         super().__init__()
         self._data = data
         self._filter = filter
         self._filter_column = "Planet"
-        self._mask = self._data[self._filter_column] == self._filter
-
-    def rowCount(self, index):
         if self._filter:
-            return self._data.loc[self._mask].shape[0]
+            self._rows = np.flatnonzero(
+                (self._data[self._filter_column] == self._filter).to_numpy()
+            )
         else:
-            return self._data.shape[0]
+            self._rows = np.arange(self._data.shape[0])
+        self._display = dict()
+
+    def rowCount(self, index=QModelIndex()):
+        return len(self._rows)
 
     def columnCount(self, parent=None):
-        if self._filter:
-            return self._data.loc[self._mask].shape[1]
-        else:
-            return self._data.shape[1]
+        return self._data.shape[1]
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if index.isValid():
             if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-                if self._filter:
-                    # Attempt to filter the view in-place
-                    value = self._data.loc[self._mask].iat[index.row(), index.column()]
-                else:
-                    value = self._data.iloc[index.row(), index.column()]
-                return str(value)
+                key = (index.row(), index.column())
+                value = self._display.get(key)
+                if value is None:
+                    value = str(self._data.iat[self._rows[index.row()], index.column()])
+                    self._display[key] = value
+                return value
 
     def setData(self, index, value, role):
         if role == Qt.ItemDataRole.EditRole:
-            if self._filter:
-                start_index = self._data.loc[self._mask].index[0]
-                self._data.iloc[index.row() + start_index, index.column()] = value
-            else:
-                self._data.loc[index.row(), index.column()] = value
+            self._data.iat[self._rows[index.row()], index.column()] = value
+            self._display.pop((index.row(), index.column()), None)
             self.dataChanged.emit(index, index)
             return True
         return False
@@ -57,10 +58,12 @@ class PandasModel(QAbstractTableModel):
         )
 
     def sort(self, column, order):
-        colname = self._data.columns.tolist()[column]
+        # Only the shown rows are reordered, the frame keeps its order
         self.layoutAboutToBeChanged.emit()
-        self._data.sort_values(
-            colname, ascending=order == Qt.SortOrder.AscendingOrder, inplace=True
-        )
-        self._data.reset_index(inplace=True, drop=True)
+        values = self._data.iloc[self._rows, column].reset_index(drop=True)
+        positions = values.sort_values(
+            ascending=order == Qt.SortOrder.AscendingOrder, kind="stable"
+        ).index
+        self._rows = self._rows[positions.to_numpy()]
+        self._display.clear()
         self.layoutChanged.emit()
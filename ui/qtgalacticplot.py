@@ -1,14 +1,164 @@
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from PyQt6.QtCore import pyqtSignal
+from matplotlib import rcParams
 from matplotlib.backends.backend_qtagg import (
     FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar,
 )
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Axes, Figure
+from matplotlib.path import Path
+import numpy as np
+from typing import Optional
+
+from gameObjects.planetTable import planetColumns
+from GalaxyStyle import (
+    BACKGROUND_PLANET_ALPHA,
+    BACKGROUND_PLANET_COLOR,
+    TRADE_ROUTE_COLOR,
+    TRADE_ROUTE_HIGHLIGHT_COLOR,
+    TRADE_ROUTE_TRACE_COLOR,
+    planetColors,
+)
+from SpatialGrid import SpatialGrid
+
+# How far from a planet marker the cursor may be to hover or click it, in pixels
+PLANET_PICK_RADIUS = 5
+# Size in pixels of the screen cells used for level of detail. Background planets are
+# thinned to one per cell and routes joining the same cells are drawn once
+DETAIL_CELL_PIXELS = 3
+# How far outside the view planets and routes are still drawn, in pixels
+DETAIL_MARGIN_PIXELS = 10
+
+
+def segmentsBetween(starts, ends) -> np.ndarray:
+    """Returns an (n, 2, 2) array of line segments from each start planet to its end planet"""
+    startX, startY = planetColumns(starts, "x", "y")
+    endX, endY = planetColumns(ends, "x", "y")
+    return np.stack(
+        [np.column_stack([startX, startY]), np.column_stack([endX, endY])], axis=1
+    ).reshape(-1, 2, 2)
+
+
+def setCollectionPaths(collection, paths: list) -> None:
+    """Replaces the paths of a collection with existing Path objects, as set_segments would
+    build a new Path for every segment"""
+    collection.get_paths()[:] = paths
+    collection.stale = True
+
+
+def insideView(x: np.ndarray, y: np.ndarray, view: tuple) -> np.ndarray:
+    """Returns a mask of the points inside view = (left, right, bottom, top)"""
+    left, right, bottom, top = view
+    return (x >= left) & (x <= right) & (y >= bottom) & (y <= top)
+
+
+def firstPerCell(coordinates: np.ndarray, cellSize: float) -> np.ndarray:
+    """Returns the sorted positions of the first row of each distinct set of cells, where
+    each row holds the coordinates of one or more points"""
+    if not len(coordinates):
+        return np.empty(0, dtype=np.intp)
+    cells = np.floor(coordinates / cellSize).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+    return np.sort(first)
+
+
+class PlotRows:
+    """Items drawn by one artist, kept in rows of parallel NumPy arrays with a row lookup.
+    Removing an item moves the last row into its place, so a change only touches the rows
+    of the items involved"""
+
+    def __init__(self, **columns):
+        """columns maps a column name to the shape of one row, e.g. xy=(2,)"""
+        self.__items: list = []
+        self.__rows: dict = dict()
+        self.__columns: dict = {
+            name: np.empty((0,) + shape) for name, shape in columns.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.__rows
+
+    @property
+    def items(self) -> list:
+        return self.__items
+
+    def rowOf(self, item) -> int:
+        return self.__rows[item]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.__columns[name]
+
+    def add(self, items: list, **values) -> None:
+        """Appends items, with one row per item in each of the value arrays"""
+        for item in items:
+            self.__rows[item] = len(self.__items)
+            self.__items.append(item)
+        for name, column in self.__columns.items():
+            self.__columns[name] = np.concatenate(
+                [column, np.asarray(values[name]).reshape((-1,) + column.shape[1:])]
+            )
+
+    def remove(self, items) -> None:
+        for item in items:
+            row = self.__rows.pop(item)
+            last = len(self.__items) - 1
+            if row != last:
+                moved = self.__items[last]
+                self.__items[row] = moved
+                self.__rows[moved] = row
+                for column in self.__columns.values():
+                    column[row] = column[last]
+            self.__items.pop()
+
+        for name, column in self.__columns.items():
+            self.__columns[name] = column[: len(self.__items)]
+
+
+class BlitOverlay:
+    """Animated artists drawn on top of a cached copy of the rest of the figure. A full draw
+    of the canvas refreshes the cache; update only restores it and redraws the overlay"""
+
+    def __init__(self, canvas: FigureCanvas):
+        self.__canvas: FigureCanvas = canvas
+        self.__artists: list = []
+        self.__background = None
+        canvas.mpl_connect("draw_event", self.__onDraw)
+
+    def setArtists(self, artists: list) -> None:
+        """Makes the artists animated, so full draws of the figure leave them out"""
+        for artist in artists:
+            artist.set_animated(True)
+        self.__artists = artists
+        self.__background = None
+
+    def update(self) -> None:
+        """Redraws the overlay, or schedules a full draw if there is no background yet"""
+        if self.__background is None:
+            self.__canvas.draw_idle()
+            return
+
+        self.__canvas.restore_region(self.__background)
+        self.__drawArtists()
+        self.__canvas.blit(self.__canvas.figure.bbox)
+
+    def __onDraw(self, event) -> None:
+        self.__background = self.__canvas.copy_from_bbox(self.__canvas.figure.bbox)
+        self.__drawArtists()
+
+    def __drawArtists(self) -> None:
+        for artist in self.__artists:
+            self.__canvas.figure.draw_artist(artist)
 
 
 class QtGalacticPlot(QWidget):
-    """Class for plotting the galaxy"""
+    """Class for plotting the galaxy. The artists are created once and then updated in place:
+    changes to the selected planets, their owners, the trade routes or planet positions only
+    touch the affected offsets, colors and segments. The axes are rebuilt when the set of all
+    planets changes"""
 
     # signal to send to main window presenter when a planet is selected in the plot
     planetSelectedSignal = pyqtSignal(int)
@@ -21,9 +171,16 @@ class QtGalacticPlot(QWidget):
         self.__is_first_run = True
 
         self.__galacticPlotCanvas: FigureCanvas = FigureCanvas(Figure())
+        # The hover label, trade route trace and route highlight change on mouse moves,
+        # so they are blitted over the rest of the plot instead of redrawing it
+        self.__overlay: BlitOverlay = BlitOverlay(self.__galacticPlotCanvas)
 
-        self.__galacticPlotCanvas.mpl_connect("pick_event", self.__planetSelect)
+        self.__galacticPlotCanvas.mpl_connect("button_press_event", self.__planetSelect)
         self.__galacticPlotCanvas.mpl_connect("motion_notify_event", self.__planetHover)
+        self.__galacticPlotCanvas.mpl_connect("resize_event", self.__onViewChanged)
+        self.__galacticPlotCanvas.mpl_connect("draw_event", self.__onDraw)
+        # Set when only the x limits changed so far, see __onXLimChanged
+        self.__viewPending: bool = False
 
         self.__galacticPlotNavBar: NavigationToolbar = NavigationToolbar(
             self.__galacticPlotCanvas, self.__galacticPlotWidget
@@ -44,19 +201,35 @@ class QtGalacticPlot(QWidget):
             zorder=9,
         )
         self.__annotate.set_visible(False)
-        self.__planetNames = []
+
+        # All planets, drawn faintly in the background and used for picking and hovering
+        self.__allPlanets = []
+        self.__planetRows = dict()
+        self.__planetX = np.empty(0)
+        self.__planetY = np.empty(0)
         self.__planetOwners = []
-        self.__starbaseLevel = []
-        self.__shipyardLevel = []
-        self.__SupportsStructure = []
-        self.__income = []
-        self.__groundStructureSlots = []
         self.__planetsScatter = None
+        self.__planetGrid = None
+
+        # Planets of the campaign, drawn on top in their owner's color
+        self.__selectedPlanets = PlotRows(xy=(2,), face=(4,), edge=(4,))
+        self.__selectedOwners = dict()
+        self.__selectedScatter = None
+
+        self.__tradeRoutes = PlotRows(segment=(2, 2))
+        self.__tradeRoutePaths = dict()
+        # The drawn routes at each planet, for highlighting and moving planets
+        self.__routesByPlanet = dict()
+        self.__tradeRouteCollection = None
+        self.__tradeRouteHighlight = None
+
+        self.__autoConnectionDistance = 0
+        self.__autoConnections = None
+
         self.__tradeRouteTraceStart = None
-        self.__tradeRouteTrace = []
-        self.__tradeRouteLines = []
-        self.__tradeRouteConnections = []
+        self.__tradeRouteTrace = None
         self.__highlightedPlanetIndex = None
+        self.__annotatedIndex = None
 
     def plotGalaxy(
         self,
@@ -66,14 +239,126 @@ class QtGalacticPlot(QWidget):
         planetOwners,
         autoPlanetConnectionDistance: int = 0,
     ) -> None:
-        """Plots all planets as alpha = 0.1, then overlays all selected planets and trade routes"""
-        if self.__is_first_run:
-            x = [p.x for p in allPlanets]
-            y = [p.y for p in allPlanets]
-            self.__axes.set_xlim(min(x), max(x))
-            self.__axes.set_ylim(min(y), max(y))
+        """Plots all planets as alpha = 0.1, then overlays all selected planets and trade routes.
+        Only what changed since the previous call is updated"""
+        allPlanets = list(allPlanets)
+        if self.__planetsScatter is None or allPlanets != self.__allPlanets:
+            self.__rebuild(allPlanets)
+        else:
+            self.__refreshPositions()
+
+        self.setSelectedPlanets(planets, planetOwners)
+        self.setTradeRoutes(tradeRoutes)
+        self.setAutoConnectionDistance(autoPlanetConnectionDistance)
+
+    def setSelectedPlanets(self, planets, planetOwners) -> None:
+        """Updates the campaign planets drawn on top, where planetOwners holds the owner of
+        each planet in the same order or is empty. Only added or removed planets and planets
+        with a new owner are touched"""
+        planets = list(planets)
+        owners = list(planetOwners) if planetOwners else [None] * len(planets)
+        selected = dict(zip(planets, owners))
+
+        removed = [p for p in self.__selectedOwners if p not in selected]
+        changed = [
+            p
+            for p, owner in selected.items()
+            if p in self.__selectedOwners and self.__selectedOwners[p] is not owner
+        ]
+        added = [p for p in selected if p not in self.__selectedOwners]
+        if not (removed or changed or added):
+            return
+
+        self.__selectedPlanets.remove(removed)
+        for planet in removed:
+            self.__setOwnerLabel(planet, None)
+
+        for planet in changed:
+            row = self.__selectedPlanets.rowOf(planet)
+            face, edge = planetColors(selected[planet])
+            self.__selectedPlanets.column("face")[row] = face
+            self.__selectedPlanets.column("edge")[row] = edge
+            self.__setOwnerLabel(planet, selected[planet])
+
+        if added:
+            x, y = planetColumns(added, "x", "y")
+            colors = [planetColors(selected[p]) for p in added]
+            self.__selectedPlanets.add(
+                added,
+                xy=np.column_stack([x, y]),
+                face=[face for face, _ in colors],
+                edge=[edge for _, edge in colors],
+            )
+            for planet in added:
+                self.__setOwnerLabel(planet, selected[planet])
+
+        self.__selectedOwners = selected
+        # The tooltip shows owners, so it is rebuilt on the next hover
+        self.__annotatedIndex = None
+        self.__applySelectedPlanetDetail()
+        if removed or added:
+            self.__updateAutoConnections()
+        self.__galacticPlotCanvas.draw_idle()
+
+    def setTradeRoutes(self, tradeRoutes) -> None:
+        """Updates the drawn trade routes, touching only routes that were added or removed"""
+        tradeRoutes = set(tradeRoutes)
+        removed = [t for t in self.__tradeRoutes.items if t not in tradeRoutes]
+        added = [t for t in tradeRoutes if t not in self.__tradeRoutes]
+        if not (removed or added):
+            return
+
+        self.__tradeRoutes.remove(removed)
+        for route in removed:
+            del self.__tradeRoutePaths[route]
+            for planet in (route.start, route.end):
+                routes = self.__routesByPlanet.get(planet)
+                if routes is not None:
+                    routes.discard(route)
+                    if not routes:
+                        del self.__routesByPlanet[planet]
+        self.__tradeRoutes.add(
+            added,
+            segment=segmentsBetween([t.start for t in added], [t.end for t in added]),
+        )
+        for route in added:
+            self.__routesByPlanet.setdefault(route.start, set()).add(route)
+            self.__routesByPlanet.setdefault(route.end, set()).add(route)
+        self.__updateTradeRoutePaths(added)
+        self.__rehighlight()
+        self.__galacticPlotCanvas.draw_idle()
+
+    def setAutoConnectionDistance(self, distance: int) -> None:
+        """Draws connections between selected planets closer than distance, or none for 0"""
+        if distance == self.__autoConnectionDistance:
+            return
+
+        self.__autoConnectionDistance = distance
+        self.__updateAutoConnections()
+        self.__galacticPlotCanvas.draw_idle()
+
+    def movePlanet(self, planet) -> None:
+        """Redraws a planet and its trade routes and connections after its position changed"""
+        row = self.__planetRows.get(planet)
+        if row is not None:
+            self.__planetX[row] = np.nan if planet.x is None else planet.x
+            self.__planetY[row] = np.nan if planet.y is None else planet.y
+            self.__applyPlanetDetail()
+            self.__planetGrid = None
+        self.__updateMovedPlanets([planet])
+        self.__galacticPlotCanvas.draw_idle()
+
+    def getWidget(self) -> QWidget:
+        """Returns the plot widget"""
+        return self.__galacticPlotWidget
 
-        self.__is_first_run = False
+    def __rebuild(self, allPlanets: list) -> None:
+        """Clears the axes and creates every artist for a new set of planets"""
+        x, y = planetColumns(allPlanets, "x", "y")
+        if self.__is_first_run and np.isfinite(x).any() and np.isfinite(y).any():
+            self.__axes.set_xlim(np.nanmin(x), np.nanmax(x))
+            self.__axes.set_ylim(np.nanmin(y), np.nanmax(y))
+            self.__is_first_run = False
 
         xlim = self.__axes.get_xlim()
         ylim = self.__axes.get_ylim()
@@ -81,6 +366,9 @@ class QtGalacticPlot(QWidget):
         self.__axes.clear()
         self.__axes.set_xlim(xlim)
         self.__axes.set_ylim(ylim)
+        # Clearing the axes also drops their callbacks
+        self.__axes.callbacks.connect("xlim_changed", self.__onXLimChanged)
+        self.__axes.callbacks.connect("ylim_changed", self.__onViewChanged)
 
         # Has to be set again here for the planet hover labels to work
         self.__annotate = self.__axes.annotate(
@@ -93,204 +381,329 @@ class QtGalacticPlot(QWidget):
             zorder=9,
         )
         self.__annotate.set_visible(False)
-        self.__tradeRouteTrace = self.__axes.plot([0, 0], [0, 0])
-        self.__tradeRouteLines = []
-        self.__tradeRouteConnections = []
+        (self.__tradeRouteTrace,) = self.__axes.plot(
+            [], [], color=TRADE_ROUTE_TRACE_COLOR, lw=0.8, ls="--", visible=False
+        )
         self.__highlightedPlanetIndex = None
+        self.__annotatedIndex = None
 
-        self.__planetNames = []
-        self.__planetOwners = []
-        self.__starbaseLevel = []
-        self.__shipyardLevel = []
-        self.__SupportsStructure = []
-        self.__income = []
-        self.__groundStructureSlots = []
-
-        x = []
-        y = []
-
-        for ap in allPlanets:
-            found_pa = False
-            for pa, po in zip(planets, planetOwners):
-                if ap.name == pa.name:
-                    self.__planetOwners.append(po.name)
-                    found_pa = True
-            if not found_pa:
-                self.__planetOwners.append("N/A")
-
-        for p in allPlanets:
-            x.append(p.x)
-            y.append(p.y)
-            self.__planetNames.append(p.name)
-            self.__starbaseLevel.append(p.starbaseLevel)
-            self.__shipyardLevel.append(p.shipyardLevel)
-            self.__income.append(p.income)
-            self.__SupportsStructure.append(p.SupportsStructure)
-            self.__groundStructureSlots.append(p.groundStructureSlots)
-
+        self.__allPlanets = allPlanets
+        self.__planetRows = {planet: row for row, planet in enumerate(allPlanets)}
+        self.__planetX = x
+        self.__planetY = y
+        self.__planetOwners = ["N/A"] * len(allPlanets)
         self.__planetsScatter = self.__axes.scatter(
-            x, y, c="grey", alpha=0.1, picker=5, zorder=2
+            [], [], c=BACKGROUND_PLANET_COLOR, alpha=BACKGROUND_PLANET_ALPHA, zorder=2
+        )
+        self.__applyPlanetDetail()
+        self.__planetGrid = None
+
+        self.__selectedPlanets = PlotRows(xy=(2,), face=(4,), edge=(4,))
+        self.__selectedOwners = dict()
+        self.__selectedScatter = self.__axes.scatter([], [], zorder=4)
+
+        # All routes are one collection. Highlighted routes are copied into a second, wider
+        # collection drawn above the planets
+        self.__tradeRoutes = PlotRows(segment=(2, 2))
+        self.__tradeRoutePaths = dict()
+        self.__routesByPlanet = dict()
+        self.__tradeRouteCollection = LineCollection(
+            [], colors=[TRADE_ROUTE_COLOR], linewidths=1.0, zorder=1
+        )
+        self.__tradeRouteHighlight = LineCollection(
+            [], colors=[TRADE_ROUTE_HIGHLIGHT_COLOR], linewidths=2.0, zorder=5
+        )
+        self.__autoConnections = LineCollection([], colors="k", alpha=0.1, zorder=1)
+        self.__axes.add_collection(self.__tradeRouteCollection, autolim=False)
+        self.__axes.add_collection(self.__tradeRouteHighlight, autolim=False)
+        self.__axes.add_collection(self.__autoConnections, autolim=False)
+        self.__updateAutoConnections()
+        self.__overlay.setArtists(
+            [self.__tradeRouteHighlight, self.__tradeRouteTrace, self.__annotate]
         )
 
-        x1 = 0
-        y1 = 0
-        x2 = 0
-        y2 = 0
-
-        # loop through routes
-        for t in tradeRoutes:
-            x1 = t.start.x
-            y1 = t.start.y
-            x2 = t.end.x
-            y2 = t.end.y
-            # plot each route (start, end)
-            route_line = self.__axes.plot([x1, x2], [y1, y2], "k-", alpha=0.4, zorder=1)[
-                0
-            ]
-            self.__tradeRouteLines.append(route_line)
-            self.__tradeRouteConnections.append((t.start.name, t.end.name))
-
-        # Create automatic connections between planets
-        if autoPlanetConnectionDistance > 0:
-            for p1 in planets:
-                for p2 in planets:
-                    if p1 == p2:
-                        break
-                    dist: float = p1.distanceTo(p2)
-                    if dist < autoPlanetConnectionDistance:
-                        self.__axes.plot(
-                            [p1.x, p2.x], [p1.y, p2.y], "k-", alpha=0.1, zorder=1
-                        )
-
-        x = []
-        y = []
-
-        if planetOwners:
-            color = []
-            for p, f in zip(planets, planetOwners):
-                x.append(p.x)
-                y.append(p.y)
-                if f and f.color:
-                    color.append(tuple(f.color))
-                else:
-                    color.append((0, 0, 0))
-
-            self.__axes.scatter(x, y, c=color, edgecolors="black", zorder=4)
-        else:
-            for p in planets:
-                x.append(p.x)
-                y.append(p.y)
+        self.__galacticPlotCanvas.draw_idle()
 
-            self.__axes.scatter(x, y, c="grey", zorder=3)
+    def __refreshPositions(self) -> None:
+        """Finds planets whose coordinates changed since they were drawn and moves them"""
+        x, y = planetColumns(self.__allPlanets, "x", "y")
+        unchanged = ((x == self.__planetX) | (np.isnan(x) & np.isnan(self.__planetX))) & (
+            (y == self.__planetY) | (np.isnan(y) & np.isnan(self.__planetY))
+        )
+        moved = np.flatnonzero(~unchanged)
+        if not len(moved):
+            return
 
+        self.__planetX = x
+        self.__planetY = y
+        self.__applyPlanetDetail()
+        self.__planetGrid = None
+        self.__updateMovedPlanets([self.__allPlanets[row] for row in moved])
         self.__galacticPlotCanvas.draw_idle()
 
-    def getWidget(self) -> QWidget:
-        """Returns the plot widget"""
-        return self.__galacticPlotWidget
+    def __updateMovedPlanets(self, planets: list) -> None:
+        selected = [p for p in planets if p in self.__selectedPlanets]
+        if selected:
+            x, y = planetColumns(selected, "x", "y")
+            rows = [self.__selectedPlanets.rowOf(p) for p in selected]
+            self.__selectedPlanets.column("xy")[rows] = np.column_stack([x, y])
+            self.__applySelectedPlanetDetail()
+            self.__updateAutoConnections()
+
+        routes = list(
+            set().union(*(self.__routesByPlanet.get(planet, ()) for planet in planets))
+        )
+        if routes:
+            rows = [self.__tradeRoutes.rowOf(t) for t in routes]
+            self.__tradeRoutes.column("segment")[rows] = segmentsBetween(
+                [t.start for t in routes], [t.end for t in routes]
+            )
+            self.__updateTradeRoutePaths(routes)
+            self.__rehighlight()
+
+    def __updateTradeRoutePaths(self, changedRoutes: list) -> None:
+        """Creates paths for the changed routes only and reuses the rest"""
+        segments = self.__tradeRoutes.column("segment")
+        for route in changedRoutes:
+            self.__tradeRoutePaths[route] = Path(segments[self.__tradeRoutes.rowOf(route)])
+        self.__applyTradeRouteDetail()
+
+    def __onXLimChanged(self, event) -> None:
+        """Zooming and panning set the x limits and then the y limits, so the level of
+        detail is picked once the y limits follow, or before the next draw if they do not"""
+        self.__viewPending = True
+
+    def __onDraw(self, event) -> None:
+        if self.__viewPending:
+            self.__onViewChanged(event)
+            self.__galacticPlotCanvas.draw_idle()
+
+    def __onViewChanged(self, event) -> None:
+        """Picks the level of detail again after zooming, panning or resizing"""
+        self.__viewPending = False
+        if self.__planetsScatter is None:
+            return
+
+        self.__applyPlanetDetail()
+        self.__applySelectedPlanetDetail()
+        self.__applyTradeRouteDetail()
+
+    def __viewport(self) -> tuple:
+        """Returns the view limits grown by DETAIL_MARGIN_PIXELS and the data size of a pixel"""
+        left, right = sorted(self.__axes.get_xlim())
+        bottom, top = sorted(self.__axes.get_ylim())
+        pixel = max(
+            (right - left) / max(self.__axes.bbox.width, 1),
+            (top - bottom) / max(self.__axes.bbox.height, 1),
+        )
+        margin = DETAIL_MARGIN_PIXELS * pixel
+        return (left - margin, right + margin, bottom - margin, top + margin), pixel
+
+    def __applyPlanetDetail(self) -> None:
+        """Draws the background planets in view, at most one per screen cell"""
+        view, pixel = self.__viewport()
+        visible = np.flatnonzero(insideView(self.__planetX, self.__planetY, view))
+        points = np.column_stack([self.__planetX[visible], self.__planetY[visible]])
+        self.__planetsScatter.set_offsets(
+            points[firstPerCell(points, DETAIL_CELL_PIXELS * pixel)]
+        )
+
+    def __applySelectedPlanetDetail(self) -> None:
+        """Draws the campaign planets in view"""
+        view, _ = self.__viewport()
+        xy = self.__selectedPlanets.column("xy")
+        visible = insideView(xy[:, 0], xy[:, 1], view)
+        self.__selectedScatter.set_offsets(xy[visible])
+        self.__selectedScatter.set_facecolors(self.__selectedPlanets.column("face")[visible])
+        self.__selectedScatter.set_edgecolors(self.__selectedPlanets.column("edge")[visible])
+
+    def __applyTradeRouteDetail(self) -> None:
+        """Draws the trade routes crossing the view. Routes joining the same two screen cells
+        are drawn once, and routes within a single cell are left to the planet markers"""
+        view, pixel = self.__viewport()
+        segments = self.__tradeRoutes.column("segment")
+        left, right, bottom, top = view
+        rows = np.flatnonzero(
+            (segments[:, :, 0].max(axis=1) >= left)
+            & (segments[:, :, 0].min(axis=1) <= right)
+            & (segments[:, :, 1].max(axis=1) >= bottom)
+            & (segments[:, :, 1].min(axis=1) <= top)
+        )
+
+        cellSize = DETAIL_CELL_PIXELS * pixel
+        ends = np.floor(segments[rows] / cellSize).reshape(-1, 4)
+        rows = rows[(ends[:, 0] != ends[:, 2]) | (ends[:, 1] != ends[:, 3])]
+        rows = rows[firstPerCell(segments[rows].reshape(-1, 4), cellSize)]
+
+        items = self.__tradeRoutes.items
+        setCollectionPaths(
+            self.__tradeRouteCollection,
+            [self.__tradeRoutePaths[items[row]] for row in rows],
+        )
+
+    def __updateAutoConnections(self) -> None:
+        distance = self.__autoConnectionDistance
+        if self.__autoConnections is None:
+            return
+        if distance <= 0 or not len(self.__selectedPlanets):
+            self.__autoConnections.set_segments([])
+            return
+
+        points = self.__selectedPlanets.column("xy")
+        first, second = SpatialGrid(points[:, 0], points[:, 1], distance).pairsWithin(
+            distance
+        )
+        # Connections are never styled one by one, so they are a single NaN-separated
+        # segment, which is one path instead of one per connection
+        gaps = np.full((len(first), 2), np.nan)
+        connections = np.stack([points[first], points[second], gaps], axis=1)
+        self.__autoConnections.set_segments([connections.reshape(-1, 2)])
+
+    def __setOwnerLabel(self, planet, owner) -> None:
+        row = self.__planetRows.get(planet)
+        if row is not None:
+            self.__planetOwners[row] = owner.name if owner is not None else "N/A"
+
+    def __rehighlight(self) -> None:
+        """Reapplies the hover highlight after the trade routes changed"""
+        if self.__highlightedPlanetIndex is None:
+            self.__reset_trade_route_highlight()
+        else:
+            self.__highlight_connected_trade_routes(self.__highlightedPlanetIndex)
 
     def __planetSelect(self, event) -> None:
         """Event handler for selecting a planet on the map"""
-        planet_index = event.ind[0]
-        if event.mouseevent.button == 3:
+        planet_index = self.__planetAt(event)
+        if planet_index is None:
+            return
+
+        if event.button == 3:
             self.planetShiftSelectedSignal.emit(planet_index)
         else:
             self.planetSelectedSignal.emit(planet_index)
 
+    def __planetAt(self, event) -> Optional[int]:
+        """Returns the index of the planet nearest to the mouse within PLANET_PICK_RADIUS
+        pixels of its marker, or None"""
+        if event.inaxes != self.__axes or not len(self.__allPlanets):
+            return None
+
+        if self.__planetGrid is None:
+            self.__planetGrid = self.__createPlanetGrid()
+
+        # Markers are drawn at the default scatter size, whose radius adds to the tolerance
+        markerRadius = rcParams["lines.markersize"] / 2 * self.__axes.figure.dpi / 72
+        tolerance = PLANET_PICK_RADIUS + markerRadius
+        corners = self.__axes.transData.inverted().transform(
+            [(event.x, event.y), (event.x + tolerance, event.y + tolerance)]
+        )
+        radius = np.abs(corners[1] - corners[0]).max()
+        return self.__planetGrid.nearest(event.xdata, event.ydata, radius)
+
+    def __createPlanetGrid(self) -> SpatialGrid:
+        """Indexes the planet positions with about one planet per cell"""
+        finite = np.isfinite(self.__planetX) & np.isfinite(self.__planetY)
+        extent = 0.0
+        if finite.any():
+            extent = max(np.ptp(self.__planetX[finite]), np.ptp(self.__planetY[finite]))
+        cellSize = extent / np.sqrt(finite.sum()) if extent > 0 else 1.0
+        return SpatialGrid(self.__planetX, self.__planetY, cellSize)
+
     def __planetHover(self, event) -> None:
-        """Handler for hovering on a planet in the plot"""
-        visible = self.__annotate.get_visible()
+        """Handler for hovering on a planet in the plot. Only the overlay is redrawn, and
+        only when the label, trace or highlight changed"""
+        changed = False
 
         if event.inaxes == self.__axes:
-            """Remove previous tradeRouteTrace lines if they exist"""
-            for line in self.__tradeRouteTrace:
-                line.remove()
-
-            """Add tracing lines when drawing Trade Routes"""
-            if self.__tradeRouteTraceStart is not None:
-                startpos = self.__planetsScatter.get_offsets()[
-                    self.__tradeRouteTraceStart
-                ]
-                self.__tradeRouteTrace = self.__axes.plot(
-                    [startpos[0], event.xdata],
-                    [startpos[1], event.ydata],
-                    color="y",
-                    lw=0.8,
-                    ls="--",
+            """Follow the cursor with the tracing line when drawing Trade Routes"""
+            if self.__tradeRouteTraceStart is not None and self.__tradeRouteTrace:
+                start = self.__tradeRouteTraceStart
+                self.__tradeRouteTrace.set_data(
+                    [self.__planetX[start], event.xdata],
+                    [self.__planetY[start], event.ydata],
                 )
-            else:
-                self.__tradeRouteTrace = self.__axes.plot([0, 0], [0, 0])
+                self.__tradeRouteTrace.set_visible(True)
+                changed = True
 
             """Display annotation tooltip if the cursor is over a planet"""
-            if self.__planetsScatter:
-                contains, ind = self.__planetsScatter.contains(event)
-            else:
-                contains = False
-
-            if contains:
-                hovered_planet_index = ind["ind"][0]
+            hovered_planet_index = self.__planetAt(event)
+            if hovered_planet_index is not None:
                 if self.__highlightedPlanetIndex != hovered_planet_index:
                     self.__highlight_connected_trade_routes(hovered_planet_index)
                     self.__highlightedPlanetIndex = hovered_planet_index
-                self.__update_annotation(ind)
-                self.__annotate.set_visible(True)
+                    changed = True
+                if self.__annotatedIndex != hovered_planet_index:
+                    self.__update_annotation(hovered_planet_index)
+                    self.__annotatedIndex = hovered_planet_index
+                    changed = True
+                if not self.__annotate.get_visible():
+                    self.__annotate.set_visible(True)
+                    changed = True
             else:
-                if self.__highlightedPlanetIndex is not None:
-                    self.__reset_trade_route_highlight()
-                    self.__highlightedPlanetIndex = None
-                if visible:
-                    self.__annotate.set_visible(False)
-
-            self.__galacticPlotCanvas.draw_idle()
+                changed = self.__clearHover() or changed
         else:
             if self.__highlightedPlanetIndex is not None:
                 self.__reset_trade_route_highlight()
                 self.__highlightedPlanetIndex = None
-                self.__galacticPlotCanvas.draw_idle()
+                changed = True
+
+        if changed:
+            self.__overlay.update()
+
+    def __clearHover(self) -> bool:
+        """Removes the route highlight and tooltip, returning whether anything was shown"""
+        changed = False
+        if self.__highlightedPlanetIndex is not None:
+            self.__reset_trade_route_highlight()
+            self.__highlightedPlanetIndex = None
+            changed = True
+        if self.__annotate.get_visible():
+            self.__annotate.set_visible(False)
+            self.__annotatedIndex = None
+            changed = True
+        return changed
 
     def __reset_trade_route_highlight(self) -> None:
-        """Restore default styling for all trade routes."""
-        for line in self.__tradeRouteLines:
-            line.set_color("k")
-            line.set_alpha(0.4)
-            line.set_linewidth(1.0)
-            line.set_zorder(1)
+        """Remove the highlight from all trade routes."""
+        if self.__tradeRouteHighlight is None:
+            return
+
+        self.__tradeRouteHighlight.set_segments([])
 
     def __highlight_connected_trade_routes(self, planet_index: int) -> None:
         """Highlight routes connected to the hovered planet."""
-        if planet_index < 0 or planet_index >= len(self.__planetNames):
+        if planet_index < 0 or planet_index >= len(self.__allPlanets):
             self.__reset_trade_route_highlight()
             return
 
-        hovered_planet_name = self.__planetNames[planet_index]
-        for line, (start_name, end_name) in zip(
-            self.__tradeRouteLines, self.__tradeRouteConnections
-        ):
-            is_connected = hovered_planet_name == start_name or hovered_planet_name == end_name
-            line.set_color("gold" if is_connected else "k")
-            line.set_alpha(0.9 if is_connected else 0.1)
-            line.set_linewidth(2.0 if is_connected else 1.0)
-            line.set_zorder(5 if is_connected else 1)
-
-    def __update_annotation(self, ind) -> None:
+        connected = self.__routesByPlanet.get(self.__allPlanets[planet_index], ())
+        rows = [self.__tradeRoutes.rowOf(route) for route in connected]
+        # Connected routes are redrawn in the overlay, the base collection is left as is
+        # so that the cached background stays valid
+        self.__tradeRouteHighlight.set_segments(
+            self.__tradeRoutes.column("segment")[rows].reshape(-1, 2, 2)
+        )
+
+    def __update_annotation(self, planet_index: int) -> None:
         """Updates annotation parameters"""
-        pos = self.__planetsScatter.get_offsets()[ind["ind"][0]]
-        self.__annotate.xy = pos
-        text = "\n".join(
+        self.__annotate.xy = (self.__planetX[planet_index], self.__planetY[planet_index])
+        planet = self.__allPlanets[planet_index]
+        self.__annotate.set_text(
             "Planet: {} \nFaction: {} \nStarbase: {} \nShipyard: {} \nGround Slots: {} \nIncome: {} \nSupports: {}".format(
-                self.__planetNames[n],
-                self.__planetOwners[n],
-                self.__starbaseLevel[n],
-                self.__shipyardLevel[n],
-                self.__groundStructureSlots[n],
-                self.__income[n],
-                self.__SupportsStructure[n],
+                planet.name,
+                self.__planetOwners[planet_index],
+                planet.starbaseLevel,
+                planet.shipyardLevel,
+                planet.groundStructureSlots,
+                planet.income,
+                planet.SupportsStructure,
             )
-            for n in ind["ind"]
         )
-        self.__annotate.set_text(text)
 
     def TraceTradeRoute(self, ind) -> None:
         """Handler for tracing a traderoute between planets on plot"""
         """Trace movement is handled in __planetHover"""
         self.__tradeRouteTraceStart = ind
+        if ind is None and self.__tradeRouteTrace:
+            self.__tradeRouteTrace.set_visible(False)
+            self.__overlay.update()
@@ -0,0 +1,83 @@
+from typing import Optional
+
+import numpy as np
+from PyQt6 import QtCore
+from PyQt6.QtWidgets import QLineEdit
+
+from SearchIndex import SearchIndex
+from ui.qtCheckListModel import CheckListModel
+
+
+class SearchFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Proxy showing the source rows set in a match mask, or every row without a mask"""
+
+    def __init__(self):
+        super().__init__()
+        self.__mask: Optional[np.ndarray] = None
+        # Check state changes never change which rows match
+        self.setDynamicSortFilter(False)
+
+    def setMask(self, mask: Optional[np.ndarray]) -> None:
+        """Filters the rows again with a new mask in one pass"""
+        if mask is None and self.__mask is None:
+            return
+        self.__mask = mask
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        # Rows inserted before the mask is recomputed stay visible until it is
+        if self.__mask is None or sourceRow >= len(self.__mask):
+            return True
+        return bool(self.__mask[sourceRow])
+
+
+class QtListFilter:
+    """Search box that filters a check list to the rows containing the typed text.
+    Views show the filter's proxy model. Typing is debounced and the row names are indexed
+    once per change of the list"""
+
+    DEBOUNCE_MS = 150
+
+    def __init__(self, model: CheckListModel, placeholder: str):
+        self.__model: CheckListModel = model
+        self.__index: Optional[SearchIndex] = None
+        self.__proxy: SearchFilterProxyModel = SearchFilterProxyModel()
+        self.__proxy.setSourceModel(model)
+
+        self.__search: QLineEdit = QLineEdit()
+        self.__search.setPlaceholderText(placeholder)
+
+        self.__timer: QtCore.QTimer = QtCore.QTimer(self.__search)
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(self.DEBOUNCE_MS)
+        self.__timer.timeout.connect(self.apply)
+        self.__search.textChanged.connect(self.__timer.start)
+
+    def getWidget(self) -> QLineEdit:
+        """Returns the search box"""
+        return self.__search
+
+    def getModel(self) -> SearchFilterProxyModel:
+        """Returns the filtered model for a view to show"""
+        return self.__proxy
+
+    def mapToSource(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        """Returns the index in the list model of an index of the filtered model"""
+        return self.__proxy.mapToSource(index)
+
+    def invalidate(self, *args) -> None:
+        """Reindexes the list after its rows changed and filters it again"""
+        self.__index = None
+        self.apply()
+
+    def apply(self) -> None:
+        """Filters the list by the current search text"""
+        self.__timer.stop()
+        text = self.__search.text()
+        if not text:
+            self.__proxy.setMask(None)
+            return
+
+        if self.__index is None:
+            self.__index = SearchIndex(self.__model.names())
+        self.__proxy.setMask(self.__index.matches(text))
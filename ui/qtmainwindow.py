@@ -1,8 +1,6 @@
 from typing import List
 import pandas as pd
 
-import re
-
 from PyQt6 import QtCore
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
@@ -14,18 +12,17 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMenuBar,
     QSplitter,
-    QTableWidget,
     QTableView,
-    QTableWidgetItem,
     QTabWidget,
     QVBoxLayout,
     QWidget,
-    QLineEdit,
     QHBoxLayout,
 )
 
 from ui.mainwindow_presenter import MainWindow, MainWindowPresenter
+from ui.qtCheckListModel import CheckListModel
 from ui.qtgalacticplot import QtGalacticPlot
+from ui.qtlistfilter import QtListFilter
 from ui.qtPandasModel import PandasModel
 from ui.qttablewidgetfactory import QtTableWidgetFactory
 
@@ -35,6 +32,8 @@ from gameObjects.planet import Planet
 class QtMainWindow(MainWindow):
     """Qt based window"""
 
+    WATCH_POLL_INTERVAL_MS = 1000
+
     def __init__(self):
         # Main window setup
         self.__window: QMainWindow = QMainWindow()
@@ -61,9 +60,13 @@ class QtMainWindow(MainWindow):
 
         self.__tableWidgetFactory = QtTableWidgetFactory()
 
-        self.__planetListWidget = self.__tableWidgetFactory.construct(["Planets"])
-        self.__planetListWidget.itemClicked.connect(
-            self.__onPlanetTableWidgetItemClicked
+        self.__planetModel: CheckListModel = CheckListModel("Planets")
+        self.__planetModel.rowChecked.connect(self.__onPlanetRowChecked)
+        self.__planetFilter: QtListFilter = QtListFilter(
+            self.__planetModel, "Filter Planets"
+        )
+        self.__planetListWidget = self.__tableWidgetFactory.constructView(
+            self.__planetFilter.getModel()
         )
         self.__planetListWidget.setContextMenuPolicy(
             QtCore.Qt.ContextMenuPolicy.CustomContextMenu
@@ -72,27 +75,34 @@ class QtMainWindow(MainWindow):
             self.__showPlanetContextMenu
         )
 
-        self.__tradeRouteListWidget = self.__tableWidgetFactory.construct(
-            ["Trade Routes"]
+        self.__tradeRouteModel: CheckListModel = CheckListModel("Trade Routes")
+        self.__tradeRouteModel.rowChecked.connect(self.__onTradeRouteRowChecked)
+        self.__tradeRouteFilter: QtListFilter = QtListFilter(
+            self.__tradeRouteModel, "Filter Trade Routes"
         )
-        self.__tradeRouteListWidget.itemClicked.connect(
-            self.__onTradeRouteTableWidgetItemClicked
+        self.__tradeRouteListWidget = self.__tableWidgetFactory.constructView(
+            self.__tradeRouteFilter.getModel()
         )
 
-        self.__factionListWidget = self.__tableWidgetFactory.construct(
-            ["Playable Factions"]
+        self.__factionModel: CheckListModel = CheckListModel("Playable Factions")
+        self.__factionModel.rowChecked.connect(self.__onFactionRowChecked)
+        self.__factionFilter: QtListFilter = QtListFilter(
+            self.__factionModel, "Filter Factions"
+        )
+        self.__factionListWidget = self.__tableWidgetFactory.constructView(
+            self.__factionFilter.getModel()
         )
 
         self.__selectAllPlanetsButton: QPushButton = QPushButton("Select All Planets")
         self.__selectAllPlanetsButton.clicked.connect(
-            lambda: self.__selectAllPlanetsButtonClicked(self.__planetListWidget, True)
+            lambda: self.__selectAllPlanetsButtonClicked(self.__planetModel, True)
         )
 
         self.__deselectAllPlanetsButton: QPushButton = QPushButton(
             "Deselect All Planets"
         )
         self.__deselectAllPlanetsButton.clicked.connect(
-            lambda: self.__selectAllPlanetsButtonClicked(self.__planetListWidget, False)
+            lambda: self.__selectAllPlanetsButtonClicked(self.__planetModel, False)
         )
 
         self.__selectAllTradeRoutesButton: QPushButton = QPushButton(
@@ -100,7 +110,7 @@ class QtMainWindow(MainWindow):
         )
         self.__selectAllTradeRoutesButton.clicked.connect(
             lambda: self.__selectAllTradeRoutesButtonClicked(
-                self.__tradeRouteListWidget, True
+                self.__tradeRouteModel, True
             )
         )
 
@@ -109,19 +119,13 @@ class QtMainWindow(MainWindow):
         )
         self.__deselectAllTradeRoutesButton.clicked.connect(
             lambda: self.__selectAllTradeRoutesButtonClicked(
-                self.__tradeRouteListWidget, False
+                self.__tradeRouteModel, False
             )
         )
         self.__planetCountLabel: QLabel = QLabel()
 
         self.__planetMaxConnectionsCountLabel: QLabel = QLabel()
 
-        self.__planetSearch: QLineEdit = QLineEdit()
-
-        self.__planetSearch.setPlaceholderText("Filter Planets")
-
-        self.__planetSearch.textChanged.connect(self.filterPlanets)
-
         # Left pane, Forces tab
         self.__planetComboBox: QComboBox = QComboBox()
         self.__planetComboBox.activated.connect(self.__onPlanetSelected)
@@ -135,6 +139,16 @@ class QtMainWindow(MainWindow):
 
         self.__openOptionsAction: QAction = QAction("Configuration options", self.__window)
         self.__openOptionsAction.triggered.connect(self.__showOptionsDialog)
+
+        self.__watchDataFoldersAction: QAction = QAction(
+            "Watch data folders for changes", self.__window
+        )
+        self.__watchDataFoldersAction.setCheckable(True)
+        self.__watchDataFoldersAction.toggled.connect(self.__onWatchDataFoldersToggled)
+
+        self.__watchTimer: QtCore.QTimer = QtCore.QTimer(self.__window)
+        self.__watchTimer.setInterval(self.WATCH_POLL_INTERVAL_MS)
+        self.__watchTimer.timeout.connect(self.__onWatchTimer)
         self.__forcesListTable = QTableView()
         self.__forcesListTable.setSortingEnabled(False)
 
@@ -183,6 +197,7 @@ class QtMainWindow(MainWindow):
 
         self.__optionsMenu.addAction(self.__openAutoConnectionSettingsAction)
         self.__optionsMenu.addAction(self.__openOptionsAction)
+        self.__optionsMenu.addAction(self.__watchDataFoldersAction)
 
         self.__fileMenu.addAction(self.__saveAction)
         self.__fileMenu.addAction(self.__importForcesSaveAction)
@@ -230,9 +245,10 @@ class QtMainWindow(MainWindow):
         self.__planetsTradeRoutes.layout().addWidget(
             self.__planetMaxConnectionsCountLabel
         )
-        self.__planetsTradeRoutes.layout().addWidget(self.__planetSearch)
+        self.__planetsTradeRoutes.layout().addWidget(self.__planetFilter.getWidget())
         self.__planetsTradeRoutes.layout().addWidget(self.__planetListWidget)
         self.__planetsTradeRoutes.layout().addWidget(self.__planetSelectButtons)
+        self.__planetsTradeRoutes.layout().addWidget(self.__tradeRouteFilter.getWidget())
         self.__planetsTradeRoutes.layout().addWidget(self.__tradeRouteListWidget)
         self.__planetsTradeRoutes.layout().addWidget(self.__trSelectButtons)
 
@@ -241,6 +257,7 @@ class QtMainWindow(MainWindow):
         self.__startingForces.layout().addWidget(self.__planetInfoLabel)
         self.__startingForces.layout().addWidget(self.__importStartingForcesButton)
 
+        self.__factions.layout().addWidget(self.__factionFilter.getWidget())
         self.__factions.layout().addWidget(self.__factionListWidget)
         self.__factions.layout().addWidget(self.__totalFactionIncomeLabel)
 
@@ -251,28 +268,39 @@ class QtMainWindow(MainWindow):
         self.__presenter = presenter
 
     def addPlanets(self, planets: List[str]) -> None:
-        """Add Planet objects to the planet table widget"""
-        self.__addEntriesToTableWidget(self.__planetListWidget, planets)
-        self.__planetListWidget.itemClicked.connect(
-            self.__onPlanetTableWidgetItemClicked
-        )
+        """Add Planet objects to the planet table"""
+        self.__planetModel.setNames(planets)
+        self.__planetFilter.invalidate()
 
     def addFactions(self, factions: List[str]) -> None:
-        """Add Faction objects to the faction table widget"""
-        self.__addEntriesToTableWidget(self.__factionListWidget, factions)
-        self.__factionListWidget.itemClicked.connect(
-            self.__onFactionTableWidgetItemClicked
-        )
+        """Add Faction objects to the faction table"""
+        self.__factionModel.setNames(factions)
+        self.__factionFilter.invalidate()
 
     def addTradeRoutes(self, tradeRoutes: List[str]) -> None:
-        """Add TradeRoute objects to the trade route table widget"""
-        self.__addEntriesToTableWidget(self.__tradeRouteListWidget, tradeRoutes)
+        """Add TradeRoute objects to the trade route table"""
+        self.__tradeRouteModel.setNames(tradeRoutes)
+        self.__tradeRouteFilter.invalidate()
 
     def updateTradeRoutes(self, tradeRoutes: List[str]) -> None:
-        """Update TradeRoute trade route table widget"""
-        self.__tradeRouteListWidget.clearContents()
-        self.__tradeRouteListWidget.setRowCount(0)
-        self.__addEntriesToTableWidget(self.__tradeRouteListWidget, tradeRoutes)
+        """Update TradeRoute trade route table"""
+        self.__tradeRouteModel.setNames(tradeRoutes)
+        self.__tradeRouteFilter.invalidate()
+
+    def insertTradeRoutes(self, rows: List[int], tradeRoutes: List[str]) -> None:
+        """Inserts trade routes into the trade route table. Rows are ascending and refer
+        to the table after the insertion"""
+        if not rows:
+            return
+        self.__tradeRouteModel.insertNames(rows, tradeRoutes)
+        self.__tradeRouteFilter.invalidate()
+
+    def removeTradeRoutes(self, rows: List[int]) -> None:
+        """Removes rows from the trade route table"""
+        if not rows:
+            return
+        self.__tradeRouteModel.removeNames(rows)
+        self.__tradeRouteFilter.invalidate()
 
     def addCampaigns(self, campaigns: List[str]) -> None:
         """Add Campaign objects to the campaign combobox widget"""
@@ -291,12 +319,12 @@ class QtMainWindow(MainWindow):
 
     def emptyWidgets(self) -> None:
         """Clears all list and combobox widgets"""
-        self.__planetListWidget.clearContents()
-        self.__planetListWidget.setRowCount(0)
-        self.__tradeRouteListWidget.clearContents()
-        self.__tradeRouteListWidget.setRowCount(0)
-        self.__factionListWidget.clearContents()
-        self.__factionListWidget.setRowCount(0)
+        self.__planetModel.setNames([])
+        self.__tradeRouteModel.setNames([])
+        self.__factionModel.setNames([])
+        self.__planetFilter.invalidate()
+        self.__tradeRouteFilter.invalidate()
+        self.__factionFilter.invalidate()
         self.__campaignComboBox.clear()
 
         self.__planetComboBox.clear()
@@ -334,75 +362,34 @@ class QtMainWindow(MainWindow):
         return self.__planetComboBox.currentText()
 
     def updatePlanetSelection(self, planets: List[int]) -> None:
-        """Clears table, then checks off planets in the table from a list of indexes"""
-        self.__uncheckAllTable(self.__planetListWidget)
-
-        for p in planets:
-            self.__planetListWidget.item(p, 0).setCheckState(
-                QtCore.Qt.CheckState.Checked
-            )
+        """Checks off exactly the planets in the table from a list of indexes"""
+        self.__planetModel.setCheckedRows(planets)
 
     def selectSingleTradeRoute(self, index: int) -> bool:
-        """Checks off trade route in the table for an index"""
-        if (
-            self.__tradeRouteListWidget.item(index, 0).checkState()
-            == QtCore.Qt.CheckState.Checked
-        ):
-            self.__tradeRouteListWidget.item(index, 0).setCheckState(
-                QtCore.Qt.CheckState.Unchecked
-            )
-            return False
-        else:
-            self.__tradeRouteListWidget.item(index, 0).setCheckState(
-                QtCore.Qt.CheckState.Checked
-            )
-            return True
+        """Toggles the trade route in the table for an index and returns whether it is checked"""
+        checked = not self.__tradeRouteModel.isChecked(index)
+        self.__tradeRouteModel.setChecked(index, checked)
+        return checked
 
     def updateTradeRouteSelection(self, tradeRoutes: List[int]) -> None:
-        """Clears table, then checks off trade routes in the table from a list of indexes"""
-        self.__uncheckAllTable(self.__tradeRouteListWidget)
-
-        for t in tradeRoutes:
-            self.__tradeRouteListWidget.item(t, 0).setCheckState(
-                QtCore.Qt.CheckState.Checked
-            )
+        """Checks off exactly the trade routes in the table from a list of indexes"""
+        self.__tradeRouteModel.setCheckedRows(tradeRoutes)
 
     def updateFactionSelection(self, factions: List[int]) -> None:
-        """Clears table, then checks off planets in the table from a list of indexes"""
-        self.__uncheckAllTable(self.__factionListWidget)
-
-        for f in factions:
-            self.__factionListWidget.item(f, 0).setCheckState(
-                QtCore.Qt.CheckState.Checked
-            )
+        """Checks off exactly the factions in the table from a list of indexes"""
+        self.__factionModel.setCheckedRows(factions)
 
     def clearPlanets(self) -> None:
         """Helper function to clear planet selections from the presenter"""
-        self.__uncheckAllTable(self.__planetListWidget)
+        self.__planetModel.setAllChecked(False)
 
     def filterPlanets(self) -> None:
         """Helper function to filter list of planets based on searched string"""
-        if self.__planetSearch.text() == "":
-            for row in range(0, self.__planetListWidget.rowCount()):
-                self.__planetListWidget.setRowHidden(row, False)
-        else:
-            for row in range(0, self.__planetListWidget.rowCount()):
-                for column in range(self.__planetListWidget.columnCount()):
-                    if re.match(
-                        "(.+)?"
-                        + re.sub(r"\s", "_", self.__planetSearch.text())
-                        + "(.+)?",
-                        self.__planetListWidget.item(row, column).text(),
-                        re.IGNORECASE,
-                    ):
-                        self.__planetListWidget.setRowHidden(row, False)
-                        break
-                    else:
-                        self.__planetListWidget.setRowHidden(row, True)
+        self.__planetFilter.apply()
 
     def clearTradeRoutes(self) -> None:
         """Helper function to clear traderoute selections from the presenter"""
-        self.__uncheckAllTable(self.__tradeRouteListWidget)
+        self.__tradeRouteModel.setAllChecked(False)
 
     def updatePlanetCountDisplay(self, planets: List) -> None:
         """Updates count of planets on main window."""
@@ -457,6 +444,7 @@ class QtMainWindow(MainWindow):
                 False,
             )
 
+        model.dataChanged.connect(self.__onForcesEdited)
         self.__forcesListTable.setModel(model)
         self.__forcesListTable.resizeColumnsToContents()
 
@@ -494,28 +482,22 @@ class QtMainWindow(MainWindow):
 
         self.__totalFactionIncomeLabel.setText(text)
 
-    def __addEntriesToTableWidget(
-        self, widget: QTableWidget, entries: List[str]
-    ) -> None:
-        """Adds a list of rows to a table widget with checkboxes"""
-        for entry in entries:
-            rowCount = widget.rowCount()
-            widget.setRowCount(rowCount + 1)
-            item: QTableWidgetItem = QTableWidgetItem(entry)
-            item.setFlags(
-                QtCore.Qt.ItemFlag.ItemIsUserCheckable
-                | QtCore.Qt.ItemFlag.ItemIsEnabled
-            )
-            item.setCheckState(QtCore.Qt.CheckState.Unchecked)
-            widget.setItem(rowCount, 0, item)
+    def __onForcesEdited(self, topLeft, bottomRight, roles=None) -> None:
+        """Tells the presenter which starting forces column was edited"""
+        column = self.__forcesListTable.model().headerData(
+            topLeft.column(),
+            QtCore.Qt.Orientation.Horizontal,
+            QtCore.Qt.ItemDataRole.DisplayRole,
+        )
+        self.__presenter.onStartingForcesEdited(column)
 
-    def __onPlanetTableWidgetItemClicked(self, item: QTableWidgetItem) -> None:
-        """If a planet table widget item is clicked, check it and call the presenter to display it"""
-        self.__presenter.onPlanetChecked(item.row(), self.__isItemChecked(item))
+    def __onPlanetRowChecked(self, row: int, checked: bool) -> None:
+        """If a planet is checked in the table, call the presenter to display it"""
+        self.__presenter.onPlanetChecked(row, checked)
 
-    def __onFactionTableWidgetItemClicked(self, item: QTableWidgetItem) -> None:
-        """If a faction table widget item is clicked, check it and call the presenter to add it to the campaign"""
-        self.__presenter.onFactionChecked(item.row(), self.__isItemChecked(item))
+    def __onFactionRowChecked(self, row: int, checked: bool) -> None:
+        """If a faction is checked in the table, call the presenter to add it to the campaign"""
+        self.__presenter.onFactionChecked(row, checked)
 
     def __showAutoConnectionSettings(self):
         self.__presenter.autoConnectionSettingsCommand.execute()
@@ -523,15 +505,29 @@ class QtMainWindow(MainWindow):
     def __showOptionsDialog(self) -> None:
         self.__presenter.optionsDialogCommand.execute()
 
+    def __onWatchDataFoldersToggled(self, checked: bool) -> None:
+        self.__presenter.setWatchEnabled(checked)
+        if checked:
+            self.__watchTimer.start()
+        else:
+            self.__watchTimer.stop()
+
+    def __onWatchTimer(self) -> None:
+        self.__presenter.onWatchTimer()
+
     def __showPlanetContextMenu(self, position) -> None:
+        index = self.__planetListWidget.indexAt(position)
+        if not index.isValid():
+            return
+        # Rows of the view skip filtered planets, the presenter counts all of them
+        index = self.__planetFilter.mapToSource(index)
         self.__presenter.planetContextMenu.show(
-            self.__planetListWidget.itemAt(position),
-            self.__planetListWidget.mapToGlobal(position),
+            index, self.__planetListWidget.mapToGlobal(position)
         )
 
-    def __onTradeRouteTableWidgetItemClicked(self, item: QTableWidgetItem) -> None:
-        """If a trade route table widget item is clicked, check it and call the presenter to display it"""
-        self.__presenter.onTradeRouteChecked(item.row(), self.__isItemChecked(item))
+    def __onTradeRouteRowChecked(self, row: int, checked: bool) -> None:
+        """If a trade route is checked in the table, call the presenter to display it"""
+        self.__presenter.onTradeRouteChecked(row, checked)
 
     def __newCampaign(self) -> None:
         """Helper function to launch the new campaign dialog"""
@@ -575,17 +571,17 @@ class QtMainWindow(MainWindow):
         self.__window.close()
 
     def __selectAllPlanetsButtonClicked(
-        self, table: QTableWidget, checked: bool
+        self, model: CheckListModel, checked: bool
     ) -> None:
-        """Cycles through a table and checks all the planet entries, then presents them"""
-        self.__setAllRowsChecked(table, checked)
+        """Checks all the planet entries of a table, then presents them"""
+        model.setAllChecked(checked)
         self.__presenter.allPlanetsChecked(checked)
 
     def __selectAllTradeRoutesButtonClicked(
-        self, table: QTableWidget, checked: bool
+        self, model: CheckListModel, checked: bool
     ) -> None:
-        """Cycles through a table and checks all the trade route entries, then presents them"""
-        self.__setAllRowsChecked(table, checked)
+        """Checks all the trade route entries of a table, then presents them"""
+        model.setAllChecked(checked)
         self.__presenter.allTradeRoutesChecked(checked)
 
     def __onCampaignSelected(self, index: int) -> None:
@@ -610,18 +606,6 @@ class QtMainWindow(MainWindow):
         entry = self.__planetComboBox.currentText()
         self.__presenter.onPlanetSelected(entry)
 
-    def __checkAllTable(self, table: QTableWidget) -> None:
-        """Checks all rows in a table widget"""
-        rowCount = table.rowCount()
-        for row in range(rowCount):
-            table.item(row, 0).setCheckState(QtCore.Qt.CheckState.Checked)
-
-    def __uncheckAllTable(self, table: QTableWidget) -> None:
-        """Unchecks all rows in a table widget"""
-        rowCount = table.rowCount()
-        for row in range(rowCount):
-            table.item(row, 0).setCheckState(QtCore.Qt.CheckState.Unchecked)
-
     def __campaignPropertiesButtonClicked(self) -> None:
         """Helper function to launch the campaign properties dialog"""
         self.__executeCampaignPropertiesCommand()
@@ -629,12 +613,3 @@ class QtMainWindow(MainWindow):
     def __executeCampaignPropertiesCommand(self) -> None:
         if self.__presenter is not None:
             self.__presenter.campaignPropertiesCommand.execute()
-
-    def __isItemChecked(self, item: QTableWidgetItem) -> bool:
-        return item.checkState() == QtCore.Qt.CheckState.Checked
-
-    def __setAllRowsChecked(self, table: QTableWidget, checked: bool) -> None:
-        if checked:
-            self.__checkAllTable(table)
-        else:
-            self.__uncheckAllTable(table)
@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QHeaderView, QTableWidget
+from PyQt6.QtCore import QAbstractItemModel
+from PyQt6.QtWidgets import QHeaderView, QTableView, QTableWidget
 
 
 class QtTableWidgetFactory:
@@ -13,18 +14,30 @@ class QtTableWidgetFactory:
         tableWidget.setColumnCount(columns)
         tableWidget.setHorizontalHeaderLabels(label)
 
+        self.__setUpHeaders(tableWidget, stretch)
+        tableWidget.setSortingEnabled(True)
+        return tableWidget
+
+    def constructView(self, model: QAbstractItemModel, stretch=True) -> QTableView:
+        """Constructs a table view of a model. Rows stay in the order of the model, which
+        the presenter keeps sorted"""
+        tableView: QTableView = QTableView()
+        tableView.setModel(model)
+
+        self.__setUpHeaders(tableView, stretch)
+        return tableView
+
+    def __setUpHeaders(self, table: QTableView, stretch: bool) -> None:
         if stretch:
-            tableWidget.horizontalHeader().setSectionResizeMode(
+            table.horizontalHeader().setSectionResizeMode(
                 0, QHeaderView.ResizeMode.Stretch
             )
         else:
-            tableWidget.horizontalHeader().setSectionResizeMode(
+            table.horizontalHeader().setSectionResizeMode(
                 0, QHeaderView.ResizeMode.ResizeToContents
             )
-            tableWidget.horizontalHeader().setSectionResizeMode(
+            table.horizontalHeader().setSectionResizeMode(
                 1, QHeaderView.ResizeMode.Stretch
             )
 
-        tableWidget.verticalHeader().setVisible(False)
-        tableWidget.setSortingEnabled(True)
-        return tableWidget
+        table.verticalHeader().setVisible(False)
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, Set
+
+from PyQt6 import QtCore
+
+
+class RefreshScheduler:
+    """Runs the refreshes of derived views at most once per pass of the event loop.
+    Edits mark the refreshes they invalidate, and the marked ones run together on the next
+    pass in the order they were registered, so a refresh may rely on the ones before it"""
+
+    def __init__(self):
+        self.__refreshes: Dict[str, Callable[[], None]] = dict()
+        self.__dirty: Set[str] = set()
+        self.__batchDepth: int = 0
+
+        self.__timer: QtCore.QTimer = QtCore.QTimer()
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(0)
+        self.__timer.timeout.connect(self.flush)
+
+    def register(self, name: str, refresh: Callable[[], None]) -> None:
+        """Adds a refresh, which runs after every refresh registered before it"""
+        self.__refreshes[name] = refresh
+
+    def markDirty(self, *names: str) -> None:
+        """Schedules the named refreshes for the next pass of the event loop"""
+        self.__dirty.update(names)
+        if self.__batchDepth == 0:
+            self.__timer.start()
+
+    def isPending(self) -> bool:
+        return bool(self.__dirty)
+
+    def flush(self, *names: str) -> None:
+        """Runs the marked refreshes now, or only the named ones if they are marked.
+        Refreshes marked while flushing run in the same flush if they come later in the order"""
+        self.__timer.stop()
+        for name, refresh in self.__refreshes.items():
+            if name in self.__dirty and (not names or name in names):
+                self.__dirty.remove(name)
+                refresh()
+
+        if not self.__dirty:
+            self.__timer.stop()
+        elif self.__batchDepth == 0:
+            self.__timer.start()
+
+    @contextmanager
+    def batch(self):
+        """Holds back the refreshes marked inside the block and runs them once when the
+        outermost block exits"""
+        self.__batchDepth += 1
+        try:
+            yield
+        finally:
+            self.__batchDepth -= 1
+            if self.__batchDepth == 0:
+                self.flush()
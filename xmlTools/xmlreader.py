@@ -1,9 +1,11 @@
 import lxml.etree as et
+import os
 import os.path
-from gameObjects.planet import Planet
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from xmlTools.xmlstructure import XMLStructure
 
-from util import getObject, commaSepListParser, commaReplaceInList
+from util import commaSepListParser, commaReplaceInList
 
 """ XML with etree:
 
@@ -27,20 +29,93 @@ The Tree is serialized and can be manipulated in memory.
 """
 
 
+PREFILTER_CHUNK_SIZE = 1 << 20
+
+
+def fileMayContainTag(XMLFile: str, XMLTag: str) -> bool:
+    """Scans the raw bytes of a file for an opening XMLTag without building a tree.
+    May report tags that only appear in comments or nested elements, but never misses one,
+    so it is only used to skip files that certainly do not contain the tag"""
+    pattern = re.compile(b"<" + re.escape(XMLTag.encode("ascii")) + rb"[\s/>]")
+    overlap = len(XMLTag) + 2
+
+    with open(XMLFile, "rb") as file:
+        chunk = file.read(PREFILTER_CHUNK_SIZE)
+        # UTF-16 files can not be scanned byte-wise, let the parser decide
+        if chunk.startswith((b"\xff\xfe", b"\xfe\xff")):
+            return True
+
+        tail = b""
+        while chunk:
+            if pattern.search(tail + chunk):
+                return True
+            tail = chunk[-overlap:]
+            chunk = file.read(PREFILTER_CHUNK_SIZE)
+
+    return False
+
+
+def parseXMLFile(XMLFile: str):
+    """Parses a single XML file and returns its tree"""
+    return et.parse(XMLFile)
+
+
+def parsePlanetFile(XMLFile: str):
+    """Parses a GameObject file and returns its tree, or None if it has no Planet tag"""
+    if not fileMayContainTag(XMLFile, "Planet"):
+        return None
+
+    fileTree = et.parse(XMLFile)
+    if fileTree.find("Planet") is None:
+        return None
+    return fileTree
+
+
+def extractPlanetRecords(XMLFile: str):
+    """Returns the planet records of a GameObject file, or None if it has no Planet tag.
+    Defined at module level so it can run in a worker process"""
+    if not fileMayContainTag(XMLFile, "Planet"):
+        return None
+    return XMLReader(workers=1).getPlanetInfoFromFile(XMLFile)
+
+
+def extractTradeRouteRecords(XMLFile: str) -> list:
+    """Parses a TradeRoute file and returns its trade route records.
+    Defined at module level so it can run in a worker process"""
+    return XMLReader(workers=1).getTradeRouteInfo(et.parse(XMLFile).getroot())
+
+
+def extractFactionRecords(XMLFile: str) -> list:
+    """Parses a Faction file and returns its faction records.
+    Defined at module level so it can run in a worker process"""
+    return XMLReader(workers=1).getFactionInfo(et.parse(XMLFile).getroot())
+
+
 class XMLReader:
     """Provides XML read functions"""
 
-    def __init__(self):
-        pass
+    def __init__(self, workers: int = 0, useProcesses: bool = False):
+        """workers sets the size of the parsing pool: 0 uses one worker per CPU, 1 parses serially.
+        useProcesses runs record extraction in a process pool instead of threads"""
+        self.workers: int = workers if workers > 0 else (os.cpu_count() or 1)
+        self.useProcesses: bool = useProcesses
 
     """ General XML file parsing """
 
+    def _mapFiles(self, function, XMLFileList: list, useProcesses: bool = False) -> list:
+        """Applies function to every file in XMLFileList using the parsing pool.
+        Results are returned in the same order as XMLFileList.
+        Threads are used unless useProcesses is set, as lxml releases the GIL while parsing"""
+        if self.workers <= 1 or len(XMLFileList) <= 1:
+            return [function(XMLFile) for XMLFile in XMLFileList]
+
+        executorClass = ProcessPoolExecutor if useProcesses else ThreadPoolExecutor
+        with executorClass(max_workers=min(self.workers, len(XMLFileList))) as executor:
+            return list(executor.map(function, XMLFileList))
+
     def parseXMLFileList(self, XMLFileList: list) -> list:
         """Parses a list of XML files and returns their roots as a list"""
-        rootList = []
-        for XMLFile in XMLFileList:
-            rootList.append(et.parse(XMLFile).getroot())
-        return rootList
+        return [tree.getroot() for tree in self._mapFiles(parseXMLFile, XMLFileList)]
 
     def hasTag(self, XMLRoot, XMLTag: str) -> bool:
         """Checks if a given tag is present in a given XML root"""
@@ -113,111 +188,108 @@ class XMLReader:
                             entries.append(entry)
         return entries
 
-    def findPlanetsFiles(self, gameObjectFile: str, dataFolders: list = None) -> list:
-        """Searches GameObjectFiles for all XML files with the Planet tag.
-        Returns a list of their XML roots"""
+    def _findMetaFileRefPaths(self, metaFile: str, dataFolders: list = None):
+        """Resolves the files referenced in a metafile to [(fileName, filePath), ...],
+        skipping files that do not exist. With dataFolders, entries are merged across all
+        folders and each file is taken from the highest-priority folder that contains it.
+        Returns None if metaFile is not a metafile"""
         if dataFolders:
-            metaFileName = os.path.basename(gameObjectFile)
+            metaFileName = os.path.basename(metaFile)
             fileList = self._collectMetaFileEntries(metaFileName, dataFolders)
-            planetsFiles = []
-            for file in fileList:
-                filePath = self._findFileAcrossFolders(file, dataFolders)
-                if filePath is None:
-                    print(file + " not found. Continuing")
-                    continue
-                fileRoot = et.parse(filePath)
-                if self.hasTag(fileRoot, "Planet"):
-                    planetsFiles.append(fileRoot.getroot())
-            return planetsFiles
+            candidates = [
+                (file, self._findFileAcrossFolders(file, dataFolders)) for file in fileList
+            ]
         else:
-            metaRoot = et.parse(gameObjectFile).getroot()
-            if self.isMetaFile(metaRoot):
-                fileList = self.parseMetaFile(metaRoot)
-                planetsFiles = []
+            metaRoot = et.parse(metaFile).getroot()
+            if not self.isMetaFile(metaRoot):
+                return None
 
-                for file in fileList:
-                    if not os.path.isfile(XMLStructure.dataFolder + "/XML/" + file):
-                        print(file + " not found. Continuing")
-                        continue
+            candidates = []
+            for file in self.parseMetaFile(metaRoot):
+                filePath = XMLStructure.dataFolder + "/XML/" + file
+                candidates.append((file, filePath if os.path.isfile(filePath) else None))
 
-                    fileRoot = et.parse(XMLStructure.dataFolder + "/XML/" + file)
-                    if self.hasTag(fileRoot, "Planet"):
-                        planetsFiles.append(fileRoot.getroot())
+        filePaths = []
+        for file, filePath in candidates:
+            if filePath is None:
+                print(file + " not found. Continuing")
+                continue
+            filePaths.append((file, filePath))
+        return filePaths
 
-                return planetsFiles
+    def findPlanetsFiles(self, gameObjectFile: str, dataFolders: list = None) -> list:
+        """Searches GameObjectFiles for all XML files with the Planet tag.
+        Returns a list of their XML roots"""
+        filePaths = self._findMetaFileRefPaths(gameObjectFile, dataFolders)
+        if filePaths is None:
+            print("Not a meta file! findPlanetsFiles")
+            return None
 
-            else:
-                print("Not a meta file! findPlanetsFiles")
+        fileTrees = self._mapFiles(parsePlanetFile, [path for _, path in filePaths])
+        return [tree.getroot() for tree in fileTrees if tree is not None]
 
     def findPlanetFilesAndRoots(self, gameObjectFile: str) -> list:
         """Searches GameObjectFiles for all XML files with the Planet tag.
         Returns a dictionary of file names and their XML roots"""
-        metaRoot = et.parse(gameObjectFile).getroot()
-        if self.isMetaFile(metaRoot):
-            fileList = self.parseMetaFile(metaRoot)
-            planetsFiles = {}
-
-            for file in fileList:
-                if not os.path.isfile(XMLStructure.dataFolder + "/XML/" + file):
-                    print(file + " not found. Continuing")
-                    continue
-
-                fileRoot = et.parse(XMLStructure.dataFolder + "/XML/" + file)
-                if self.hasTag(fileRoot, "Planet"):
-                    planetsFiles[file] = fileRoot
+        filePaths = self._findMetaFileRefPaths(gameObjectFile)
+        if filePaths is None:
+            print("Not a meta file! findPlanetsFiles")
+            return None
 
-            return planetsFiles
+        fileTrees = self._mapFiles(parsePlanetFile, [path for _, path in filePaths])
+        planetsFiles = {}
+        for (file, _), fileTree in zip(filePaths, fileTrees):
+            if fileTree is not None:
+                planetsFiles[file] = fileTree
 
-        else:
-            print("Not a meta file! findPlanetsFiles")
+        return planetsFiles
 
     def findMetaFileRefs(self, metaFile: str, dataFolders: list = None) -> list:
         """Searches a metafile and returns a list of XML roots that are referenced in the metafile"""
-        if dataFolders:
-            metaFileName = os.path.basename(metaFile)
-            fileList = self._collectMetaFileEntries(metaFileName, dataFolders)
-            metaFileRefs = []
-            for file in fileList:
-                filePath = self._findFileAcrossFolders(file, dataFolders)
-                if filePath is None:
-                    print(file + " not found. Continuing")
-                    continue
-                fileRoot = et.parse(filePath)
-                metaFileRefs.append(fileRoot.getroot())
-            return metaFileRefs
-        else:
-            metaRoot = et.parse(metaFile).getroot()
-            if self.isMetaFile(metaRoot):
-                fileList = self.parseMetaFile(metaRoot)
-                metaFileRefs = []
+        filePaths = self._findMetaFileRefPaths(metaFile, dataFolders)
+        if filePaths is None:
+            print("Not a meta file! findMetaFileRefs")
+            return None
 
-                for file in fileList:
-                    if not os.path.isfile(XMLStructure.dataFolder + "/XML/" + file):
-                        print(file + " not found. Continuing")
-                        continue
-
-                    fileRoot = et.parse(XMLStructure.dataFolder + "/XML/" + file)
-                    metaFileRefs.append(fileRoot.getroot())
-
-                return metaFileRefs
-
-            else:
-                print("Not a meta file! findMetaFileRefs")
+        return self.parseXMLFileList([path for _, path in filePaths])
 
     def findMetaFileRefsWithPaths(self, metaFile: str, dataFolders: list) -> list:
         """Like findMetaFileRefs but returns [(filePath, root), ...] so callers can
         track the source file for each root."""
-        metaFileName = os.path.basename(metaFile)
-        fileList = self._collectMetaFileEntries(metaFileName, dataFolders)
-        result = []
-        for file in fileList:
-            filePath = self._findFileAcrossFolders(file, dataFolders)
-            if filePath is None:
-                print(file + " not found. Continuing")
-                continue
-            fileRoot = et.parse(filePath)
-            result.append((filePath, fileRoot.getroot()))
-        return result
+        filePaths = [path for _, path in self._findMetaFileRefPaths(metaFile, dataFolders)]
+        return list(zip(filePaths, self.parseXMLFileList(filePaths)))
+
+    def findMetaFilePaths(self, metaFile: str, dataFolders: list = None) -> list:
+        """Returns the paths of the existing files referenced in a metafile, in metafile order"""
+        filePaths = self._findMetaFileRefPaths(metaFile, dataFolders)
+        if filePaths is None:
+            print("Not a meta file! findMetaFilePaths")
+            return []
+
+        return [path for _, path in filePaths]
+
+    def findFileRecords(self, XMLFileList: list, extractor) -> list:
+        """Runs extractor over every file in XMLFileList and returns [(filePath, records), ...]
+        in the same order. extractor takes a file path and returns picklable records,
+        or None to skip the file, so it can run in worker processes"""
+        records = self._mapFiles(extractor, XMLFileList, self.useProcesses)
+        return [
+            (path, fileRecords)
+            for path, fileRecords in zip(XMLFileList, records)
+            if fileRecords is not None
+        ]
+
+    def findMetaFileRecords(self, metaFile: str, extractor, dataFolders: list = None) -> list:
+        """Runs extractor over every file referenced in a metafile and returns
+        [(filePath, records), ...] in metafile order"""
+        return self.findFileRecords(
+            self.findMetaFilePaths(metaFile, dataFolders), extractor
+        )
+
+    def findPlanetRecords(self, gameObjectFile: str, dataFolders: list = None) -> list:
+        """Searches GameObjectFiles for all XML files with the Planet tag.
+        Returns [(filePath, planetRecords), ...] as produced by getPlanetInfo"""
+        return self.findMetaFileRecords(gameObjectFile, extractPlanetRecords, dataFolders)
 
     def stringToBool(self, string):
         return string.lower() in ("yes", "true")
@@ -298,78 +370,97 @@ class XMLReader:
         planets = []
 
         for element in XMLRoot:
-            name = element.get("Name")
-            if name is None:
-                continue
-
-            variant_el = element.find(".//Variant_Of_Existing_Type")
-            variant_of = variant_el.text if variant_el is not None else ""
-
-            pos_el = element.find(".//Galactic_Position")
-            if pos_el is not None and pos_el.text is not None:
-                parts = commaSepListParser(pos_el.text)
-                if len(parts) == 3:
-                    coordinates = (float(parts[0]), float(parts[1]))
-                else:
-                    print("Planet " + name + " has no proper XYZ location set!")
-                    coordinates = None
-            else:
-                coordinates = None
-
-            def _prop(tag):
-                el = element.find(tag)
-                if el is None:
-                    return "0"
-                return el.text if el.text is not None else "0"
-
-            planets.append({
-                "name": name,
-                "variant_of": variant_of,
-                "coordinates": coordinates,
-                "starbase_level": _prop(".//Max_Space_Base"),
-                "shipyard": _prop(".//Planet_Ability_Name"),
-                "structure": _prop(".//Encyclopedia_Weather_Name"),
-                "space_slots": _prop(".//Special_Structures_Space"),
-                "ground_slots": _prop(".//Special_Structures_Land"),
-                "income": _prop(".//Planet_Credit_Value"),
-            })
+            record = self._getPlanetRecord(element)
+            if record is not None:
+                planets.append(record)
 
         return planets
 
-    def getStartEnd(self, name: str, planetList: set, tradeRouteRoot) -> tuple[Planet, Planet]:
-        """Gets and validates start/end planets for a trade route by name."""
-        for element in tradeRouteRoot.iter():
-            route_name = element.get("Name")
-            if route_name is None or route_name.lower() != name.lower():
+    def getPlanetInfoFromFile(self, XMLFile: str):
+        """Streaming version of getPlanetInfo that reads a file one top-level element
+        at a time and discards each element once its record is extracted, so peak memory
+        does not grow with the file. Returns None if the file has no Planet tag"""
+        planets = []
+        hasPlanet = False
+
+        for _, element in et.iterparse(XMLFile, events=("end",)):
+            parent = element.getparent()
+            if parent is None or parent.getparent() is not None:
                 continue
 
-            point_a = element.find("Point_A")
-            point_b = element.find("Point_B")
+            hasPlanet = hasPlanet or element.tag == "Planet"
+            record = self._getPlanetRecord(element)
+            if record is not None:
+                planets.append(record)
 
-            if point_a is None or point_a.text is None or not point_a.text.strip():
-                raise ValueError(f"TradeRoute {name} is missing Point_A")
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
 
-            if point_b is None or point_b.text is None or not point_b.text.strip():
-                raise ValueError(f"TradeRoute {name} is missing Point_B")
+        return planets if hasPlanet else None
 
-            start_name = point_a.text.strip()
-            end_name = point_b.text.strip()
+    def _getPlanetRecord(self, element):
+        """Extracts the planet fields of a single named element, or None if it has no Name"""
+        name = element.get("Name")
+        if name is None:
+            return None
 
-            start_planet = getObject(start_name, planetList)
-            if start_planet is None:
-                raise ValueError(
-                    f"TradeRoute {name} references unknown start planet '{start_name}'"
-                )
+        variant_el = element.find(".//Variant_Of_Existing_Type")
+        variant_of = variant_el.text if variant_el is not None else ""
 
-            end_planet = getObject(end_name, planetList)
-            if end_planet is None:
-                raise ValueError(
-                    f"TradeRoute {name} references unknown end planet '{end_name}'"
-                )
+        pos_el = element.find(".//Galactic_Position")
+        if pos_el is not None and pos_el.text is not None:
+            parts = commaSepListParser(pos_el.text)
+            if len(parts) == 3:
+                coordinates = (float(parts[0]), float(parts[1]))
+            else:
+                print("Planet " + name + " has no proper XYZ location set!")
+                coordinates = None
+        else:
+            coordinates = None
+
+        def _prop(tag):
+            el = element.find(tag)
+            if el is None:
+                return "0"
+            return el.text if el.text is not None else "0"
+
+        return {
+            "name": name,
+            "variant_of": variant_of,
+            "coordinates": coordinates,
+            "starbase_level": _prop(".//Max_Space_Base"),
+            "shipyard": _prop(".//Planet_Ability_Name"),
+            "structure": _prop(".//Encyclopedia_Weather_Name"),
+            "space_slots": _prop(".//Special_Structures_Space"),
+            "ground_slots": _prop(".//Special_Structures_Land"),
+            "income": _prop(".//Planet_Credit_Value"),
+        }
+
+    def getTradeRouteInfo(self, XMLRoot) -> list:
+        """Iterates XMLRoot once, extracting the endpoints of every trade route.
+        Returns a list of dicts with keys: name, point_a, point_b.
+        Endpoints are stripped planet names, or None if the tag is missing or empty."""
+        tradeRoutes = []
+
+        def _point(element, tag):
+            el = element.find(tag)
+            if el is None or el.text is None or not el.text.strip():
+                return None
+            return el.text.strip()
+
+        for element in XMLRoot:
+            name = element.get("Name")
+            if name is None:
+                continue
 
-            return start_planet, end_planet
+            tradeRoutes.append({
+                "name": name,
+                "point_a": _point(element, "Point_A"),
+                "point_b": _point(element, "Point_B"),
+            })
 
-        raise ValueError(f"TradeRoute {name} not found! getStartEnd")
+        return tradeRoutes
 
     def getLocation(self, name: str, XMLRoot) -> tuple[float, float]:
         """Gets the galactic position tag value for an object of name in root XMLRoot and returns x, y"""
@@ -1,5 +1,6 @@
 import lxml.etree as et
 import os
+from collections import Counter
 from typing import Optional
 from xmlTools.xmlstructure import XMLStructure
 
@@ -28,6 +29,9 @@ class XMLWriter:
 
         filtered_starting_forces = campaign.startingForces[era_limiter]
 
+        # Forces are written once per campaign planet with a matching name
+        planetCounts = Counter(planet.name.upper() for planet in campaign.planets)
+
         for playableFaction in sorted(
             campaign.playableFactions, key=lambda faction: faction.name
         ):
@@ -157,26 +161,25 @@ class XMLWriter:
                         + ", "
                         + str(row.ObjectType)
                     )
-                    for planet in campaign.planets:
-                        if planet.name.upper() == row.Planet.upper():
-                            self.subElementText(
-                                campaignElement, "Starting_Forces", entry
-                            )
-                            if campaign.useDefaultForces:
-                                if not dummy:
-                                    entry = (
-                                        str(row.Owner)
-                                        + ", "
-                                        + str(row.Planet)
-                                        + ", "
-                                        + "Era_"
-                                        + num2words[campaign.eraStart]
-                                        + "_Dummy"
-                                    )
-                                    dummy = True
-                                    self.subElementText(
-                                        campaignElement, "Starting_Forces", entry
-                                    )
+                    for _ in range(planetCounts.get(row.Planet.upper(), 0)):
+                        self.subElementText(
+                            campaignElement, "Starting_Forces", entry
+                        )
+                        if campaign.useDefaultForces:
+                            if not dummy:
+                                entry = (
+                                    str(row.Owner)
+                                    + ", "
+                                    + str(row.Planet)
+                                    + ", "
+                                    + "Era_"
+                                    + num2words[campaign.eraStart]
+                                    + "_Dummy"
+                                )
+                                dummy = True
+                                self.subElementText(
+                                    campaignElement, "Starting_Forces", entry
+                                )
 
         tree = et.ElementTree(self.root)
         self.writer(tree, outputName=outputName)